@@ -17,6 +17,15 @@ setuptools.setup(
     project_urls={"Bug Tracker": info.__bug_tracker__},
     license=info.__license__,
     install_requires=["requests>=2.32.3", "httpx>=0.27.2"],
+    extras_require={
+        "http2": ["httpx[http2]>=0.27.2"],
+        "arrow": ["pyarrow>=12.0"],
+        "pandas": ["pandas>=1.5", "pyarrow>=12.0"],
+        "numpy": ["numpy>=1.23"],
+        "zstd": ["zstandard>=0.18"],
+        "brotli": ["brotli>=1.0"],
+        "otel": ["opentelemetry-api>=1.20"],
+    },
     packages=["xsellco_api", "xsellco_api.api", "xsellco_api.sync", "xsellco_api.async_", "xsellco_api.common"],
     python_requires=">=3.9",
     keywords="xsellco, repricer",
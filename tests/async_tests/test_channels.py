@@ -0,0 +1,55 @@
+import pytest
+
+from xsellco_api.async_.asyncchannels import AsyncChannels
+from xsellco_api.common.cache import ResponseCache
+
+
+@pytest.mark.asyncio
+async def test_aiter_channels(httpx_mock):
+    httpx_mock.add_response(
+        method="GET",
+        url="https://api.xsellco.com/v1/channels?page_limit=2&page=1",
+        json={"data": [{"id": 1}, {"id": 2}]},
+    )
+    httpx_mock.add_response(
+        method="GET", url="https://api.xsellco.com/v1/channels?page_limit=2&page=2", json={"data": []}
+    )
+
+    async with AsyncChannels("username", "password") as channels:
+        assert [channel async for channel in channels.aiter_channels(page_limit=2)] == [{"id": 1}, {"id": 2}]
+
+
+@pytest.mark.asyncio
+async def test_get_all_channels(httpx_mock):
+    for page in range(1, 4):
+        httpx_mock.add_response(
+            method="GET",
+            url=f"https://api.xsellco.com/v1/channels?page_limit=1&page={page}",
+            json={"data": [{"id": page}], "last_page": 3},
+        )
+
+    async with AsyncChannels("username", "password") as channels:
+        assert await channels.get_all_channels(page_limit=1, concurrency=2) == [{"id": 1}, {"id": 2}, {"id": 3}]
+
+
+@pytest.mark.asyncio
+async def test_get_channel_cached(httpx_mock):
+    httpx_mock.add_response(method="GET", url="https://api.xsellco.com/v1/channels/1", json={"id": 1})
+
+    cache = ResponseCache()
+    async with AsyncChannels("username", "password", cache=cache) as channels:
+        assert await channels.get_channel(1) == {"id": 1}
+        assert await channels.get_channel(1) == {"id": 1}
+    assert cache.hits == 1
+
+
+@pytest.mark.asyncio
+async def test_get_channels_by_ids(httpx_mock):
+    httpx_mock.add_response(method="GET", url="https://api.xsellco.com/v1/channels/1", json={"id": 1})
+    httpx_mock.add_response(method="GET", url="https://api.xsellco.com/v1/channels/2", json={"id": 2})
+
+    async with AsyncChannels("username", "password") as channels:
+        result = await channels.get_channels_by_ids([2, 1, 2])
+
+    assert result.results == {2: {"id": 2}, 1: {"id": 1}}
+    assert result.errors == {}
@@ -2,6 +2,7 @@ import httpx
 import pytest
 
 from xsellco_api.async_.client import AsyncClient
+from xsellco_api.common.retry import RetryPolicy
 from xsellco_api.exceptions import XsellcoAPIError
 
 
@@ -43,3 +44,46 @@ async def test_async_client_request_exception(httpx_mock):
     async_client = AsyncClient("username", "password")
     with pytest.raises(XsellcoAPIError):
         await async_client._request("GET", "test")
+
+
+@pytest.mark.asyncio
+async def test_async_client_request_retries(httpx_mock, mocker):
+    sleep = mocker.patch("xsellco_api.async_.client.asyncio.sleep")
+    httpx_mock.add_response(method="GET", url="https://api.xsellco.com/v1/test", status_code=503)
+    httpx_mock.add_response(method="GET", url="https://api.xsellco.com/v1/test", json={"ok": True})
+
+    async with AsyncClient("username", "password", retry=RetryPolicy(backoff_factor=1, jitter=False)) as client:
+        response = await client._request("GET", "test")
+    assert response.json() == {"ok": True}
+    sleep.assert_awaited_once_with(1)
+
+
+@pytest.mark.asyncio
+async def test_async_client_stream_retries(httpx_mock, mocker):
+    mocker.patch("xsellco_api.async_.client.asyncio.sleep")
+    httpx_mock.add_response(method="GET", url="https://api.xsellco.com/v1/test", status_code=429)
+    httpx_mock.add_response(method="GET", url="https://api.xsellco.com/v1/test", text="ok")
+
+    async with AsyncClient("username", "password") as client:
+        async with client._stream("GET", "test") as response:
+            assert await response.aread() == b"ok"
+
+
+@pytest.mark.asyncio
+async def test_async_client_hooks(httpx_mock, mocker):
+    mocker.patch("xsellco_api.async_.client.asyncio.sleep")
+    httpx_mock.add_response(method="GET", url="https://api.xsellco.com/v1/test", status_code=429)
+    httpx_mock.add_response(method="GET", url="https://api.xsellco.com/v1/test", text="ok")
+    httpx_mock.add_response(method="GET", url="https://api.xsellco.com/v1/other", status_code=404)
+    events = []
+
+    async with AsyncClient("username", "password", hooks=[events.append]) as client:
+        async with client._stream("GET", "test") as response:
+            await response.aread()
+        with pytest.raises(XsellcoAPIError):
+            await client._request("GET", "other")
+
+    assert [(event.endpoint, event.status, event.retries, event.response_bytes) for event in events] == [
+        ("test", 200, 1, 2),
+        ("other", 404, 0, 0),
+    ]
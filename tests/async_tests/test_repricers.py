@@ -1,6 +1,16 @@
+import gzip
+import hashlib
+from io import BytesIO
+
+import httpx
 import pytest
 
 from xsellco_api.async_.asyncrepricers import AsyncRepricers
+from xsellco_api.common.report import RepricerReport
+from xsellco_api.common.report_cache import ReportCache
+from xsellco_api.common.snapshot import ReportSnapshotStore
+from xsellco_api.common.validation import ReportValidator
+from xsellco_api.exceptions import XsellcoServerError, XsellcoValidationError
 
 
 @pytest.mark.asyncio
@@ -13,6 +23,34 @@ async def test_get_report(httpx_mock):
         assert report == [{"sku": "123", "price": "10"}]
 
 
+@pytest.mark.asyncio
+async def test_get_report_columnar(httpx_mock):
+    httpx_mock.add_response(method="GET", url="https://api.repricer.com/v1/repricers", text="sku,price\n123,10")
+
+    async with AsyncRepricers("user", "pass") as repricers:
+        report = await repricers.get_report(format="report")
+        assert isinstance(report, RepricerReport)
+        assert report.to_dicts() == [{"sku": "123", "price": "10"}]
+
+
+@pytest.mark.asyncio
+async def test_aiter_report(httpx_mock):
+    httpx_mock.add_response(method="GET", url="https://api.repricer.com/v1/repricers", text="sku,price\n1,10\n2,20\n")
+
+    async with AsyncRepricers("user", "pass") as repricers:
+        rows = [row async for row in repricers.aiter_report()]
+        assert rows == [{"sku": "1", "price": "10"}, {"sku": "2", "price": "20"}]
+
+
+@pytest.mark.asyncio
+async def test_aiter_report_error(httpx_mock):
+    httpx_mock.add_response(method="GET", url="https://api.repricer.com/v1/repricers", status_code=500)
+
+    async with AsyncRepricers("user", "pass", retry=None) as repricers:
+        with pytest.raises(XsellcoServerError):
+            [row async for row in repricers.aiter_report()]
+
+
 @pytest.mark.asyncio
 async def test_upload_report_success(httpx_mock):
     # Mock the response for successful upload
@@ -25,6 +63,23 @@ async def test_upload_report_success(httpx_mock):
         assert response == {"status": "success"}
 
 
+@pytest.mark.asyncio
+async def test_upload_report_async_iterable(httpx_mock):
+    httpx_mock.add_response(method="POST", url="https://api.repricer.com/v1/repricers", json={"status": "success"})
+
+    async def rows():
+        for i in range(3):
+            yield {"sku": str(i), "marketplace": "Amazon", "merchant_id": "1", "fba": "yes"}
+
+    async with AsyncRepricers("user", "pass") as repricers:
+        response = await repricers.upload_report(data=rows())
+        assert response == {"status": "success"}
+
+    assert await httpx_mock.get_request().aread() == (
+        b"sku,marketplace,merchant_id,fba\n0,Amazon,1,yes\n1,Amazon,1,yes\n2,Amazon,1,yes\n"
+    )
+
+
 @pytest.mark.asyncio
 async def test_upload_report_missing_headers():
     async with AsyncRepricers("user", "pass") as repricers:
@@ -57,3 +112,148 @@ async def test_upload_report_file_path(httpx_mock, tmp_path):
     async with AsyncRepricers("user", "pass") as repricers:
         response = await repricers.upload_report(file_path=file_path)
         assert response == {"status": "success"}
+
+
+@pytest.mark.asyncio
+async def test_upload_report_file_path_streams_content(httpx_mock, tmp_path):
+    file_path = tmp_path / "report.csv"
+    content = b"sku,price\n" + b"".join(b"%d,10\n" % i for i in range(50_000))
+    file_path.write_bytes(content)
+    httpx_mock.add_response(method="POST", url="https://api.repricer.com/v1/repricers", json={"status": "success"})
+
+    async with AsyncRepricers("user", "pass") as repricers:
+        await repricers.upload_report(file_path=file_path)
+
+    request = httpx_mock.get_request()
+    assert request.headers["content-length"] == str(len(content))
+    assert await request.aread() == content
+
+
+@pytest.mark.asyncio
+async def test_upload_report_with_baseline(httpx_mock):
+    httpx_mock.add_response(method="POST", url="https://api.repricer.com/v1/repricers", json={"status": "success"})
+    baseline = [{"sku": "1", "marketplace": "Amazon", "merchant_id": "1", "fba": "yes", "price_min": "10"}]
+
+    async def rows():
+        yield dict(baseline[0])
+        yield {"sku": "2", "marketplace": "Amazon", "merchant_id": "1", "fba": "yes", "price_min": "20"}
+
+    async with AsyncRepricers("user", "pass") as repricers:
+        assert await repricers.upload_report(data=rows(), baseline=baseline) == {"status": "success"}
+
+    assert await httpx_mock.get_request().aread() == b"sku,marketplace,merchant_id,fba,price_min\n2,Amazon,1,yes,20\n"
+
+
+@pytest.mark.asyncio
+async def test_snapshot_report(httpx_mock, tmp_path):
+    csv_content = "sku,marketplace,merchant_id,fba,price\nA,amazon,M1,0,10\nB,amazon,M1,1,20\n"
+    httpx_mock.add_response(method="GET", url="https://api.repricer.com/v1/repricers", content=csv_content)
+    store = ReportSnapshotStore(tmp_path / "snapshots.sqlite3")
+    repricer = AsyncRepricers("username", "password")
+
+    snapshot = await repricer.snapshot_report(store, max_age=60)
+
+    assert await repricer.snapshot_report(store, max_age=60) == snapshot
+    assert snapshot.row_count == 2
+    assert [row["sku"] for row in store.scan(repricer.snapshot_account)] == ["A", "B"]
+    assert len(httpx_mock.get_requests()) == 1
+
+
+@pytest.mark.asyncio
+async def test_upload_report_batched(httpx_mock):
+    url = "https://api.repricer.com/v1/repricers"
+    httpx_mock.add_response(method="POST", url=url, json={"updated": 2})
+    httpx_mock.add_response(method="POST", url=url, status_code=500)
+    httpx_mock.add_response(method="POST", url=url, json={"updated": 1})
+    rows = [{"sku": str(i), "marketplace": "amazon", "merchant_id": "M1", "fba": "0"} for i in range(5)]
+
+    result = await AsyncRepricers("username", "password", retry=None).upload_report_batched(
+        rows, batch_rows=2, concurrency=1
+    )
+
+    assert result.responses == [{"updated": 2}, {"updated": 1}]
+    assert result.failed_ranges == [range(2, 4)]
+    assert isinstance(result.failures[0][1], XsellcoServerError)
+    contents = [request.content for request in httpx_mock.get_requests()]
+    assert all(content.startswith(b"sku,marketplace,merchant_id,fba\n") for content in contents)
+    assert contents[2] == b"sku,marketplace,merchant_id,fba\n4,amazon,M1,0\n"
+
+
+@pytest.mark.asyncio
+async def test_upload_report_batched_missing_headers():
+    with pytest.raises(ValueError, match="Missing mandatory header columns"):
+        await AsyncRepricers("username", "password").upload_report_batched([{"sku": "1"}])
+
+
+@pytest.mark.asyncio
+async def test_upload_report_compressed(httpx_mock):
+    httpx_mock.add_response(method="POST", url="https://api.repricer.com/v1/repricers", json={"success": True})
+    rows = ({"sku": str(i), "marketplace": "amazon", "merchant_id": "M1", "fba": "0"} for i in range(100))
+    repricer = AsyncRepricers("username", "password", compression="gzip")
+
+    assert await repricer.upload_report(data=rows) == {"success": True}
+
+    request = httpx_mock.get_request()
+    assert request.headers["content-encoding"] == "gzip"
+    assert gzip.decompress(request.content).startswith(b"sku,marketplace,merchant_id,fba\n0,amazon,M1,0\n")
+    assert repricer.compression_stats.compressed_bytes == len(request.content)
+
+
+@pytest.mark.asyncio
+async def test_aiter_report_compressed(httpx_mock):
+    body = b"sku,price\n1,10\n2,20\n"
+    httpx_mock.add_response(
+        method="GET",
+        url="https://api.repricer.com/v1/repricers",
+        stream=httpx.ByteStream(gzip.compress(body)),
+        headers={"content-encoding": "gzip"},
+    )
+    repricer = AsyncRepricers("username", "password", compression="gzip")
+
+    assert [row["sku"] async for row in repricer.aiter_report()] == ["1", "2"]
+    assert repricer.compression_stats.decoded_bytes == len(body)
+
+
+@pytest.mark.asyncio
+async def test_upload_report_validate(httpx_mock):
+    httpx_mock.add_response(method="POST", url="https://api.repricer.com/v1/repricers", json={"success": True})
+    validator = ReportValidator(max_price=100)
+    data = [{"sku": "1", "marketplace": "amazon", "merchant_id": "M1", "fba": "1", "price_max": "50"}]
+
+    assert await AsyncRepricers("username", "password").upload_report(data=data, validate=validator) == {
+        "success": True
+    }
+
+    with pytest.raises(XsellcoValidationError, match="above 100"):
+        await AsyncRepricers("username", "password").upload_report(
+            data=[{**data[0], "price_max": "500"}], validate=validator
+        )
+
+
+@pytest.mark.asyncio
+async def test_get_report_cached(httpx_mock, tmp_path):
+    url = "https://api.repricer.com/v1/repricers"
+    httpx_mock.add_response(method="GET", url=url, content=b"sku,price\n1,10\n", headers={"etag": '"v1"'})
+    cache = ReportCache(tmp_path)
+
+    async with AsyncRepricers("username", "password") as repricer:
+        assert await repricer.get_report(cache=cache) == [{"sku": "1", "price": "10"}]
+        # The cache file is corrupted, so the report is downloaded again
+        cache.get_path(repricer.snapshot_account).write_bytes(b"garbage")
+        httpx_mock.add_response(method="GET", url=url, content=b"sku,price\n1,12\n", headers={"etag": '"v2"'})
+        assert await repricer.get_report(cache=cache) == [{"sku": "1", "price": "12"}]
+
+    assert "if-none-match" not in httpx_mock.get_requests()[-1].headers
+
+
+@pytest.mark.asyncio
+async def test_download_report(httpx_mock):
+    body = b"sku,price\n" + b"1,10\n" * 100
+    httpx_mock.add_response(method="GET", url="https://api.repricer.com/v1/repricers", content=body)
+    file = BytesIO()
+
+    async with AsyncRepricers("username", "password") as repricer:
+        download = await repricer.download_report(file)
+
+    assert file.getvalue() == body
+    assert download == (len(body), len(body), hashlib.sha256(body).hexdigest())
@@ -0,0 +1,25 @@
+import pytest
+
+from xsellco_api.async_ import AsyncChannels, AsyncRepricers, AsyncSession, AsyncUsers
+from xsellco_api.sync import Session
+
+
+@pytest.mark.asyncio
+async def test_async_session_shares_client(httpx_mock):
+    httpx_mock.add_response(method="HEAD", url="https://api.repricer.com/v1")
+    httpx_mock.add_response(method="HEAD", url="https://api.xsellco.com/v1")
+    httpx_mock.add_response(method="GET", url="https://api.xsellco.com/v1/users/1", json={"id": 1})
+
+    async with AsyncSession() as session:
+        channels = AsyncChannels("username", "password", session=session)
+        users = AsyncUsers("username", "password", session=session)
+        assert await channels._get_client() is await users._get_client()
+
+        async with users:
+            assert await users.get_user(1) == {"id": 1}
+        assert not (await channels._get_client()).is_closed
+
+
+def test_async_session_type_mismatch():
+    with pytest.raises(TypeError, match="AsyncRepricers needs an AsyncSession, got Session."):
+        AsyncRepricers("username", "password", session=Session(warmup=False))
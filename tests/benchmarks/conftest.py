@@ -0,0 +1,20 @@
+"""
+Performance baselines of the hot paths. They are marked ``benchmark`` and deselected by default, run them with:
+
+    pytest tests/benchmarks -m benchmark --benchmark-only
+
+Requests are answered in-process by ``httpx.MockTransport``, so the timings are of the client alone. Each benchmark
+also records the peak memory of a single (untimed) run in ``extra_info``. The 1M-row cases only run when
+XSELLCO_BENCHMARK_LARGE is set.
+"""
+
+import asyncio
+
+import pytest
+
+
+@pytest.fixture
+def event_loop_runner():
+    loop = asyncio.new_event_loop()
+    yield lambda coroutine_function: (lambda: loop.run_until_complete(coroutine_function()))
+    loop.close()
@@ -0,0 +1,58 @@
+"""
+Shared data and helpers of the benchmarks.
+"""
+
+import asyncio
+import os
+import tracemalloc
+from typing import Any, Callable, Dict, List
+
+import httpx
+import pytest
+
+LARGE = 1_000_000
+ROW_COUNTS = [
+    10_000,
+    pytest.param(LARGE, marks=pytest.mark.skipif(not os.getenv("XSELLCO_BENCHMARK_LARGE"), reason="slow")),
+]
+
+
+def make_rows(count: int) -> List[Dict[str, str]]:
+    return [
+        {
+            "sku": f"SKU-{i:07d}",
+            "marketplace": "amazon.co.uk",
+            "merchant_id": "A1B2C3D4E5",
+            "fba": str(i % 2),
+            "price_min": f"{10 + i % 90}.99",
+            "price_max": f"{100 + i % 900}.49",
+            "title": f'Product "{i}", with a comma',
+        }
+        for i in range(count)
+    ]
+
+
+def make_csv(count: int) -> bytes:
+    from xsellco_api.common.utils import generate_csv_bytes_from_data
+
+    return generate_csv_bytes_from_data(make_rows(count))
+
+
+def mock_client(client: Any, handler: Callable[[httpx.Request], httpx.Response]) -> Any:
+    """
+    Makes a SyncClient or AsyncClient send its requests to ``handler``.
+    """
+    client_class = httpx.AsyncClient if asyncio.iscoroutinefunction(client._get_client) else httpx.Client
+    client._client = client_class(
+        base_url=client.url, headers=client.headers, auth=client.auth, transport=httpx.MockTransport(handler)
+    )
+    return client
+
+
+def record_peak_memory(benchmark: Any, function: Callable[[], Any]) -> None:
+    tracemalloc.start()
+    try:
+        function()
+        benchmark.extra_info["peak_memory"] = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
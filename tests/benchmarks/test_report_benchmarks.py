@@ -0,0 +1,56 @@
+import httpx
+import pytest
+
+from tests.benchmarks.helpers import (
+    ROW_COUNTS,
+    make_csv,
+    make_rows,
+    mock_client,
+    record_peak_memory,
+)
+from xsellco_api.common.utils import generate_csv_bytes_from_data
+from xsellco_api.sync.repricers import Repricers
+
+pytest.importorskip("pytest_benchmark")
+pytestmark = pytest.mark.benchmark
+
+
+@pytest.fixture(scope="module", params=ROW_COUNTS, ids=lambda count: f"{count}rows")
+def report_csv(request):
+    return make_csv(request.param)
+
+
+def _repricers(body: bytes) -> Repricers:
+    return mock_client(Repricers("username", "password"), lambda request: httpx.Response(200, content=body))
+
+
+@pytest.mark.parametrize("format", ["dicts", "report"])
+def test_get_report(benchmark, report_csv, format):
+    repricers = _repricers(report_csv)
+    benchmark.extra_info["bytes"] = len(report_csv)
+    record_peak_memory(benchmark, lambda: repricers.get_report(format=format))
+
+    report = benchmark(repricers.get_report, format=format)
+
+    assert len(report) == report_csv.count(b"\n") - 1
+
+
+def test_iter_report(benchmark, report_csv):
+    repricers = _repricers(report_csv)
+
+    def consume():
+        for _ in repricers.iter_report():
+            pass
+
+    record_peak_memory(benchmark, consume)
+    benchmark(consume)
+
+
+@pytest.mark.parametrize("count", ROW_COUNTS, ids=lambda count: f"{count}rows")
+def test_generate_csv_bytes_from_data(benchmark, count):
+    rows = make_rows(count)
+    record_peak_memory(benchmark, lambda: generate_csv_bytes_from_data(rows))
+
+    body = benchmark(generate_csv_bytes_from_data, rows)
+
+    assert body.count(b"\n") == count + 1
@@ -0,0 +1,54 @@
+import json
+
+import httpx
+import pytest
+
+from tests.benchmarks.helpers import mock_client, record_peak_memory
+from xsellco_api.async_.asyncchannels import AsyncChannels
+from xsellco_api.sync.channels import Channels
+
+PAGES = 50
+PAGE_LIMIT = 100
+
+pytest.importorskip("pytest_benchmark")
+pytestmark = pytest.mark.benchmark
+
+
+def _channel(request: httpx.Request) -> httpx.Response:
+    return httpx.Response(200, json={"id": 1, "name": "channel"})
+
+
+def _channel_pages(request: httpx.Request) -> httpx.Response:
+    page = int(request.url.params["page"])
+    data = [{"id": (page - 1) * PAGE_LIMIT + i, "name": "channel"} for i in range(PAGE_LIMIT)]
+    body = {"data": data, "meta": {"last_page": PAGES}}
+    return httpx.Response(200, content=json.dumps(body).encode(), headers={"content-type": "application/json"})
+
+
+def test_sync_request_overhead(benchmark):
+    channels = mock_client(Channels("username", "password"), _channel)
+
+    assert benchmark(channels.get_channel, 1) == {"id": 1, "name": "channel"}
+
+
+def test_async_request_overhead(benchmark, event_loop_runner):
+    channels = mock_client(AsyncChannels("username", "password"), _channel)
+
+    assert benchmark(event_loop_runner(lambda: channels.get_channel(1))) == {"id": 1, "name": "channel"}
+
+
+def test_sync_pagination(benchmark):
+    channels = mock_client(Channels("username", "password"), _channel_pages)
+    benchmark.extra_info["items"] = PAGES * PAGE_LIMIT
+    record_peak_memory(benchmark, lambda: list(channels.iter_channels(page_limit=PAGE_LIMIT)))
+
+    assert len(benchmark(lambda: list(channels.iter_channels(page_limit=PAGE_LIMIT)))) == PAGES * PAGE_LIMIT
+
+
+def test_async_concurrent_pagination(benchmark, event_loop_runner):
+    channels = mock_client(AsyncChannels("username", "password"), _channel_pages)
+    benchmark.extra_info["items"] = PAGES * PAGE_LIMIT
+
+    items = benchmark(event_loop_runner(lambda: channels.get_all_channels(page_limit=PAGE_LIMIT)))
+
+    assert len(items) == PAGES * PAGE_LIMIT
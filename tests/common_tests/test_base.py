@@ -27,6 +27,11 @@ def test_process_response_success():
     assert BaseClient._process_response(response) == response
 
 
+def test_process_response_not_modified():
+    response = Response(status_code=HTTPStatus.NOT_MODIFIED, request=Request(method="GET", url="https://test"))
+    assert BaseClient._process_response(response) == response
+
+
 def test_process_response_unexpected_error():
     # Simulate a response that would raise an unexpected error when processed
     response = "not a valid response object"
@@ -0,0 +1,59 @@
+import pytest
+
+from xsellco_api.common.bulk import afetch_many, fetch_many, map_requests
+from xsellco_api.exceptions import XsellcoNotFoundError
+
+
+def fetch(_id):
+    if _id < 0:
+        raise XsellcoNotFoundError(f"Not Found for: {_id}")
+    return {"id": _id}
+
+
+def test_fetch_many():
+    requested = []
+
+    def _fetch(_id):
+        requested.append(_id)
+        return fetch(_id)
+
+    result = fetch_many(_fetch, [3, 1, 3, -1, 2, 1], max_workers=3)
+
+    assert sorted(requested) == [-1, 1, 2, 3]
+    assert list(result.results) == [3, 1, 2]
+    assert result.results[3] == {"id": 3}
+    assert list(result.errors) == [-1]
+    assert isinstance(result.errors[-1], XsellcoNotFoundError)
+
+
+def test_fetch_many_unexpected_error():
+    def _fetch(_id):
+        raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError):
+        fetch_many(_fetch, [1])
+
+
+def test_map_requests():
+    assert map_requests(lambda i: i * 2, range(10), max_workers=3) == [i * 2 for i in range(10)]
+
+
+def test_map_requests_return_exceptions():
+    results = map_requests(fetch, [1, -1, 2], return_exceptions=True)
+
+    assert results[0] == {"id": 1}
+    assert isinstance(results[1], XsellcoNotFoundError)
+    assert results[2] == {"id": 2}
+    with pytest.raises(XsellcoNotFoundError):
+        map_requests(fetch, [1, -1])
+
+
+@pytest.mark.asyncio
+async def test_afetch_many():
+    async def _fetch(_id):
+        return fetch(_id)
+
+    results, errors = await afetch_many(_fetch, [2, -5, 2, 1], concurrency=2)
+
+    assert results == {2: {"id": 2}, 1: {"id": 1}}
+    assert list(errors) == [-5]
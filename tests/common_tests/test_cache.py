@@ -0,0 +1,62 @@
+import pytest
+from httpx import Request, Response
+
+from xsellco_api.common.cache import ResponseCache
+
+
+@pytest.fixture
+def clock(mocker):
+    now = [1000.0]
+    mocker.patch("xsellco_api.common.cache.time.monotonic", side_effect=lambda: now[0])
+    return now
+
+
+def make_response(content=b"{}", headers=None):
+    return Response(200, content=content, headers=headers, request=Request("GET", "https://test"))
+
+
+def test_cache_hit_and_expiry(clock):
+    cache = ResponseCache(ttl=10)
+    assert cache.get("key") is None
+    cache.set("key", "channels/1", make_response(b'{"id": 1}'))
+
+    entry = cache.get("key")
+    assert entry.is_fresh and entry.content == b'{"id": 1}'
+    clock[0] += 10
+    assert not cache.get("key").is_fresh
+    assert cache.stats == {"hits": 1, "misses": 2, "revalidations": 0, "evictions": 0, "size": 1}
+
+
+def test_cache_ttl_per_endpoint(clock):
+    cache = ResponseCache(ttl=10, ttl_per_endpoint={"channels": 100})
+    assert cache.get_ttl("channels/1") == 100
+    assert cache.get_ttl("users/1") == 10
+
+
+def test_cache_lru_eviction():
+    cache = ResponseCache(maxsize=2)
+    cache.set("a", "users", make_response())
+    cache.set("b", "users", make_response())
+    cache.get("a")
+    cache.set("c", "users", make_response())
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert len(cache) == 2
+    assert cache.evictions == 1
+
+
+def test_cache_revalidate(clock):
+    cache = ResponseCache(ttl=10)
+    entry = cache.set("key", "users/1", make_response(headers={"etag": '"v1"', "last-modified": "yesterday"}))
+    assert entry.conditional_headers == {"if-none-match": '"v1"', "if-modified-since": "yesterday"}
+
+    clock[0] += 20
+    cache.clear()
+    response = Response(304, headers={"etag": '"v2"'}, request=Request("GET", "https://test"))
+    cache.revalidate("key", entry, "users/1", response)
+
+    assert cache.get("key") is entry
+    assert entry.is_fresh
+    assert entry.etag == '"v2"' and entry.last_modified == "yesterday"
+    assert cache.revalidations == 1
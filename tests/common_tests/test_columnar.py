@@ -0,0 +1,78 @@
+import sys
+
+import pytest
+
+from xsellco_api.common.columnar import get_typed_columns, read_columnar_report
+from xsellco_api.common.report import RepricerReport
+
+BODY = b"sku,marketplace,fba,price_min,price_max,unit_currency\n001,amazon,1,1.5,3,GBP\n002,ebay,0,,4,EUR\n"
+
+
+@pytest.fixture
+def no_pyarrow(monkeypatch):
+    monkeypatch.setitem(sys.modules, "pyarrow", None)
+
+
+def test_get_typed_columns():
+    report = RepricerReport.from_dicts(
+        [
+            {"sku": "1", "price_min": "1.5", "price_max": "3", "stock": "", "unit_currency": "GBP"},
+            {"sku": "2", "price_min": "", "price_max": "4", "stock": "", "unit_currency": "EUR"},
+        ]
+    )
+    assert get_typed_columns(report) == {
+        "sku": ["1", "2"],
+        "price_min": [1.5, None],
+        "price_max": [3, 4],
+        "stock": ["", ""],
+        "unit_currency": ["GBP", "EUR"],
+    }
+
+
+def test_read_columnar_report_unsupported_format():
+    with pytest.raises(ValueError):
+        read_columnar_report(BODY, "xml")
+
+
+def test_read_columnar_report_arrow():
+    pytest.importorskip("pyarrow")
+    table = read_columnar_report(BODY, "arrow")
+    assert table.column("sku").to_pylist() == ["001", "002"]
+    assert table.column("fba").to_pylist() == ["1", "0"]
+    assert table.column("price_min").to_pylist() == [1.5, None]
+    assert table.column("price_max").to_pylist() == [3, 4]
+
+
+def test_read_columnar_report_arrow_requires_pyarrow(no_pyarrow):
+    with pytest.raises(ImportError, match="requires pyarrow"):
+        read_columnar_report(BODY, "arrow")
+
+
+@pytest.mark.parametrize("use_pyarrow", [True, False])
+def test_read_columnar_report_pandas(request, use_pyarrow):
+    pytest.importorskip("pandas")
+    if use_pyarrow:
+        pytest.importorskip("pyarrow")
+    else:
+        request.getfixturevalue("no_pyarrow")
+
+    frame = read_columnar_report(BODY, "pandas")
+    assert list(frame["sku"]) == ["001", "002"]
+    assert frame["price_max"].dtype.kind == "i"
+    assert frame["price_min"].dtype.kind == "f"
+    assert frame["price_min"].isna().tolist() == [False, True]
+
+
+@pytest.mark.parametrize("use_pyarrow", [True, False])
+def test_read_columnar_report_numpy(request, use_pyarrow):
+    pytest.importorskip("numpy")
+    if use_pyarrow:
+        pytest.importorskip("pyarrow")
+    else:
+        request.getfixturevalue("no_pyarrow")
+
+    arrays = read_columnar_report(BODY, "numpy")
+    assert list(arrays["sku"]) == ["001", "002"]
+    assert arrays["price_max"].dtype.kind == "i"
+    assert arrays["price_min"].dtype.kind == "f"
+    assert arrays["price_max"].tolist() == [3, 4]
@@ -0,0 +1,70 @@
+import gzip
+import zlib
+
+import httpx
+import pytest
+
+from xsellco_api.common.compression import (
+    CompressionStats,
+    compress_body,
+    get_available_encodings,
+    get_compressor,
+    iter_response_text,
+)
+
+
+def test_available_encodings_include_gzip():
+    assert "gzip" in get_available_encodings()
+    # Looked up once, the imports aren't tried again on every request
+    assert get_available_encodings() is get_available_encodings()
+
+
+def test_compress_bytes():
+    stats = CompressionStats()
+    body = b"sku,price\n" + b"SKU-1,10\n" * 1000
+
+    compressed = compress_body(body, "gzip", stats)
+
+    assert gzip.decompress(compressed) == body
+    assert stats.uploaded_bytes == len(body)
+    assert stats.compressed_bytes == len(compressed)
+    assert stats.upload_ratio > 10
+    assert stats.compression_time > 0
+
+
+def test_compress_chunks():
+    stats = CompressionStats()
+    chunks = [b"SKU-1,10\n" * 100 for _ in range(10)]
+
+    compressed = b"".join(compress_body(iter(chunks), "gzip", stats))
+
+    assert gzip.decompress(compressed) == b"".join(chunks)
+    assert stats.stats["uploaded_bytes"] == 9000
+    assert stats.stats["compressed_bytes"] == len(compressed)
+
+
+def test_zstd_compressor():
+    zstandard = pytest.importorskip("zstandard")
+    compressor = get_compressor("zstd")
+
+    compressed = compressor.compress(b"a" * 1000) + compressor.flush()
+
+    assert zstandard.ZstdDecompressor().decompressobj().decompress(compressed) == b"a" * 1000
+
+
+def test_unsupported_encoding():
+    with pytest.raises(ValueError, match="Unsupported content encoding"):
+        get_compressor("lz4")
+
+
+def test_iter_response_text_records_download():
+    body = "sku,title\n1,Café\n".encode("utf-8")
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31)
+    compressed = compressor.compress(body) + compressor.flush()
+    response = httpx.Response(200, headers={"content-encoding": "gzip"}, stream=httpx.ByteStream(compressed))
+    stats = CompressionStats()
+
+    assert "".join(iter_response_text(response, stats)) == body.decode("utf-8")
+    assert stats.downloaded_bytes == len(compressed)
+    assert stats.decoded_bytes == len(body)
+    assert stats.download_ratio == len(body) / len(compressed)
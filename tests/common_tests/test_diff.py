@@ -0,0 +1,48 @@
+from xsellco_api.common import diff
+from xsellco_api.common.diff import diff_reports, get_row_digest, get_row_key
+from xsellco_api.common.report import RepricerReport
+
+
+def make_row(sku, price, marketplace="amazon"):
+    return {"sku": sku, "marketplace": marketplace, "merchant_id": "1", "fba": "0", "price_min": price}
+
+
+def test_get_row_key():
+    assert get_row_key(make_row("a", "1")) == ("a", "amazon", "1", "0")
+    assert get_row_key({"sku": "a"}, key=["sku", "fba"]) == ("a", None)
+
+
+def test_get_row_digest_ignores_key_order():
+    row = make_row("a", "1")
+    assert get_row_digest(row) == get_row_digest(dict(reversed(list(row.items()))))
+    assert get_row_digest(row) != get_row_digest(make_row("a", "2"))
+
+
+def test_diff_reports():
+    old = [make_row("a", "1"), make_row("b", "2"), make_row("c", "3"), make_row("a", "1", marketplace="ebay")]
+    new = [make_row("a", "1"), make_row("b", "20"), make_row("d", "4"), make_row("a", "1", marketplace="ebay")]
+
+    diff = diff_reports(old, new)
+
+    assert diff.added == [make_row("d", "4")]
+    assert diff.changed == [make_row("b", "20")]
+    assert diff.removed == [make_row("c", "3")]
+    assert diff.delta == [make_row("d", "4"), make_row("b", "20")]
+    assert not diff.is_empty
+
+
+def test_diff_reports_unchanged():
+    rows = [make_row("a", "1"), make_row("b", "2")]
+    diff = diff_reports(RepricerReport.from_dicts(rows), (dict(row) for row in rows))
+    assert diff.is_empty
+
+
+def test_diff_reports_custom_key():
+    diff = diff_reports([{"id": 1, "v": "a"}], [{"id": 1, "v": "b"}], key=["id"])
+    assert diff.changed == [{"id": 1, "v": "b"}]
+
+
+def test_diff_reports_digest_collision(mocker):
+    mocker.patch.object(diff, "get_row_digest", return_value=0)
+    report_diff = diff_reports([make_row("a", "1")], [make_row("a", "2")])
+    assert report_diff.changed == [make_row("a", "2")]
@@ -0,0 +1,47 @@
+import gzip
+import hashlib
+from io import BytesIO
+
+import pytest
+
+from xsellco_api.common.download import ReportDownload, ReportFileWriter
+
+BODY = b"sku,price\n" + b"1,10\n" * 1000
+
+
+def test_report_file_writer(tmp_path):
+    path = tmp_path / "report.csv"
+    with ReportFileWriter(path) as writer:
+        writer.write(BODY[:100])
+        writer.write(BODY[100:])
+        download = writer.close()
+
+    assert download == ReportDownload(len(BODY), len(BODY), hashlib.sha256(BODY).hexdigest())
+    assert path.read_bytes() == BODY
+
+
+def test_report_file_writer_compressed():
+    file = BytesIO()
+    with ReportFileWriter(file, compression="gzip") as writer:
+        writer.write(BODY)
+        download = writer.close()
+
+    assert gzip.decompress(file.getvalue()) == BODY
+    assert download.written == len(file.getvalue()) < download.size
+    assert download.sha256 == hashlib.sha256(BODY).hexdigest()
+    assert not file.closed
+
+
+def test_report_file_writer_removes_partial_file(tmp_path):
+    path = tmp_path / "report.csv"
+    with pytest.raises(RuntimeError):
+        with ReportFileWriter(path) as writer:
+            writer.write(BODY)
+            raise RuntimeError("Connection lost")
+
+    assert not path.exists()
+
+
+def test_report_file_writer_unsupported_compression(tmp_path):
+    with pytest.raises(ValueError, match="Unsupported compression"):
+        ReportFileWriter(tmp_path / "report.csv", compression="lz4")
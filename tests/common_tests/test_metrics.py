@@ -0,0 +1,75 @@
+import pytest
+
+from xsellco_api.common.hooks import RequestEvent
+from xsellco_api.common.metrics import Histogram, MetricsRecorder, OpenTelemetryHook
+
+
+def _event(endpoint="channels/1", total_time=0.02, status=200, exception=None, **values):
+    return RequestEvent(
+        method=values.get("method", "GET"),
+        endpoint=endpoint,
+        host="api.xsellco.com",
+        status=status,
+        connect_time=values.get("connect_time"),
+        ttfb=values.get("ttfb", total_time / 2),
+        total_time=total_time,
+        request_bytes=values.get("request_bytes", 0),
+        response_bytes=values.get("response_bytes", 100),
+        retries=values.get("retries", 0),
+        exception=exception,
+    )
+
+
+def test_histogram():
+    histogram = Histogram(buckets=(0.1, 1.0))
+    for value in (0.05, 0.05, 0.5, 2.0):
+        histogram.observe(value)
+
+    assert histogram.counts == [2, 1, 1]
+    assert histogram.stats == {"count": 4, "mean": 0.65, "p50": 0.1, "p90": 2.0, "p99": 2.0, "max": 2.0}
+    assert Histogram().quantile(0.5) is None
+
+
+def test_metrics_recorder():
+    metrics = MetricsRecorder()
+    metrics(_event("channels/1", connect_time=0.01))
+    metrics(_event("channels/2", status=500, retries=2))
+    metrics(_event("channels", status=None, exception="ConnectError"))
+    metrics(_event("repricers", method="POST", request_bytes=1000))
+
+    channels = metrics.get("GET", "channels")
+    assert channels["total_time"]["count"] == 3
+    assert channels["connect_time"]["count"] == 1
+    assert channels["response_bytes"] == 300
+    assert channels["retries"] == 2
+    assert channels["statuses"] == {200: 1, 500: 1}
+    assert channels["exceptions"] == {"ConnectError": 1}
+    assert metrics.get("POST", "repricers")["request_bytes"] == 1000
+    assert set(metrics.stats) == {("GET", "channels"), ("POST", "repricers")}
+
+    metrics.clear()
+    assert metrics.stats == {}
+
+
+def test_opentelemetry_hook(mocker):
+    meter = mocker.Mock()
+    hook = OpenTelemetryHook(meter)
+
+    hook(_event(status=503, retries=1))
+
+    duration = meter.create_histogram.return_value
+    attributes = {
+        "http.request.method": "GET",
+        "server.address": "api.xsellco.com",
+        "url.template": "channels",
+        "http.response.status_code": 503,
+        "error.type": "503",
+    }
+    duration.record.assert_any_call(0.02, attributes)
+    meter.create_counter.return_value.add.assert_any_call(1, attributes)
+
+
+def test_opentelemetry_hook_global_meter():
+    pytest.importorskip("opentelemetry.metrics")
+
+    OpenTelemetryHook()(_event())
@@ -0,0 +1,135 @@
+import asyncio
+
+import pytest
+
+from xsellco_api.common.pagination import (
+    aiter_pages,
+    gather_pages,
+    get_last_page,
+    get_page_items,
+    is_last_page,
+    iter_pages,
+)
+
+
+@pytest.mark.parametrize(
+    "payload, items",
+    [
+        ([{"id": 1}], [{"id": 1}]),
+        ({"data": [{"id": 1}], "total": 1}, [{"id": 1}]),
+        ({"message": "no data"}, []),
+        (None, []),
+    ],
+)
+def test_get_page_items(payload, items):
+    assert get_page_items(payload) == items
+
+
+@pytest.mark.parametrize(
+    "payload, last_page",
+    [
+        ({"data": [], "last_page": 3}, 3),
+        ({"data": [], "meta": {"pagination": {"total_pages": 4}}}, 4),
+        ({"data": [], "pagination": {"last_page": 5}}, 5),
+        ({"data": []}, None),
+        ([], None),
+    ],
+)
+def test_get_last_page(payload, last_page):
+    assert get_last_page(payload) == last_page
+
+
+def test_is_last_page():
+    assert is_last_page({"data": [{}] * 2, "last_page": 2}, page=2, page_limit=2)
+    assert not is_last_page({"data": [{}], "last_page": 2}, page=1, page_limit=2)
+    assert is_last_page([{}], page=1, page_limit=2)
+    assert not is_last_page([{}, {}], page=1, page_limit=2)
+
+
+def make_pages(total, page_limit):
+    records = [{"id": i} for i in range(total)]
+    requested = []
+
+    def fetch_page(page):
+        requested.append(page)
+        return {"data": records[(page - 1) * page_limit : page * page_limit]}
+
+    return records, requested, fetch_page
+
+
+def test_iter_pages():
+    records, requested, fetch_page = make_pages(total=5, page_limit=2)
+    assert list(iter_pages(fetch_page, page_limit=2)) == records
+    assert requested == [1, 2, 3]
+
+
+def test_iter_pages_full_last_page():
+    records, requested, fetch_page = make_pages(total=4, page_limit=2)
+    assert list(iter_pages(fetch_page, page_limit=2)) == records
+    assert requested == [1, 2, 3]
+
+
+def test_iter_pages_max_pages():
+    records, requested, fetch_page = make_pages(total=10, page_limit=2)
+    assert list(iter_pages(fetch_page, page_limit=2, max_pages=2)) == records[:4]
+    assert requested == [1, 2]
+
+
+def test_iter_pages_is_lazy():
+    _, requested, fetch_page = make_pages(total=10, page_limit=2)
+    for record in iter_pages(fetch_page, page_limit=2):
+        if record["id"] == 1:
+            break
+    assert requested == [1]
+
+
+@pytest.mark.asyncio
+async def test_aiter_pages():
+    records, requested, fetch_page = make_pages(total=5, page_limit=2)
+
+    async def afetch_page(page):
+        return fetch_page(page)
+
+    assert [record async for record in aiter_pages(afetch_page, page_limit=2)] == records
+    assert requested == [1, 2, 3]
+
+
+@pytest.mark.asyncio
+async def test_gather_pages_concurrently_in_order():
+    page_limit, last_page = 2, 7
+    in_flight, max_in_flight, requested = 0, 0, []
+
+    async def fetch_page(page):
+        nonlocal in_flight, max_in_flight
+        requested.append(page)
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        # Later pages complete first
+        await asyncio.sleep(0.001 * (last_page - page))
+        in_flight -= 1
+        return {"data": [{"id": page * 10}, {"id": page * 10 + 1}], "last_page": last_page}
+
+    records = await gather_pages(fetch_page, page_limit=page_limit, concurrency=3)
+
+    assert [record["id"] for record in records] == [page * 10 + i for page in range(1, 8) for i in range(2)]
+    assert sorted(requested) == list(range(1, 8))
+    assert max_in_flight == 3
+
+
+@pytest.mark.asyncio
+async def test_gather_pages_max_pages():
+    async def fetch_page(page):
+        return {"data": [{"id": page}], "last_page": 10}
+
+    assert await gather_pages(fetch_page, page_limit=1, max_pages=3) == [{"id": 1}, {"id": 2}, {"id": 3}]
+
+
+@pytest.mark.asyncio
+async def test_gather_pages_unknown_page_count():
+    records, requested, fetch_page = make_pages(total=5, page_limit=2)
+
+    async def afetch_page(page):
+        return fetch_page(page)
+
+    assert await gather_pages(afetch_page, page_limit=2) == records
+    assert requested == [1, 2, 3]
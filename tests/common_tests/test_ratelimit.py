@@ -0,0 +1,72 @@
+import threading
+
+import pytest
+
+from xsellco_api.common.ratelimit import RateLimiter, TokenBucket
+
+
+@pytest.fixture
+def clock(mocker):
+    now = [1000.0]
+    mocker.patch("xsellco_api.common.ratelimit.time.monotonic", side_effect=lambda: now[0])
+    return now
+
+
+def test_token_bucket_burst_then_spread(clock):
+    bucket = TokenBucket(rate=2, capacity=2)
+    assert [bucket.reserve() for _ in range(4)] == [0, 0, 0.5, 1.0]
+
+
+def test_token_bucket_refill(clock):
+    bucket = TokenBucket(rate=2, capacity=2)
+    bucket.reserve(2)
+    clock[0] += 0.5
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == 0.5
+    clock[0] += 100
+    # Refill is capped by the capacity
+    assert [bucket.reserve() for _ in range(3)] == [0, 0, 0.5]
+
+
+def test_token_bucket_invalid_rate():
+    with pytest.raises(ValueError):
+        TokenBucket(rate=0)
+
+
+def test_token_bucket_thread_safe(clock):
+    bucket = TokenBucket(rate=10, capacity=10)
+    delays = []
+    threads = [threading.Thread(target=lambda: delays.extend(bucket.reserve() for _ in range(100))) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    # Each reservation is scheduled exactly once
+    assert sorted(delays) == [max(0, (i - 9) / 10) for i in range(400)]
+
+
+def test_rate_limiter_per_host(clock):
+    limiter = RateLimiter(rate=100, per_host={"api.repricer.com": (1, 1), "api.xsellco.com": TokenBucket(5)})
+    assert limiter.get_bucket("api.repricer.com").rate == 1
+    assert limiter.get_bucket("api.xsellco.com").rate == 5
+    assert limiter.get_bucket("other.host").rate == 100
+    assert limiter.get_bucket("other.host") is limiter.get_bucket("other.host")
+    assert RateLimiter().get_bucket("api.xsellco.com") is None
+
+
+def test_rate_limiter_acquire(clock, mocker):
+    sleep = mocker.patch("xsellco_api.common.ratelimit.time.sleep")
+    limiter = RateLimiter(per_host={"api.xsellco.com": 1})
+    limiter.acquire("api.xsellco.com")
+    sleep.assert_not_called()
+    limiter.acquire("api.xsellco.com")
+    sleep.assert_called_once_with(1.0)
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_aacquire(clock, mocker):
+    sleep = mocker.patch("asyncio.sleep")
+    limiter = RateLimiter(rate=2, capacity=1)
+    await limiter.aacquire("api.xsellco.com")
+    await limiter.aacquire("api.xsellco.com")
+    sleep.assert_awaited_once_with(0.5)
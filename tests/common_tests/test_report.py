@@ -0,0 +1,80 @@
+import pytest
+
+from xsellco_api.common.report import ReportDecoder, ReportRow, RepricerReport
+from xsellco_api.common.utils import generate_csv_bytes_from_data
+
+ROWS = [
+    {"sku": "a", "marketplace": "amazon", "price": "1.5"},
+    {"sku": "b", "marketplace": "ebay", "price": None},
+    {"sku": "c", "marketplace": "amazon", "price": "3"},
+]
+
+
+@pytest.fixture
+def report():
+    return RepricerReport.from_dicts(ROWS)
+
+
+def test_report_columns(report):
+    assert len(report) == 3
+    assert report.fieldnames == ["sku", "marketplace", "price"]
+    assert report["sku"] == ["a", "b", "c"]
+    assert report.column("price") == ["1.5", None, "3"]
+
+
+def test_report_rows(report):
+    row = report[1]
+    assert isinstance(row, ReportRow)
+    assert row["sku"] == "b"
+    assert row.get("missing", "default") == "default"
+    assert row == ROWS[1]
+    assert report[-1].to_dict() == ROWS[2]
+    assert [dict(row) for row in report] == ROWS
+    with pytest.raises(IndexError):
+        report[3]
+    with pytest.raises(AttributeError):
+        row.extra = 1
+
+
+def test_report_slice(report):
+    sliced = report[1:]
+    assert isinstance(sliced, RepricerReport)
+    assert sliced.to_dicts() == ROWS[1:]
+
+
+def test_report_append(report):
+    report.append({"sku": "d", "extra": "ignored"})
+    report.append_values(["e", "amazon", "5", "ignored"])
+    assert report.to_dicts()[3:] == [
+        {"sku": "d", "marketplace": None, "price": None},
+        {"sku": "e", "marketplace": "amazon", "price": "5"},
+    ]
+
+
+def test_report_invalid_columns():
+    with pytest.raises(ValueError):
+        RepricerReport(columns={"a": ["1"], "b": []})
+
+
+def test_report_empty():
+    assert len(RepricerReport.from_dicts([])) == 0
+
+
+def test_report_to_csv_bytes(report):
+    assert report.to_csv_bytes() == generate_csv_bytes_from_data(ROWS)
+
+
+def test_report_decoder():
+    decoder = ReportDecoder()
+    for chunk in ("sku,price\n1,", "10\n2,20\n3"):
+        decoder.decode(chunk)
+    report = decoder.flush()
+    assert report.to_dicts() == [{"sku": "1", "price": "10"}, {"sku": "2", "price": "20"}, {"sku": "3", "price": None}]
+
+
+def test_report_decoder_header_only():
+    decoder = ReportDecoder()
+    decoder.decode("sku,price\n")
+    report = decoder.flush()
+    assert len(report) == 0
+    assert report.fieldnames == ["sku", "price"]
@@ -0,0 +1,77 @@
+import pytest
+from httpx import Request, Response
+
+from xsellco_api.common.report import RepricerReport
+from xsellco_api.common.report_cache import ReportCache, read_report
+
+BODY = b"sku,price\n1,10\n2,20\n"
+
+
+def make_response(status_code=200, content=BODY, headers=None):
+    return Response(status_code, content=content, headers=headers, request=Request("GET", "https://test"))
+
+
+def test_report_cache_set_and_get(tmp_path):
+    cache = ReportCache(tmp_path)
+    cache.set("user@host", make_response(headers={"etag": '"v1"', "last-modified": "Mon, 01 Jan 2024 00:00:00 GMT"}))
+
+    cached = ReportCache(tmp_path).get("user@host")
+
+    assert cached.body == BODY
+    assert cached.conditional_headers == {
+        "if-none-match": '"v1"',
+        "if-modified-since": "Mon, 01 Jan 2024 00:00:00 GMT",
+    }
+    assert cache.get("other@host") is None
+    assert list(tmp_path.iterdir()) == [cache.get_path("user@host")]
+
+
+def test_report_cache_without_validators(tmp_path):
+    cache = ReportCache(tmp_path)
+
+    assert cache.set("user@host", make_response()) is None
+    assert cache.get("user@host") is None
+
+
+def test_report_cache_revalidate(tmp_path):
+    cache = ReportCache(tmp_path)
+    cached = cache.set("user@host", make_response(headers={"etag": '"v1"'}))
+
+    assert cache.revalidate("user@host", cached, make_response(304, b"", {"etag": '"v2"'})).body == BODY
+    assert cache.get("user@host").etag == '"v2"'
+    assert cache.stats == {"hits": 1, "misses": 1, "corrupted": 0}
+
+
+@pytest.mark.parametrize(
+    "corrupt",
+    [
+        lambda data: data[:-10],  # Truncated
+        lambda data: data[:-30] + bytes(30),  # Overwritten
+        lambda data: data.replace(b'"v1"', b'"v2"', 1)[:40],
+        lambda data: b"garbage",
+    ],
+)
+def test_report_cache_discards_corrupted_files(tmp_path, corrupt):
+    cache = ReportCache(tmp_path)
+    cache.set("user@host", make_response(headers={"etag": '"v1"'}))
+    path = cache.get_path("user@host")
+    path.write_bytes(corrupt(path.read_bytes()))
+
+    assert cache.get("user@host") is None
+    assert not path.exists()
+    assert cache.corrupted == 1
+
+
+def test_report_cache_clear(tmp_path):
+    cache = ReportCache(tmp_path)
+    cache.set("user@host", make_response(headers={"etag": '"v1"'}))
+    cache.clear()
+
+    assert cache.get("user@host") is None
+
+
+def test_read_report():
+    assert read_report(BODY) == [{"sku": "1", "price": "10"}, {"sku": "2", "price": "20"}]
+    assert isinstance(read_report(BODY, "report"), RepricerReport)
+    with pytest.raises(ValueError, match="Unsupported report format"):
+        read_report(BODY, "xml")
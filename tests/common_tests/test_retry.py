@@ -0,0 +1,58 @@
+from email.utils import formatdate
+from time import time
+
+import pytest
+from httpx import Request, Response
+
+from xsellco_api.common.retry import RetryPolicy
+
+
+def make_response(status_code, headers=None):
+    return Response(status_code=status_code, headers=headers, request=Request(method="GET", url="https://test"))
+
+
+def test_get_delay_exponential_backoff():
+    policy = RetryPolicy(backoff_factor=1, max_backoff=3, jitter=False)
+    assert [policy.get_delay("GET", attempt) for attempt in range(3)] == [1, 2, 3]
+    assert policy.get_delay("GET", 3) is None
+
+
+def test_get_delay_jitter():
+    policy = RetryPolicy(backoff_factor=1)
+    assert all(0 <= policy.get_delay("GET", 2) <= 4 for _ in range(100))
+
+
+@pytest.mark.parametrize("method", ["POST", "PATCH"])
+def test_get_delay_non_idempotent_method(method):
+    assert RetryPolicy().get_delay(method, 0) is None
+    assert RetryPolicy(methods=["post", "patch"]).get_delay(method, 0) is not None
+
+
+@pytest.mark.parametrize("status_code, retried", [(429, True), (503, True), (400, False), (404, False)])
+def test_get_delay_status(status_code, retried):
+    assert (RetryPolicy().get_delay("GET", 0, response=make_response(status_code)) is not None) == retried
+
+
+def test_get_delay_retry_after_seconds():
+    policy = RetryPolicy()
+    assert policy.get_delay("GET", 0, response=make_response(429, {"retry-after": "7"})) == 7
+    assert RetryPolicy(respect_retry_after=False, jitter=False).get_delay(
+        "GET", 0, response=make_response(429, {"retry-after": "7"})
+    ) == pytest.approx(0.5)
+
+
+def test_get_retry_after_http_date():
+    response = make_response(429, {"retry-after": formatdate(time() + 10, usegmt=True)})
+    assert 8 <= RetryPolicy.get_retry_after(response) <= 10
+
+
+@pytest.mark.parametrize("value", ["", "soon"])
+def test_get_retry_after_invalid(value):
+    assert RetryPolicy.get_retry_after(make_response(429, {"retry-after": value})) is None
+
+
+def test_get_delay_budget():
+    policy = RetryPolicy(budget=10)
+    response = make_response(429, {"retry-after": "6"})
+    assert policy.get_delay("GET", 0, waited=0, response=response) == 6
+    assert policy.get_delay("GET", 1, waited=6, response=response) is None
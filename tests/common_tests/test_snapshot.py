@@ -0,0 +1,137 @@
+import multiprocessing
+import time
+
+import pytest
+
+from xsellco_api.common.snapshot import ReportSnapshotStore
+
+
+def _rows(count, price="10"):
+    return [
+        {"sku": f"SKU-{i:03d}", "marketplace": "amazon", "merchant_id": "M1", "fba": "0", "price": price}
+        for i in range(count)
+    ]
+
+
+def _read_row_count(path, queue):
+    queue.put(ReportSnapshotStore(path).latest("account").row_count)
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = ReportSnapshotStore(tmp_path / "snapshots.sqlite3")
+    yield store
+    store.close()
+
+
+def test_write_and_get(store):
+    snapshot = store.write(_rows(3), "account")
+
+    assert snapshot.row_count == 3
+    assert snapshot.fieldnames == ["sku", "marketplace", "merchant_id", "fba", "price"]
+    assert store.get("SKU-001", "amazon", "M1", "0", "account")["price"] == "10"
+    assert store.get("SKU-999", "amazon", "M1", "0", "account") is None
+    assert store.get("SKU-001", "amazon", "M1", "0", "other") is None
+
+
+def test_scan_range(store):
+    store.write(reversed(_rows(20)), "account")
+
+    skus = [row["sku"] for row in store.scan("account", start=("SKU-005",), stop=("SKU-008",))]
+
+    assert skus == ["SKU-005", "SKU-006", "SKU-007"]
+    assert len(list(store.scan("account", batch_size=3))) == 20
+
+
+def test_latest_snapshot_and_pruning(store):
+    store.write(_rows(2), "account", fetched_at=1)
+    store.write(_rows(2, price="20"), "account", fetched_at=2)
+    latest = store.write(_rows(1, price="30"), "account", fetched_at=3)
+
+    assert store.latest("account") == latest
+    assert store.get("SKU-000", "amazon", "M1", "0", "account")["price"] == "30"
+    assert store._connection.execute("SELECT COUNT(*) FROM snapshots").fetchone()[0] == 2
+
+
+def test_failed_write_keeps_previous_snapshot(store):
+    previous = store.write(_rows(2), "account")
+
+    with pytest.raises(RuntimeError):
+        with store.writer("account") as writer:
+            writer.add_many(_rows(5, price="20"))
+            raise RuntimeError
+
+    assert store.latest("account") == previous
+    assert store.get("SKU-001", "amazon", "M1", "0", "account")["price"] == "10"
+
+
+def test_is_fresh(store):
+    assert not store.is_fresh("account", 60)
+    store.write(_rows(1), "account", fetched_at=time.time() - 120)
+
+    assert not store.is_fresh("account", 60)
+    assert store.is_fresh("account", 600)
+
+
+def test_read_from_other_processes(store):
+    store.write(_rows(4), "account")
+    queue = multiprocessing.get_context("spawn").Queue()
+    processes = [
+        multiprocessing.get_context("spawn").Process(target=_read_row_count, args=(store.path, queue)) for _ in range(2)
+    ]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join(30)
+
+    assert [queue.get(timeout=5) for _ in processes] == [4, 4]
+
+
+def test_writer_doesnt_block_other_writers(store):
+    other = ReportSnapshotStore(store.path, timeout=0.5)
+    with store.writer("account") as writer:
+        writer.add_many(_rows(3))
+        writer.flush()
+        # Only the flushed batch held the write lock
+        other.write(_rows(1), "other")
+        other.write(_rows(1, price="20"), "account")
+    other.close()
+
+    assert writer.snapshot.row_count == 3
+    assert store.latest("other").row_count == 1
+    # The snapshot written meanwhile was fetched later, the pending one wasn't pruned by it
+    assert store.latest("account").row_count == 1
+    query = "SELECT COUNT(*) FROM rows WHERE snapshot_id = ?"
+    assert store._connection.execute(query, (writer.snapshot.id,)).fetchone()[0] == 3
+
+
+def test_missing_key_values(store):
+    rows = [{"sku": "SKU-1", "marketplace": "amazon", "merchant_id": None, "fba": "0", "price": "10"}]
+    rows.append({"sku": "SKU-2", "marketplace": "amazon", "fba": "0", "price": "20"})
+
+    assert store.write(rows, "account").row_count == 2
+    assert store.get("SKU-1", "amazon", "", "0", "account")["merchant_id"] is None
+    assert store.get("SKU-2", "amazon", "", "0", "account")["price"] == "20"
+
+
+def test_prune_abandoned_snapshots(store, mocker):
+    abandoned = store._begin("account", None)
+    abandoned.add_many(_rows(2))
+    abandoned.flush()
+    mocker.patch("xsellco_api.common.snapshot.time.time", return_value=time.time() + 7200)
+    store.write(_rows(1), "account")
+
+    assert store._connection.execute("SELECT COUNT(*) FROM snapshots").fetchone()[0] == 1
+    assert store._connection.execute("SELECT COUNT(*) FROM rows").fetchone()[0] == 1
+
+
+@pytest.mark.asyncio
+async def test_awrite(store):
+    async def _arows():
+        for row in _rows(5):
+            yield row
+
+    snapshot = await store.awrite(_arows(), "account")
+
+    assert snapshot == store.latest("account")
+    assert [row["sku"] for row in store.scan("account")] == [f"SKU-{i:03d}" for i in range(5)]
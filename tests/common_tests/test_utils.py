@@ -1,6 +1,18 @@
+import csv
+from io import BytesIO, StringIO
+
 import pytest
 
-from xsellco_api.common.utils import generate_csv_bytes_from_data, validate_data_headers
+from xsellco_api.common.utils import (
+    CSVStreamDecoder,
+    aiter_csv_bytes_from_data,
+    aiter_file_chunks,
+    generate_csv_bytes_from_data,
+    generate_csv_bytes_parallel,
+    iter_csv_bytes_from_data,
+    iter_file_chunks,
+    validate_data_headers,
+)
 
 
 def test_generate_csv_bytes_from_data():
@@ -24,6 +36,30 @@ def test_generate_csv_bytes_from_data_with_empty_data():
     assert "list index out of range" in str(exc_info.value)
 
 
+@pytest.mark.parametrize("use_processes", [True, False])
+def test_generate_csv_bytes_parallel(use_processes):
+    data = [{"sku": f"SKU-{i}", "title": f'"quoted", {i}\nline', "price": i / 3} for i in range(1001)]
+
+    result = generate_csv_bytes_parallel(data, chunk_rows=100, max_workers=2, use_processes=use_processes)
+
+    assert result == generate_csv_bytes_from_data(data)
+
+
+def test_generate_csv_bytes_parallel_error():
+    data = [{"sku": "1"}, {"sku": "2", "extra": "3"}]
+
+    with pytest.raises(RuntimeError, match="Error generating CSV bytes"):
+        generate_csv_bytes_parallel(data, chunk_rows=1, max_workers=2, use_processes=False)
+
+
+def test_generate_csv_bytes_parallel_single_worker(mocker):
+    pool = mocker.patch("concurrent.futures.ProcessPoolExecutor")
+    data = [{"sku": str(i)} for i in range(10)]
+
+    assert generate_csv_bytes_parallel(data, chunk_rows=2, max_workers=1) == generate_csv_bytes_from_data(data)
+    pool.assert_not_called()
+
+
 def test_validate_data_headers():
     # Sample data
     data = [{"header1": "value1", "header2": "value2"}, {"header1": "value3", "header2": "value4"}]
@@ -44,3 +80,74 @@ def test_validate_data_headers_with_missing_headers():
 
     # Optionally, you can assert the specific error message if needed
     assert "Missing mandatory header columns: header3" in str(exc_info.value)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 7, 1024])
+def test_csv_stream_decoder_matches_dict_reader(chunk_size):
+    text = 'sku,price,note\r\n1,10,"multi\nline"\n\n2,20\n3,30,x,extra\n"4""",40,y'
+    decoder = CSVStreamDecoder()
+    rows = []
+    for i in range(0, len(text), chunk_size):
+        rows.extend(decoder.decode(text[i : i + chunk_size]))
+    rows.extend(decoder.flush())
+
+    assert rows == list(csv.DictReader(StringIO(text, newline="")))
+    assert decoder.fieldnames == ["sku", "price", "note"]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 5, 1024])
+def test_csv_stream_decoder_bare_quote(chunk_size):
+    text = 'sku,title,price\nA1,TV 55" LED,10\nA2,"Quoted ""and\nwrapped""",20\nA3,12" x 8" frame,30\n'
+    decoder = CSVStreamDecoder()
+    rows = []
+    for i in range(0, len(text), chunk_size):
+        rows.extend(decoder.decode(text[i : i + chunk_size]))
+    rows.extend(decoder.flush())
+
+    assert rows == list(csv.DictReader(StringIO(text, newline="")))
+    assert rows[0]["title"] == 'TV 55" LED'
+    assert len(rows) == 3
+
+
+def test_csv_stream_decoder_unterminated_quote():
+    decoder = CSVStreamDecoder()
+    decoder.decode('sku,note\n1,"open')
+    with pytest.raises(csv.Error):
+        decoder.flush()
+
+
+def test_iter_file_chunks():
+    assert list(iter_file_chunks(BytesIO(b"abcdefg"), chunk_size=3)) == [b"abc", b"def", b"g"]
+
+
+@pytest.mark.asyncio
+async def test_aiter_file_chunks():
+    assert [chunk async for chunk in aiter_file_chunks(BytesIO(b"abcdefg"), chunk_size=3)] == [b"abc", b"def", b"g"]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 16, 1024])
+def test_iter_csv_bytes_from_data(chunk_size):
+    data = [{"header1": f"value{i}", "header2": f"with, comma {i}"} for i in range(100)]
+    chunks = list(iter_csv_bytes_from_data(iter(data), chunk_size=chunk_size))
+    assert b"".join(chunks) == generate_csv_bytes_from_data(data)
+    if chunk_size == 1:
+        assert len(chunks) == 100  # one chunk per row, the header comes with the first one
+
+
+def test_iter_csv_bytes_from_data_with_empty_data():
+    with pytest.raises(ValueError, match="No rows were provided."):
+        list(iter_csv_bytes_from_data(iter([])))
+
+
+@pytest.mark.asyncio
+async def test_aiter_csv_bytes_from_data():
+    data = [{"header1": f"value{i}", "header2": str(i)} for i in range(100)]
+
+    async def rows():
+        for row in data:
+            yield row
+
+    chunks = [chunk async for chunk in aiter_csv_bytes_from_data(rows(), chunk_size=64)]
+    assert b"".join(chunks) == generate_csv_bytes_from_data(data)
+    # Plain iterables are accepted as well
+    assert b"".join([chunk async for chunk in aiter_csv_bytes_from_data(data)]) == generate_csv_bytes_from_data(data)
@@ -0,0 +1,76 @@
+import pytest
+
+from xsellco_api.common.validation import ReportValidator, RowError
+from xsellco_api.exceptions import XsellcoAPIError, XsellcoValidationError
+
+
+def _row(sku="SKU-1", **values):
+    return {"sku": sku, "marketplace": "amazon", "merchant_id": "M1", "fba": "0", **values}
+
+
+def test_valid_rows():
+    validator = ReportValidator()
+
+    assert validator.validate([_row("1", price_min="1.5", price_max="3"), _row("2", fba="TRUE")]) == []
+    assert validator.row_count == 2
+    validator.raise_for_errors()
+
+
+def test_invalid_rows():
+    rows = [
+        _row(price_min="abc"),
+        _row("2", fba="maybe", price_max="-1"),
+        {"sku": "3", "marketplace": "amazon", "fba": "1"},
+        _row("4", price_min="5", price_max="4"),
+        _row(),
+    ]
+
+    errors = ReportValidator().validate(rows)
+
+    assert errors == [
+        RowError(1, "price_min", "not a number: 'abc'"),
+        RowError(2, "fba", "not a boolean: 'maybe'"),
+        RowError(2, "price_max", "'-1' is below 0.0"),
+        RowError(3, "merchant_id", "missing required value"),
+        RowError(4, "price_min", "price_min is above price_max"),
+        RowError(5, None, "duplicate key ('SKU-1', 'amazon', 'M1', '0')"),
+    ]
+    assert str(errors[0]) == "Row 1, column 'price_min': not a number: 'abc'"
+
+
+def test_max_price_and_max_errors():
+    validator = ReportValidator(max_price=100, max_errors=2)
+
+    errors = validator.validate(_row(str(i), price_max="200") for i in range(10))
+
+    assert len(errors) == 2
+    assert validator.row_count == 2
+    with pytest.raises(XsellcoValidationError, match="showing the first 2"):
+        validator.raise_for_errors()
+
+
+def test_iter_rows_raises_after_last_row():
+    validator = ReportValidator()
+    rows = validator.iter_rows([_row("1"), _row("1"), _row("2")])
+
+    assert [row["sku"] for row in (next(rows), next(rows), next(rows))] == ["1", "1", "2"]
+    with pytest.raises(XsellcoValidationError) as exc_info:
+        next(rows)
+    assert exc_info.value.errors == [RowError(2, None, "duplicate key ('1', 'amazon', 'M1', '0')")]
+    assert isinstance(exc_info.value, (XsellcoAPIError, ValueError))
+
+
+@pytest.mark.asyncio
+async def test_aiter_rows():
+    validator = ReportValidator()
+
+    with pytest.raises(XsellcoValidationError):
+        [row async for row in validator.aiter_rows([_row(fba="x")])]
+
+
+def test_reset():
+    validator = ReportValidator()
+    validator.validate([_row(), _row()])
+    validator.reset()
+
+    assert validator.validate([_row()]) == []
@@ -0,0 +1,39 @@
+from xsellco_api.common.cache import ResponseCache
+from xsellco_api.sync.channels import Channels
+
+
+def test_iter_channels(httpx_mock):
+    httpx_mock.add_response(
+        method="GET",
+        url="https://api.xsellco.com/v1/channels?page_limit=2&page=1&channel_type=amazon",
+        json={"data": [{"id": 1}, {"id": 2}]},
+    )
+    httpx_mock.add_response(
+        method="GET",
+        url="https://api.xsellco.com/v1/channels?page_limit=2&page=2&channel_type=amazon",
+        json={"data": [{"id": 3}]},
+    )
+
+    with Channels("username", "password") as channels:
+        assert list(channels.iter_channels(channel_type="amazon", page_limit=2)) == [{"id": 1}, {"id": 2}, {"id": 3}]
+
+
+def test_get_channel_cached(httpx_mock, mocker):
+    now = [1000.0]
+    mocker.patch("xsellco_api.common.cache.time.monotonic", side_effect=lambda: now[0])
+    url = "https://api.xsellco.com/v1/channels/1"
+    httpx_mock.add_response(method="GET", url=url, json={"id": 1}, headers={"etag": '"v1"'})
+    httpx_mock.add_response(method="GET", url=url, status_code=304, match_headers={"if-none-match": '"v1"'})
+
+    cache = ResponseCache(ttl=60)
+    with Channels("username", "password", cache=cache) as channels:
+        assert channels.get_channel(1) == {"id": 1}
+        # Served from the cache, a copy each time
+        channels.get_channel(1)["id"] = 2
+        assert channels.get_channel(1) == {"id": 1}
+        now[0] += 60
+        # Revalidated with a conditional request
+        assert channels.get_channel(1) == {"id": 1}
+
+    assert len(httpx_mock.get_requests()) == 2
+    assert cache.stats == {"hits": 2, "misses": 2, "revalidations": 1, "evictions": 0, "size": 1}
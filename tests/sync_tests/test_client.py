@@ -1,7 +1,17 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 import httpx
 import pytest
 
-from xsellco_api.exceptions import XsellcoAPIError
+from xsellco_api.common.ratelimit import RateLimiter
+from xsellco_api.common.retry import RetryPolicy
+from xsellco_api.exceptions import (
+    XsellcoAPIError,
+    XsellcoNotFoundError,
+    XsellcoRateLimitError,
+)
 from xsellco_api.sync.client import SyncClient
 
 
@@ -38,3 +48,138 @@ def test_sync_client_request_exception(httpx_mock):
     client = SyncClient("username", "password")
     with pytest.raises(XsellcoAPIError):
         client._request("GET", "test")
+
+
+@pytest.fixture
+def sleeps(mocker):
+    sleeps = []
+    mocker.patch("xsellco_api.sync.client.time.sleep", side_effect=sleeps.append)
+    return sleeps
+
+
+def test_sync_client_request_retries(httpx_mock, sleeps):
+    httpx_mock.add_response(
+        method="GET", url="https://api.xsellco.com/v1/test", status_code=429, headers={"retry-after": "2"}
+    )
+    httpx_mock.add_exception(httpx.ConnectError("Connection refused"))
+    httpx_mock.add_response(method="GET", url="https://api.xsellco.com/v1/test", json={"ok": True})
+
+    client = SyncClient("username", "password", retry=RetryPolicy(backoff_factor=1, jitter=False))
+    assert client._request("GET", "test").json() == {"ok": True}
+    assert sleeps == [2, 2]
+
+
+def test_sync_client_request_retries_exhausted(httpx_mock, sleeps):
+    for _ in range(3):
+        httpx_mock.add_response(method="GET", url="https://api.xsellco.com/v1/test", status_code=429)
+
+    client = SyncClient("username", "password", retry=RetryPolicy(max_retries=2))
+    with pytest.raises(XsellcoRateLimitError):
+        client._request("GET", "test")
+    assert len(sleeps) == 2
+
+
+def test_sync_client_request_post_not_retried(httpx_mock, sleeps):
+    httpx_mock.add_response(method="POST", url="https://api.xsellco.com/v1/test", status_code=429)
+
+    client = SyncClient("username", "password")
+    with pytest.raises(XsellcoRateLimitError):
+        client._request("POST", "test", content=b"body")
+    assert sleeps == []
+
+
+def test_sync_client_request_streamed_body_not_retried(httpx_mock, sleeps):
+    httpx_mock.add_response(method="PUT", url="https://api.xsellco.com/v1/test", status_code=503)
+
+    client = SyncClient("username", "password")
+    with pytest.raises(XsellcoAPIError):
+        client._request("PUT", "test", content=iter([b"body"]))
+    assert sleeps == []
+
+
+def test_sync_client_request_rate_limited(httpx_mock, mocker):
+    httpx_mock.add_response(method="GET", url="https://api.xsellco.com/v1/test")
+    limiter = mocker.Mock(spec=RateLimiter)
+
+    client = SyncClient("username", "password", rate_limiter=limiter)
+    client._request("GET", "test")
+    limiter.acquire.assert_called_once_with("api.xsellco.com")
+
+
+def test_sync_client_request_hooks(httpx_mock, sleeps):
+    httpx_mock.add_response(method="GET", url="https://api.xsellco.com/v1/test", status_code=503)
+    httpx_mock.add_response(method="GET", url="https://api.xsellco.com/v1/test", content=b"12345")
+    httpx_mock.add_exception(httpx.ConnectError("Connection refused"))
+    events = []
+
+    client = SyncClient("username", "password", retry=RetryPolicy(max_retries=1), hooks=[events.append])
+    client._request("GET", "test")
+    with pytest.raises(XsellcoAPIError):
+        client._request("POST", "test", content=b"body")
+
+    ok, failed = events
+    assert (ok.method, ok.endpoint, ok.host, ok.status) == ("GET", "test", "api.xsellco.com", 200)
+    assert (ok.retries, ok.request_bytes, ok.response_bytes, ok.exception) == (1, 0, 5, None)
+    assert ok.total_time > 0
+    assert (failed.method, failed.status, failed.request_bytes, failed.exception) == ("POST", None, 4, "ConnectError")
+
+
+def test_sync_client_stream_hooks(httpx_mock):
+    httpx_mock.add_response(method="GET", url="https://api.xsellco.com/v1/test", content=b"a,b\n1,2\n")
+    events = []
+
+    client = SyncClient("username", "password", hooks=[events.append])
+    with client._stream("GET", "test") as response:
+        assert not events
+        response.read()
+
+    assert [(event.status, event.response_bytes) for event in events] == [(200, 8)]
+
+
+def test_sync_client_failing_hook_is_ignored(httpx_mock):
+    httpx_mock.add_response(method="GET", url="https://api.xsellco.com/v1/test")
+
+    def hook(event):
+        raise RuntimeError
+
+    assert SyncClient("username", "password", hooks=[hook])._request("GET", "test").status_code == 200
+
+
+def test_sync_client_get_client_thread_safe(mocker):
+    created = []
+
+    def _create_client(*args, **kwargs):
+        time.sleep(0.01)
+        created.append(kwargs)
+        return mocker.Mock()
+
+    mocker.patch("xsellco_api.sync.client.httpx.Client", side_effect=_create_client)
+    client = SyncClient("username", "password")
+    barrier = threading.Barrier(8)
+
+    def _get_client():
+        barrier.wait()
+        return client._get_client()
+
+    with ThreadPoolExecutor(8) as executor:
+        clients = list(executor.map(lambda _: _get_client(), range(8)))
+
+    assert len(created) == 1
+    assert all(httpx_client is clients[0] for httpx_client in clients)
+
+
+def test_sync_client_map_requests(httpx_mock):
+    for i in range(3):
+        httpx_mock.add_response(method="GET", url=f"https://api.xsellco.com/v1/test/{i}", json={"id": i})
+    for _ in range(2):
+        httpx_mock.add_response(method="GET", url="https://api.xsellco.com/v1/test/3", status_code=404)
+
+    with SyncClient("username", "password", retry=None) as client:
+        results = client.map_requests(
+            lambda i: client._request("GET", f"test/{i}").json(), range(4), max_workers=4, return_exceptions=True
+        )
+
+        assert results[:3] == [{"id": 0}, {"id": 1}, {"id": 2}]
+        assert isinstance(results[3], XsellcoNotFoundError)
+        with pytest.raises(XsellcoNotFoundError):
+            client.map_requests(lambda i: client._request("GET", f"test/{i}"), [3])
@@ -1,5 +1,14 @@
+import gzip
+import hashlib
+
+import httpx
 import pytest
 
+from xsellco_api.common.report import RepricerReport
+from xsellco_api.common.report_cache import ReportCache
+from xsellco_api.common.snapshot import ReportSnapshotStore
+from xsellco_api.common.utils import generate_csv_bytes_from_data
+from xsellco_api.exceptions import XsellcoAuthError, XsellcoValidationError
 from xsellco_api.sync.repricers import Repricers
 
 
@@ -15,6 +24,79 @@ def test_get_report(httpx_mock):
     assert report[0] == {"header1": "value1", "header2": "value2"}
 
 
+def test_get_report_columnar(httpx_mock):
+    csv_content = "sku,price\n1,10\n2,20\n"
+    httpx_mock.add_response(method="GET", url="https://api.repricer.com/v1/repricers", content=csv_content)
+
+    report = Repricers("username", "password").get_report(format="report")
+
+    assert isinstance(report, RepricerReport)
+    assert report["price"] == ["10", "20"]
+    assert report[0] == {"sku": "1", "price": "10"}
+
+
+def test_get_report_arrow(httpx_mock):
+    pytest.importorskip("pyarrow")
+    httpx_mock.add_response(method="GET", url="https://api.repricer.com/v1/repricers", content="sku,price\n1,10\n")
+
+    table = Repricers("username", "password").get_report(format="arrow")
+
+    assert table.to_pylist() == [{"sku": "1", "price": 10}]
+
+
+def test_get_report_unsupported_format():
+    with pytest.raises(ValueError, match="Unsupported report format"):
+        Repricers("username", "password").get_report(format="xml")
+
+
+def test_upload_report_with_report(httpx_mock):
+    httpx_mock.add_response(method="POST", url="https://api.repricer.com/v1/repricers", json={"success": True})
+    rows = [{"sku": "1", "marketplace": "amazon", "merchant_id": "1", "fba": "0"}]
+
+    Repricers("username", "password").upload_report(data=RepricerReport.from_dicts(rows))
+
+    assert httpx_mock.get_request().read() == b"sku,marketplace,merchant_id,fba\n1,amazon,1,0\n"
+
+
+def test_upload_report_with_baseline(httpx_mock):
+    httpx_mock.add_response(method="POST", url="https://api.repricer.com/v1/repricers", json={"success": True})
+    baseline = [
+        {"sku": "1", "marketplace": "amazon", "merchant_id": "1", "fba": "0", "price_min": "10"},
+        {"sku": "2", "marketplace": "amazon", "merchant_id": "1", "fba": "0", "price_min": "20"},
+    ]
+    data = [dict(baseline[0]), dict(baseline[1], price_min="25")]
+
+    repricer = Repricers("username", "password")
+    assert repricer.upload_report(data=data, baseline=baseline) == {"success": True}
+    # Nothing left to upload
+    assert repricer.upload_report(data=baseline, baseline=baseline) == {}
+
+    assert httpx_mock.get_request().read() == b"sku,marketplace,merchant_id,fba,price_min\n2,amazon,1,0,25\n"
+
+
+def test_upload_report_with_baseline_and_file():
+    with pytest.raises(ValueError, match="'baseline' can only be used with 'data'."):
+        Repricers("username", "password").upload_report(file_path="report.csv", baseline=[])
+
+
+def test_iter_report(httpx_mock):
+    csv_content = "sku,price\n1,10\n2,20\n"
+    httpx_mock.add_response(method="GET", url="https://api.repricer.com/v1/repricers", content=csv_content)
+
+    with Repricers("username", "password") as repricer:
+        rows = repricer.iter_report()
+        assert next(rows) == {"sku": "1", "price": "10"}
+        assert list(rows) == [{"sku": "2", "price": "20"}]
+
+
+def test_iter_report_error(httpx_mock):
+    httpx_mock.add_response(method="GET", url="https://api.repricer.com/v1/repricers", status_code=401)
+
+    with Repricers("username", "password") as repricer:
+        with pytest.raises(XsellcoAuthError):
+            list(repricer.iter_report())
+
+
 def test_upload_report_with_data(httpx_mock):
     # Mock the response for uploading the report
     httpx_mock.add_response(method="POST", url="https://api.repricer.com/v1/repricers", json={"success": True})
@@ -26,6 +108,40 @@ def test_upload_report_with_data(httpx_mock):
     assert response == {"success": True}
 
 
+def test_upload_report_parallel_encoding(httpx_mock, mocker):
+    httpx_mock.add_response(method="POST", url="https://api.repricer.com/v1/repricers", json={"success": True})
+    data = [{"sku": str(i), "marketplace": "amazon", "merchant_id": "M1", "fba": "0"} for i in range(3)]
+    parallel = mocker.patch(
+        "xsellco_api.sync.repricers.generate_csv_bytes_parallel", return_value=generate_csv_bytes_from_data(data)
+    )
+    repricer = Repricers("username", "password")
+    repricer.parallel_csv_threshold = 2
+
+    assert repricer.upload_report(data=data) == {"success": True}
+    parallel.assert_called_once_with(data)
+    assert httpx_mock.get_request().content == generate_csv_bytes_from_data(data)
+
+
+def test_upload_report_with_iterable(httpx_mock):
+    httpx_mock.add_response(method="POST", url="https://api.repricer.com/v1/repricers", json={"success": True})
+
+    repricer = Repricers("username", "password")
+    rows = ({"sku": str(i), "marketplace": "amazon", "merchant_id": "1", "fba": "0"} for i in range(3))
+    response = repricer.upload_report(data=rows)
+
+    assert response == {"success": True}
+    assert httpx_mock.get_request().read() == (
+        b"sku,marketplace,merchant_id,fba\n0,amazon,1,0\n1,amazon,1,0\n2,amazon,1,0\n"
+    )
+
+
+def test_upload_report_with_iterable_missing_headers():
+    repricer = Repricers("username", "password")
+
+    with pytest.raises(ValueError, match="Missing mandatory header columns"):
+        repricer.upload_report(data=iter([{"sku": "1"}]))
+
+
 def test_upload_report_with_file(httpx_mock, tmp_path):
     # Create a temporary CSV file
     file_path = tmp_path / "report.csv"
@@ -40,6 +156,21 @@ def test_upload_report_with_file(httpx_mock, tmp_path):
     assert response == {"success": True}
 
 
+def test_upload_report_with_file_streams_content(httpx_mock, tmp_path):
+    file_path = tmp_path / "report.csv"
+    content = b"sku,price\n" + b"".join(b"%d,10\n" % i for i in range(50_000))
+    file_path.write_bytes(content)
+    httpx_mock.add_response(method="POST", url="https://api.repricer.com/v1/repricers", json={"success": True})
+
+    with Repricers("username", "password") as repricer:
+        repricer.upload_report(file_path=str(file_path))
+
+    request = httpx_mock.get_request()
+    assert request.headers["content-length"] == str(len(content))
+    assert "transfer-encoding" not in request.headers
+    assert request.read() == content
+
+
 def test_upload_report_no_data_no_file():
     repricer = Repricers("username", "password")
 
@@ -74,3 +205,121 @@ def test_generate_csv_bytes_data_error():
 
     with pytest.raises(Exception):
         repricer.upload_report(data=data)
+
+
+def test_snapshot_report(httpx_mock, tmp_path):
+    csv_content = "sku,marketplace,merchant_id,fba,price\nA,amazon,M1,0,10\n"
+    httpx_mock.add_response(method="GET", url="https://api.repricer.com/v1/repricers", content=csv_content)
+    store = ReportSnapshotStore(tmp_path / "snapshots.sqlite3")
+    repricer = Repricers("username", "password")
+
+    snapshot = repricer.snapshot_report(store, max_age=60)
+    # The second call reuses the fresh snapshot instead of downloading the report again
+    assert repricer.snapshot_report(store, max_age=60) == snapshot
+
+    assert snapshot.row_count == 1
+    assert store.get("A", "amazon", "M1", "0", repricer.snapshot_account)["price"] == "10"
+    assert len(httpx_mock.get_requests()) == 1
+
+
+def test_upload_report_compressed(httpx_mock, tmp_path):
+    httpx_mock.add_response(method="POST", url="https://api.repricer.com/v1/repricers", json={"success": True})
+    file_path = tmp_path / "report.csv"
+    file_path.write_bytes(b"sku,marketplace,merchant_id,fba\n" + b"1,amazon,M1,0\n" * 100)
+    repricer = Repricers("username", "password", compression="gzip")
+
+    assert repricer.upload_report(file_path=str(file_path)) == {"success": True}
+
+    request = httpx_mock.get_request()
+    assert request.headers["content-encoding"] == "gzip"
+    assert "content-length" not in request.headers
+    assert gzip.decompress(request.content) == file_path.read_bytes()
+    assert repricer.compression_stats.upload_ratio > 10
+
+
+def test_get_report_compressed(httpx_mock):
+    body = b"sku,price\n" + b"1,10\n" * 100
+    httpx_mock.add_response(
+        method="GET",
+        url="https://api.repricer.com/v1/repricers",
+        stream=httpx.ByteStream(gzip.compress(body)),
+        headers={"content-encoding": "gzip"},
+    )
+    repricer = Repricers("username", "password", compression="gzip")
+
+    assert len(repricer.get_report()) == 100
+    assert "gzip" in httpx_mock.get_request().headers["accept-encoding"]
+    assert repricer.compression_stats.decoded_bytes == len(body)
+    assert repricer.compression_stats.downloaded_bytes == len(gzip.compress(body))
+
+
+def test_unsupported_compression():
+    with pytest.raises(ValueError, match="Unsupported compression"):
+        Repricers("username", "password", compression="lz4")
+
+
+def test_upload_report_validate_list():
+    data = [
+        {"sku": "1", "marketplace": "amazon", "merchant_id": "M1", "fba": "0", "price_min": "x"},
+        {"sku": "2", "marketplace": "amazon", "merchant_id": "", "fba": "0"},
+    ]
+
+    with pytest.raises(XsellcoValidationError) as exc_info:
+        Repricers("username", "password").upload_report(data=data, validate=True)
+
+    assert [(error.row, error.column) for error in exc_info.value.errors] == [(1, "price_min"), (2, "merchant_id")]
+
+
+def test_upload_report_validate_file(tmp_path):
+    file_path = tmp_path / "report.csv"
+    file_path.write_text("sku,marketplace,merchant_id,fba\n1,amazon,M1,0\n1,amazon,M1,0\n")
+
+    with pytest.raises(XsellcoValidationError, match="Row 2: duplicate key"):
+        Repricers("username", "password").upload_report(file_path=str(file_path), validate=True)
+
+
+def test_upload_report_validate_streamed_rows(httpx_mock):
+    rows = ({"sku": "1", "marketplace": "amazon", "merchant_id": "M1", "fba": fba} for fba in ("0", "maybe"))
+
+    with pytest.raises(XsellcoValidationError, match="not a boolean"):
+        Repricers("username", "password").upload_report(data=rows, validate=True)
+
+
+def test_get_report_cached(httpx_mock, tmp_path):
+    url = "https://api.repricer.com/v1/repricers"
+    httpx_mock.add_response(method="GET", url=url, content=b"sku,price\n1,10\n", headers={"etag": '"v1"'})
+    httpx_mock.add_response(method="GET", url=url, status_code=304, match_headers={"if-none-match": '"v1"'})
+    cache = ReportCache(tmp_path)
+    repricer = Repricers("username", "password")
+
+    rows = repricer.get_report(cache=cache)
+    assert rows == [{"sku": "1", "price": "10"}]
+    assert cache.last_status[repricer.snapshot_account] == 200
+    # The report wasn't modified, it's parsed again from the cached copy so edited rows don't leak into it
+    rows[0]["price"] = "5"
+    assert repricer.get_report(cache=cache) == [{"sku": "1", "price": "10"}]
+    assert cache.last_status[repricer.snapshot_account] == 304
+    assert cache.stats == {"hits": 1, "misses": 1, "corrupted": 0}
+
+
+def test_download_report(httpx_mock, tmp_path):
+    body = b"sku,price\n" + b"1,10\n" * 100
+    httpx_mock.add_response(method="GET", url="https://api.repricer.com/v1/repricers", content=body)
+    path = tmp_path / "report.csv.gz"
+
+    download = Repricers("username", "password").download_report(path, compression="gzip")
+
+    assert gzip.decompress(path.read_bytes()) == body
+    assert download.size == len(body)
+    assert download.written == path.stat().st_size
+    assert download.sha256 == hashlib.sha256(body).hexdigest()
+
+
+def test_download_report_error(httpx_mock, tmp_path):
+    httpx_mock.add_response(method="GET", url="https://api.repricer.com/v1/repricers", status_code=401)
+    path = tmp_path / "report.csv"
+
+    with pytest.raises(XsellcoAuthError):
+        Repricers("username", "password").download_report(path)
+
+    assert not path.exists()
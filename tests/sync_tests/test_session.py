@@ -0,0 +1,49 @@
+import httpx
+import pytest
+
+from xsellco_api.async_ import AsyncSession
+from xsellco_api.sync import Channels, Repricers, Session, Users
+
+
+def test_session_shares_client_per_host():
+    with Session(warmup=False) as session:
+        channels = Channels("username", "password", session=session)
+        users = Users("username", "password", session=session)
+        repricers = Repricers("username", "password", session=session)
+
+        assert channels._get_client() is users._get_client()
+        assert repricers._get_client() is not channels._get_client()
+        assert str(repricers._get_client().base_url) == "https://api.repricer.com/v1/"
+
+        # Closing a resource leaves the shared client open
+        channels.close()
+        assert not users._get_client().is_closed
+
+
+def test_session_type_mismatch():
+    with pytest.raises(TypeError, match="Repricers needs a Session, got AsyncSession."):
+        Repricers("username", "password", session=AsyncSession(warmup=False))
+
+
+def test_session_limits():
+    session = Session(limits=httpx.Limits(max_connections=10), keepalive_expiry=30, warmup=False)
+    assert session.limits.max_connections == 10
+    assert session.limits.keepalive_expiry == 30
+
+
+def test_session_request_sends_credentials(httpx_mock):
+    httpx_mock.add_response(method="GET", url="https://api.xsellco.com/v1/users/1", json={"id": 1})
+
+    with Session(warmup=False) as session:
+        assert Users("username", "password", session=session).get_user(1) == {"id": 1}
+
+    assert httpx_mock.get_request().headers["authorization"] == httpx.BasicAuth("username", "password")._auth_header
+
+
+def test_session_warmup(httpx_mock):
+    httpx_mock.add_response(method="HEAD", url="https://api.repricer.com/v1", status_code=404)
+    httpx_mock.add_exception(httpx.ConnectError("Connection refused"), method="HEAD", url="https://api.xsellco.com/v1")
+
+    with Session() as session:
+        assert len(session._clients) == 2
+    assert session._clients == {}
@@ -0,0 +1,24 @@
+from xsellco_api.exceptions import XsellcoNotFoundError
+from xsellco_api.sync.users import Users
+
+
+def test_iter_users_max_pages(httpx_mock):
+    httpx_mock.add_response(
+        method="GET",
+        url="https://api.xsellco.com/v1/users?page_limit=1&page=1",
+        json={"data": [{"id": 1}], "last_page": 3},
+    )
+
+    with Users("username", "password") as users:
+        assert list(users.iter_users(page_limit=1, max_pages=1)) == [{"id": 1}]
+
+
+def test_get_users_by_ids(httpx_mock):
+    httpx_mock.add_response(method="GET", url="https://api.xsellco.com/v1/users/1", json={"id": 1})
+    httpx_mock.add_response(method="GET", url="https://api.xsellco.com/v1/users/2", status_code=404)
+
+    with Users("username", "password") as users:
+        result = users.get_users_by_ids([1, 2, 1])
+
+    assert result.results == {1: {"id": 1}}
+    assert isinstance(result.errors[2], XsellcoNotFoundError)
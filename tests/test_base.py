@@ -1,8 +1,8 @@
 from http import HTTPStatus
-from unittest.mock import Mock, patch
 
+import httpx
 import pytest
-from requests.exceptions import ConnectionError, HTTPError
+from requests.exceptions import ConnectionError, ReadTimeout
 
 from xsellco_api.base import BaseClient
 from xsellco_api.exceptions import (
@@ -39,12 +39,8 @@ def test_base_client_url(base_client):
     assert base_client.url == "https://api.xsellco.com/v1"
 
 
-@patch("xsellco_api.base.request")
-def test_base_client_request_success(mock_request, base_client):
-    mock_response = Mock()
-    mock_response.status_code = 200
-    mock_response.text = "success"
-    mock_request.return_value = mock_response
+def test_base_client_request_success(httpx_mock, base_client):
+    httpx_mock.add_response(method="GET", url="https://api.xsellco.com/v1/test_endpoint", text="success")
 
     response = base_client._request("GET", "test_endpoint")
 
@@ -52,6 +48,26 @@ def test_base_client_request_success(mock_request, base_client):
     assert response.text == "success"
 
 
+def test_base_client_reuses_connection_pool(httpx_mock, base_client):
+    for _ in range(2):
+        httpx_mock.add_response(method="GET", url="https://api.xsellco.com/v1/test_endpoint")
+
+    base_client._request("GET", "test_endpoint")
+    client = base_client._client
+    base_client._request("GET", "test_endpoint")
+
+    assert base_client._client is client
+    assert httpx_mock.get_requests()[0].headers["authorization"].startswith("Basic ")
+
+
+def test_base_client_request_sends_data(httpx_mock, base_client):
+    httpx_mock.add_response(method="POST", url="https://api.xsellco.com/v1/test_endpoint")
+
+    base_client._request("POST", "test_endpoint", data=b"a,b\n")
+
+    assert httpx_mock.get_request().content == b"a,b\n"
+
+
 @pytest.mark.parametrize(
     "status_code, exception",
     [
@@ -62,21 +78,44 @@ def test_base_client_request_success(mock_request, base_client):
         (400, XsellcoAPIError),
     ],
 )
-@patch("xsellco_api.base.request")
-def test_base_client_request_failures(mock_request, base_client, status_code, exception):
-    mock_response = Mock()
-    mock_response.raise_for_status.side_effect = HTTPError()
-    mock_response.status_code = status_code
-    mock_request.return_value = mock_response
+def test_base_client_request_failures(httpx_mock, base_client, status_code, exception):
+    httpx_mock.add_response(method="GET", url="https://api.xsellco.com/v1/test_endpoint", status_code=status_code)
 
     with pytest.raises(exception):
         base_client._request("GET", "test_endpoint")
 
 
-@patch("xsellco_api.base.request")
-def test_base_client_request_connection_error(mock_request, base_client):
-    # Mock the request method to raise a ConnectionError
-    mock_request.side_effect = ConnectionError("Failed to establish a new connection: [Errno 61] Connection refused")
+def test_base_client_request_unauthorized_message(httpx_mock, base_client):
+    httpx_mock.add_response(method="GET", url="https://api.xsellco.com/v1/test_endpoint", status_code=401)
+
+    with pytest.raises(XsellcoAuthError, match="Check your username and password."):
+        base_client._request("GET", "test_endpoint")
+
+
+def test_base_client_request_follows_redirects(httpx_mock, base_client):
+    httpx_mock.add_response(
+        method="GET",
+        url="https://api.xsellco.com/v1/test_endpoint",
+        status_code=302,
+        headers={"location": "https://api.xsellco.com/v1/moved"},
+    )
+    httpx_mock.add_response(method="GET", url="https://api.xsellco.com/v1/moved", json={"id": 1})
 
-    with pytest.raises(ConnectionError):
+    response = base_client._request("GET", "test_endpoint")
+
+    assert response.status_code == 200
+    assert response.json() == {"id": 1}
+
+
+@pytest.mark.parametrize(
+    "httpx_exception, exception",
+    [
+        (httpx.ConnectError("Failed to establish a new connection: [Errno 61] Connection refused"), ConnectionError),
+        (httpx.ReadTimeout("timed out"), ReadTimeout),
+    ],
+)
+def test_base_client_request_connection_error(httpx_mock, base_client, httpx_exception, exception):
+    httpx_mock.add_exception(httpx_exception)
+
+    with pytest.raises(exception):
         base_client._request("GET", "test_endpoint")
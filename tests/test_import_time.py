@@ -0,0 +1,49 @@
+import subprocess
+import sys
+
+import pytest
+
+# Generous, importing one of the heavy modules alone takes longer
+MAX_PACKAGE_IMPORT_US = 50_000
+HEAVY_MODULES = {"httpx", "requests", "asyncio", "sqlite3", "multiprocessing", "pyarrow", "pandas", "numpy"}
+
+
+def _get_imported_modules(statement):
+    """
+    Runs an import statement in a fresh interpreter with ``-X importtime``, returns the cumulative microseconds per
+    imported module.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement], capture_output=True, text=True, check=True
+    )
+    modules = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if cumulative.strip().isdigit():
+            modules[name.strip()] = int(cumulative)
+    return modules
+
+
+@pytest.mark.parametrize("package", ["xsellco_api.sync", "xsellco_api.async_", "xsellco_api.api"])
+def test_package_import_is_light(package):
+    modules = _get_imported_modules(f"import {package}")
+
+    assert not HEAVY_MODULES & set(modules)
+    assert modules[package] < MAX_PACKAGE_IMPORT_US
+
+
+@pytest.mark.parametrize(
+    "statement, expected, unexpected",
+    [
+        ("from xsellco_api.sync import Repricers", {"httpx"}, {"asyncio", "sqlite3", "multiprocessing", "requests"}),
+        ("from xsellco_api.sync import Channels, Users", {"httpx"}, {"asyncio", "requests"}),
+        ("from xsellco_api.async_ import AsyncRepricers", {"httpx", "asyncio"}, {"sqlite3", "requests"}),
+    ],
+)
+def test_dependencies_are_imported_on_first_use(statement, expected, unexpected):
+    modules = set(_get_imported_modules(statement))
+
+    assert expected <= modules
+    assert not unexpected & modules
@@ -1,10 +1,10 @@
-from unittest.mock import Mock, mock_open, patch
+from unittest.mock import mock_open, patch
 
 import pytest
 
 from xsellco_api.api import Repricers
 
-PATCH_TARGET = "xsellco_api.base.request"
+URL = "https://api.repricer.com/v1/repricers"
 
 
 @pytest.fixture
@@ -12,31 +12,27 @@ def repricers_client():
     return Repricers(user_name="test_user", password="test_password")
 
 
-def test_get_report(repricers_client):
-    mock_response = Mock()
-    mock_response.text = "header1,header2\nvalue1,value2"
+def test_get_report(httpx_mock, repricers_client):
+    httpx_mock.add_response(method="GET", url=URL, text="header1,header2\nvalue1,value2")
 
-    with patch(PATCH_TARGET, return_value=mock_response):
-        report = repricers_client.get_report()
-        assert report == [{"header1": "value1", "header2": "value2"}]
+    report = repricers_client.get_report()
+    assert report == [{"header1": "value1", "header2": "value2"}]
 
 
-def test_upload_report_data(repricers_client):
-    mock_response = Mock()
-    mock_response.json.return_value = {"status": "success"}
+def test_upload_report_data(httpx_mock, repricers_client):
+    httpx_mock.add_response(method="POST", url=URL, json={"status": "success"})
 
-    with patch(PATCH_TARGET, return_value=mock_response):
-        result = repricers_client.upload_report(data=[{"header1": "value1", "header2": "value2"}])
-        assert result == {"status": "success"}
+    result = repricers_client.upload_report(data=[{"header1": "value1", "header2": "value2"}])
+    assert result == {"status": "success"}
+    assert httpx_mock.get_request().content == b"header1,header2\nvalue1,value2\n"
 
 
-def test_upload_report_file_path(repricers_client):
-    mock_response = Mock()
-    mock_response.json.return_value = {"status": "success"}
+def test_upload_report_file_path(httpx_mock, repricers_client):
+    httpx_mock.add_response(method="POST", url=URL, json={"status": "success"})
 
-    m_open = mock_open(read_data="header1,header2\nvalue1,value2")
+    m_open = mock_open(read_data=b"header1,header2\nvalue1,value2")
 
-    with patch(PATCH_TARGET, return_value=mock_response), patch("builtins.open", m_open):
+    with patch("builtins.open", m_open):
         result = repricers_client.upload_report(file_path="mock_path.csv")
         assert result == {"status": "success"}
 
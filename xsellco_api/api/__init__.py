@@ -1,10 +1,14 @@
-import warnings
+from typing import TYPE_CHECKING
 
-from xsellco_api.common.base import DEPRECATION_MESSAGE
+from xsellco_api.common.lazy import lazy_exports
 
-# Issue a deprecation warning
-warnings.warn(DEPRECATION_MESSAGE, DeprecationWarning, stacklevel=2)
+if TYPE_CHECKING:
+    from .channels import Channels
+    from .repricers import Repricers
+    from .users import Users
 
-from .channels import Channels  # noqa
-from .repricers import Repricers  # noqa
-from .users import Users  # noqa
+# The classes warn about the deprecation when they're used, importing the package stays silent and doesn't
+# load requests
+_EXPORTS = {"Channels": ".channels", "Repricers": ".repricers", "Users": ".users"}
+__all__ = list(_EXPORTS)
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
@@ -1,4 +1,20 @@
-from .asyncchannels import AsyncChannels
-from .asyncrepricers import AsyncRepricers
-from .asyncusers import AsyncUsers
-from .client import AsyncClient
+from typing import TYPE_CHECKING
+
+from xsellco_api.common.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .asyncchannels import AsyncChannels
+    from .asyncrepricers import AsyncRepricers
+    from .asyncsession import AsyncSession
+    from .asyncusers import AsyncUsers
+    from .client import AsyncClient
+
+_EXPORTS = {
+    "AsyncChannels": ".asyncchannels",
+    "AsyncClient": ".client",
+    "AsyncRepricers": ".asyncrepricers",
+    "AsyncSession": ".asyncsession",
+    "AsyncUsers": ".asyncusers",
+}
+__all__ = list(_EXPORTS)
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
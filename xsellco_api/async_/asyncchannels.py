@@ -1,16 +1,22 @@
 from __future__ import annotations
 
-from typing import Any, Dict
+from typing import Any, AsyncIterator, Dict, Iterable, List
 
 from xsellco_api.async_.client import AsyncClient
+from xsellco_api.common.bulk import MAX_WORKERS, BulkResult, afetch_many
+from xsellco_api.common.pagination import (
+    CONCURRENCY,
+    PAGE_LIMIT,
+    aiter_pages,
+    gather_pages,
+)
 
 
 class AsyncChannels(AsyncClient):
     endpoint = "channels"
 
     async def get_channel(self, channel_id: int):
-        response = await self._request("GET", f"{self.endpoint}/{channel_id}")
-        return response.json()
+        return await self._get_json(f"{self.endpoint}/{channel_id}")
 
     async def get_channels(
         self, channel_type: str | None = None, channel_country: str | None = None, page: int = 1, page_limit: int = 100
@@ -23,3 +29,41 @@ class AsyncChannels(AsyncClient):
 
         response = await self._request("GET", endpoint=self.endpoint, params=params)
         return response.json()
+
+    def aiter_channels(
+        self,
+        channel_type: str | None = None,
+        channel_country: str | None = None,
+        page_limit: int = PAGE_LIMIT,
+        max_pages: int | None = None,
+    ) -> AsyncIterator[Dict]:
+        return aiter_pages(
+            lambda page: self.get_channels(channel_type, channel_country, page=page, page_limit=page_limit),
+            page_limit=page_limit,
+            max_pages=max_pages,
+        )
+
+    async def get_all_channels(
+        self,
+        channel_type: str | None = None,
+        channel_country: str | None = None,
+        page_limit: int = PAGE_LIMIT,
+        max_pages: int | None = None,
+        concurrency: int = CONCURRENCY,
+    ) -> List[Dict]:
+        """
+        Fetches the channels of all pages, requesting up to ``concurrency`` pages at a time.
+        """
+        return await gather_pages(
+            lambda page: self.get_channels(channel_type, channel_country, page=page, page_limit=page_limit),
+            page_limit=page_limit,
+            max_pages=max_pages,
+            concurrency=concurrency,
+        )
+
+    async def get_channels_by_ids(self, channel_ids: Iterable[int], concurrency: int = MAX_WORKERS) -> BulkResult:
+        """
+        Fetches the channels of the given (deduplicated) ids, up to ``concurrency`` at a time.
+        Returns the channels by id and, separately, the API errors of the ids that failed.
+        """
+        return await afetch_many(self.get_channel, channel_ids, concurrency=concurrency)
@@ -1,12 +1,55 @@
+from __future__ import annotations
+
+import asyncio
 import csv
 import logging
-from typing import Any, Dict, List, Optional
+import os
+from http import HTTPStatus
+from typing import (
+    IO,
+    TYPE_CHECKING,
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Union,
+)
+
+import httpx
 
 from xsellco_api.async_.client import AsyncClient
-from xsellco_api.common.utils import generate_csv_bytes_from_data, validate_data_headers
+from xsellco_api.common.bulk import BatchUploadResult
+from xsellco_api.common.columnar import read_columnar_report
+from xsellco_api.common.compression import acompress_body
+from xsellco_api.common.diff import diff_reports
+from xsellco_api.common.download import ReportDownload, ReportFileWriter
+from xsellco_api.common.report import ReportDecoder, RepricerReport, check_report_format
+from xsellco_api.common.report_cache import read_report
+from xsellco_api.common.utils import (
+    CSVStreamDecoder,
+    aiter_batches,
+    aiter_csv_bytes_from_data,
+    aiter_file_chunks,
+    aiter_rows,
+    apeek_first_row,
+    generate_csv_bytes_from_data,
+    validate_data_headers,
+)
+from xsellco_api.common.validation import ReportValidator
+from xsellco_api.exceptions import XsellcoAPIError
+
+if TYPE_CHECKING:
+    from xsellco_api.common.report_cache import ReportCache
+    from xsellco_api.common.snapshot import ReportSnapshotStore, Snapshot
 
 logger = logging.getLogger(__name__)
 
+BATCH_ROWS = 50_000
+
 
 class AsyncRepricers(AsyncClient):
     HOST = "api.repricer.com"
@@ -14,32 +57,199 @@ class AsyncRepricers(AsyncClient):
 
     REQUIRED_HEADERS = ["sku", "marketplace", "merchant_id", "fba"]
 
-    async def get_report(self) -> List[Dict]:
+    async def get_report(
+        self, format: str = "dicts", cache: Optional[ReportCache] = None
+    ) -> Union[List[Dict], RepricerReport, Any]:
+        check_report_format(format)
+        if cache is not None:
+            return read_report(await self._get_cached_report_body(cache), format)
+        if format == "dicts":
+            return [row async for row in self.aiter_report()]
+        if format == "report":
+            decoder = ReportDecoder()
+            async with self._stream("GET", self.endpoint) as response:
+                async for chunk in self._aiter_text(response):
+                    decoder.decode(chunk)
+            return decoder.flush()
         response = await self._request("GET", self.endpoint)
-        reader = csv.DictReader((line for line in response.text.splitlines()), delimiter=",")
-        return [dict(e) for e in reader]
+        self.compression_stats.record_download(response.num_bytes_downloaded, len(response.content))
+        return read_columnar_report(response.content, format)
+
+    async def _get_cached_report_body(self, cache: ReportCache) -> bytes:
+        """
+        Downloads the report body unless the server answers that the cached one is still current.
+        """
+        key = self.snapshot_account
+        cached = cache.get(key)
+        response = await self._request("GET", self.endpoint, headers=cached.conditional_headers if cached else None)
+        if response.status_code == HTTPStatus.NOT_MODIFIED and cached is not None:
+            logger.debug("Report not modified, reading the cached copy.")
+            return cache.revalidate(key, cached, response).body
+        self.compression_stats.record_download(response.num_bytes_downloaded, len(response.content))
+        cache.set(key, response)
+        return response.content
+
+    async def aiter_report(self) -> AsyncIterator[Dict]:
+        decoder = CSVStreamDecoder()
+        async with self._stream("GET", self.endpoint) as response:
+            async for chunk in self._aiter_text(response):
+                for row in decoder.decode(chunk):
+                    yield row
+        for row in decoder.flush():
+            yield row
 
-    async def upload_report(self, data: Optional[List[Dict]] = None, file_path: Optional[str] = None) -> Dict[str, Any]:
+    async def download_report(
+        self, path_or_fileobj: Union[str, os.PathLike, IO[bytes]], compression: Optional[str] = None
+    ) -> ReportDownload:
+        with ReportFileWriter(path_or_fileobj, compression) as writer:
+            async with self._stream("GET", self.endpoint) as response:
+                # Local file writes are short enough not to be worth a thread hop per chunk
+                async for chunk in response.aiter_bytes():
+                    writer.write(chunk)
+                self.compression_stats.record_download(response.num_bytes_downloaded, writer.size)
+            return writer.close()
+
+    async def snapshot_report(self, store: ReportSnapshotStore, max_age: Optional[float] = None) -> Snapshot:
+        account = self.snapshot_account
+        if max_age is not None:
+            snapshot = store.latest(account)
+            if snapshot is not None and snapshot.age < max_age:
+                logger.debug(f"Reusing report snapshot {snapshot.id} fetched {snapshot.age:.0f}s ago.")
+                return snapshot
+        return await store.awrite(self.aiter_report(), account)
+
+    @property
+    def snapshot_account(self) -> str:
+        return f"{self.user_name}@{self.HOST}"
+
+    async def upload_report(
+        self,
+        data: Optional[Union[Iterable[Dict], AsyncIterable[Dict], RepricerReport]] = None,
+        file_path: Optional[str] = None,
+        baseline: Optional[Iterable[Mapping]] = None,
+        validate: Union[bool, ReportValidator] = False,
+    ) -> Dict[str, Any]:
         if not data and not file_path:
             raise ValueError("Either 'data' or 'file_path' must be provided.")
 
         if data and file_path:
             raise ValueError("Both 'data' and 'file_path' were provided. Please provide only one.")
 
+        if baseline is not None:
+            if file_path or data is None:
+                raise ValueError("'baseline' can only be used with 'data'.")
+            current = [row async for row in aiter_rows(data)] if isinstance(data, AsyncIterable) else data
+            delta = self._get_delta(current, baseline)
+            if not delta:
+                return {}
+            data = delta
+
         headers = {"content-type": "text/plain"}
 
         try:
-            _bytes = b""
-            if data:
-                validate_data_headers(data, self.REQUIRED_HEADERS)
-                _bytes = generate_csv_bytes_from_data(data)
-            elif file_path:
-                with open(file_path, "rb") as file:
-                    _bytes = file.read()
+            if validate:
+                data = self._validate(data, file_path, validate)
 
-            response = await self._request("POST", self.endpoint, data=_bytes, headers=headers)
+            if isinstance(data, RepricerReport):
+                validate_data_headers([data[0]], self.REQUIRED_HEADERS)
+                response = await self._post_report(data.to_csv_bytes(), headers)
+            elif isinstance(data, list):
+                validate_data_headers(data, self.REQUIRED_HEADERS)
+                response = await self._post_report(generate_csv_bytes_from_data(data), headers)
+            elif data:
+                # Rows from any other (async) iterable are encoded lazily and streamed
+                first_row, rows = await apeek_first_row(data)
+                validate_data_headers([first_row], self.REQUIRED_HEADERS)
+                response = await self._post_report(aiter_csv_bytes_from_data(rows), headers)
+            else:
+                with open(file_path, "rb") as file:  # type: ignore[arg-type]
+                    headers["content-length"] = str(os.fstat(file.fileno()).st_size)
+                    response = await self._post_report(aiter_file_chunks(file), headers)
             return response.json()
 
         except (ValueError, FileNotFoundError) as known_ex:
             logger.exception(f"Known exception occurred: {known_ex}", exc_info=False)
             raise
+
+    async def upload_report_batched(
+        self,
+        rows: Union[Iterable[Dict], AsyncIterable[Dict]],
+        batch_rows: int = BATCH_ROWS,
+        concurrency: int = 4,
+    ) -> BatchUploadResult:
+        """
+        Splits the rows into CSV files of at most ``batch_rows`` rows, each with its own header, and uploads up to
+        ``concurrency`` of them at once. Only the batches being uploaded are held in memory.
+        Returns the responses of the uploaded batches and the API errors of the failed ones, with the range of row
+        numbers of each failed batch, so those can be resent on their own.
+        """
+        first_row, rows = await apeek_first_row(rows)
+        validate_data_headers([first_row], self.REQUIRED_HEADERS)
+
+        headers = {"content-type": "text/plain"}
+        results: Dict[range, Any] = {}
+        errors: Dict[range, XsellcoAPIError] = {}
+        semaphore = asyncio.Semaphore(concurrency)
+        tasks: List[asyncio.Task] = []
+
+        async def _upload(row_range: range, batch: List[Dict]) -> None:
+            try:
+                response = await self._post_report(generate_csv_bytes_from_data(batch), headers)
+                results[row_range] = response.json()
+            except XsellcoAPIError as err:
+                logger.warning(f"Upload of rows {row_range.start}-{row_range.stop - 1} failed: {err}")
+                errors[row_range] = err
+            finally:
+                semaphore.release()
+
+        start = 0
+        try:
+            async for batch in aiter_batches(rows, batch_rows):
+                await semaphore.acquire()
+                tasks.append(asyncio.create_task(_upload(range(start, start + len(batch)), batch)))
+                start += len(batch)
+            await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+
+        return BatchUploadResult(
+            [results[row_range] for row_range in sorted(results, key=lambda row_range: row_range.start)],
+            sorted(errors.items(), key=lambda item: item[0].start),
+        )
+
+    def _validate(
+        self,
+        data: Optional[Union[Iterable[Dict], AsyncIterable[Dict], RepricerReport]],
+        file_path: Optional[str],
+        validate: Union[bool, ReportValidator],
+    ) -> Optional[Union[Iterable[Dict], AsyncIterable[Dict], RepricerReport]]:
+        validator = validate if isinstance(validate, ReportValidator) else ReportValidator(self.REQUIRED_HEADERS)
+        validator.reset()
+        if isinstance(data, (list, RepricerReport)):
+            validator.validate(data)
+        elif data:
+            return validator.aiter_rows(data)
+        else:
+            with open(file_path, newline="", encoding="utf-8") as file:  # type: ignore[arg-type]
+                validator.validate(csv.DictReader(file))
+        validator.raise_for_errors()
+        return data
+
+    async def _post_report(
+        self, content: Union[bytes, AsyncIterable[bytes]], headers: Dict[str, str]
+    ) -> httpx.Response:
+        if self.compression is not None:
+            headers = {key: value for key, value in headers.items() if key != "content-length"}
+            headers["content-encoding"] = self.compression
+            content = acompress_body(content, self.compression, self.compression_stats)
+        return await self._request("POST", self.endpoint, content=content, headers=headers)
+
+    @staticmethod
+    def _get_delta(data: Iterable[Mapping], baseline: Iterable[Mapping]) -> List[Dict]:
+        diff = diff_reports(baseline, data)
+        logger.info(
+            f"Uploading {len(diff.added)} added and {len(diff.changed)} changed rows, "
+            f"{len(diff.removed)} rows were removed since the baseline."
+        )
+        return [dict(row) for row in diff.delta]
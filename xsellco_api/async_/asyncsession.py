@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+
+import httpx
+
+from xsellco_api.common.session import BaseSession
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncSession(BaseSession[httpx.AsyncClient]):
+    """
+    Connection pools shared by any number of async resource classes.
+
+    ex:
+        async with AsyncSession(http2=True) as session:
+            repricers = AsyncRepricers(user_name, password, session=session)
+            channels = AsyncChannels(user_name, password, session=session)
+    """
+
+    def get_client(self, base_url: str) -> httpx.AsyncClient:
+        client = self._clients.get(base_url)
+        if client is None:
+            client = self._clients[base_url] = httpx.AsyncClient(**self._client_kwargs(base_url))
+        return client
+
+    async def warmup(self) -> None:
+        """
+        Opens a connection to each host, so the first API calls don't pay for the TCP and TLS handshakes.
+        """
+
+        async def _warmup(host: str) -> None:
+            base_url = self.base_url(host)
+            try:
+                await self.get_client(base_url).head(base_url)
+            except httpx.HTTPError as err:
+                logger.warning(f"Warmup of {host} failed: {err}")
+
+        await asyncio.gather(*(_warmup(host) for host in self.hosts))
+
+    async def __aenter__(self):
+        if self.warmup_on_enter:
+            await self.warmup()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    async def close(self) -> None:
+        clients, self._clients = list(self._clients.values()), {}
+        for client in clients:
+            await client.aclose()
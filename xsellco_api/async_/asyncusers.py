@@ -1,14 +1,47 @@
+from typing import AsyncIterator, Dict, Iterable, List, Optional
+
 from xsellco_api.async_.client import AsyncClient
+from xsellco_api.common.bulk import MAX_WORKERS, BulkResult, afetch_many
+from xsellco_api.common.pagination import (
+    CONCURRENCY,
+    PAGE_LIMIT,
+    aiter_pages,
+    gather_pages,
+)
 
 
 class AsyncUsers(AsyncClient):
     endpoint = "users"
 
     async def get_user(self, user_id: int):
-        response = await self._request("GET", f"{self.endpoint}/{user_id}")
-        return response.json()
+        return await self._get_json(f"{self.endpoint}/{user_id}")
 
     async def get_users(self, page: int = 1, page_limit: int = 100):
         params = {"page_limit": page_limit, "page": page}
         response = await self._request("GET", endpoint=self.endpoint, params=params)
         return response.json()
+
+    def aiter_users(self, page_limit: int = PAGE_LIMIT, max_pages: Optional[int] = None) -> AsyncIterator[Dict]:
+        return aiter_pages(
+            lambda page: self.get_users(page=page, page_limit=page_limit), page_limit=page_limit, max_pages=max_pages
+        )
+
+    async def get_all_users(
+        self, page_limit: int = PAGE_LIMIT, max_pages: Optional[int] = None, concurrency: int = CONCURRENCY
+    ) -> List[Dict]:
+        """
+        Fetches the users of all pages, requesting up to ``concurrency`` pages at a time.
+        """
+        return await gather_pages(
+            lambda page: self.get_users(page=page, page_limit=page_limit),
+            page_limit=page_limit,
+            max_pages=max_pages,
+            concurrency=concurrency,
+        )
+
+    async def get_users_by_ids(self, user_ids: Iterable[int], concurrency: int = MAX_WORKERS) -> BulkResult:
+        """
+        Fetches the users of the given (deduplicated) ids, up to ``concurrency`` at a time.
+        Returns the users by id and, separately, the API errors of the ids that failed.
+        """
+        return await afetch_many(self.get_user, user_ids, concurrency=concurrency)
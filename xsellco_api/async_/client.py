@@ -1,16 +1,28 @@
+import asyncio
+import json
 import logging
-from typing import Optional, Union
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Optional, Union
 
 import httpx
 
+from xsellco_api.async_.asyncsession import AsyncSession
 from xsellco_api.common.base import BaseClient
+from xsellco_api.common.compression import aiter_response_text
 from xsellco_api.exceptions import XsellcoAPIError
 
 logger = logging.getLogger(__name__)
 
 
 class AsyncClient(BaseClient):
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        if self._session is not None and not isinstance(self._session, AsyncSession):
+            raise TypeError(f"{type(self).__name__} needs an AsyncSession, got {type(self._session).__name__}.")
+
     async def _get_client(self):
+        if self._session is not None:
+            return self._session.get_client(self.url)
         if self._client is None:
             self._client = httpx.AsyncClient(
                 base_url=self.url, headers=self.headers, auth=(self.user_name, self.password)
@@ -31,6 +43,20 @@ class AsyncClient(BaseClient):
             await self._client.aclose()
             self._client = None
 
+    async def _get_json(self, endpoint: str) -> Any:
+        """
+        GET the JSON of an endpoint, served from the response cache if there's one.
+        """
+        if self.cache is None:
+            return (await self._request("GET", endpoint)).json()
+
+        key = self._get_cache_key(endpoint)
+        entry = self.cache.get(key)
+        if entry is not None and entry.is_fresh:
+            return json.loads(entry.content)
+        response = await self._request("GET", endpoint, headers=entry.conditional_headers if entry else None)
+        return self._cache_response(key, endpoint, entry, response)
+
     async def _request(
         self,
         method: str,
@@ -39,23 +65,107 @@ class AsyncClient(BaseClient):
         params: Optional[dict] = None,
         headers: Optional[dict] = None,
         timeout: Optional[Union[float, int]] = None,
+        content=None,
     ) -> httpx.Response:
         try:
             data = data or {}
-            params = params or {}
-            all_headers = {**self.headers, **(headers or {})}
 
-            if isinstance(data, bytes):
+            if content is not None:
+                # Bytes or an async byte iterator which httpx streams to the server
+                request_args = {"content": content}
+            elif isinstance(data, bytes):
                 # If data is bytes, use the content parameter
                 request_args = {"content": data}
             else:
                 # For non-bytes data, use the json parameter if applicable
                 request_args = {"data": data} if data and method in ("POST", "PUT", "PATCH") else {}
-            client = await self._get_client()
-            response = await client.request(
-                method, f"{endpoint}".rstrip("/"), params=params, headers=all_headers, timeout=timeout, **request_args
+            response = await self._send(
+                method, endpoint, params=params, headers=headers, timeout=timeout, **request_args
             )
             return self._process_response(response)
         except httpx.RequestError as req_err:
             logger.exception(f"Request Exception: {req_err}")
             raise XsellcoAPIError(f"Request Exception: {req_err}") from req_err
+
+    @asynccontextmanager
+    async def _stream(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[dict] = None,
+        headers: Optional[dict] = None,
+        timeout: Optional[Union[float, int]] = None,
+    ) -> AsyncIterator[httpx.Response]:
+        try:
+            response = await self._send(method, endpoint, params=params, headers=headers, timeout=timeout, stream=True)
+            error = None
+            try:
+                if response.is_error:
+                    # Error messages need the body
+                    await response.aread()
+                yield self._process_response(response)
+            except httpx.HTTPError as err:
+                # Reading the body failed, error statuses are reported as such
+                error = err
+                raise
+            finally:
+                await response.aclose()
+                self._emit_event(response.request, response, error)
+        except httpx.RequestError as req_err:
+            logger.exception(f"Request Exception: {req_err}")
+            raise XsellcoAPIError(f"Request Exception: {req_err}") from req_err
+
+    def _aiter_text(self, response: httpx.Response) -> AsyncIterator[str]:
+        return aiter_response_text(response, self.compression_stats)
+
+    async def _send(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[dict] = None,
+        headers: Optional[dict] = None,
+        timeout: Optional[Union[float, int]] = None,
+        stream: bool = False,
+        **request_args,
+    ) -> httpx.Response:
+        """
+        Send a request, retrying it as the retry policy allows. The response status is left to the caller.
+        """
+        client = await self._get_client()
+        request = client.build_request(
+            method,
+            f"{endpoint}".rstrip("/"),
+            params=params or {},
+            headers={**self.headers, **(headers or {})},
+            timeout=timeout,
+            **request_args,
+        )
+        # A streamed body can't be sent twice
+        replayable = isinstance(request.stream, httpx.ByteStream)
+        timer = self._start_timer(request, endpoint, is_async=True)
+        attempt, waited = 0, 0.0
+        try:
+            while True:
+                if self.rate_limiter is not None:
+                    await self.rate_limiter.aacquire(request.url.host)
+                try:
+                    response = await client.send(request, auth=self.auth, stream=stream)
+                except httpx.TransportError:
+                    delay = self._get_retry_delay(request, attempt, waited) if replayable else None
+                    if delay is None:
+                        raise
+                else:
+                    delay = self._get_retry_delay(request, attempt, waited, response) if replayable else None
+                    if delay is None:
+                        if timer is not None and not stream:
+                            self._emit_event(request, response)
+                        return response
+                    await response.aclose()
+                await asyncio.sleep(delay)
+                attempt += 1
+                waited += delay
+                if timer is not None:
+                    timer.retry()
+        except Exception as err:
+            self._emit_event(request, exception=err)
+            raise
@@ -4,7 +4,8 @@ import warnings
 from http import HTTPStatus
 from typing import Dict, Optional, Union
 
-from requests import HTTPError, RequestException, Response, request
+import httpx
+import requests
 from requests.auth import HTTPBasicAuth
 
 from xsellco_api.common.base import DEPRECATION_MESSAGE
@@ -15,43 +16,38 @@ from xsellco_api.exceptions import (
     XsellcoRateLimitError,
     XsellcoServerError,
 )
-from xsellco_api.info import __package_name__, __version__
+from xsellco_api.sync.client import SyncClient
 
 logger = logging.getLogger(__name__)
 
+# Most specific first, the legacy API raised the requests exceptions
+REQUESTS_EXCEPTIONS = (
+    (httpx.ConnectTimeout, requests.ConnectTimeout),
+    (httpx.ReadTimeout, requests.ReadTimeout),
+    (httpx.TimeoutException, requests.Timeout),
+    (httpx.TooManyRedirects, requests.TooManyRedirects),
+    (httpx.NetworkError, requests.ConnectionError),
+    (httpx.RequestError, requests.RequestException),
+)
+
 
-class BaseClient:
+class BaseClient(SyncClient):
     """
     Base Class for Xsellco 's API.
-    """
 
-    SCHEME = "https://"
-    HOST = "api.xsellco.com"
-    API_VERSION = "v1"
-    USER_AGENT = f"python-{__package_name__}-{__version__}"
+    Kept for the deprecated xsellco_api.api classes. Requests go through the pooled httpx client of SyncClient, so
+    connections are kept alive between calls, and fail with the same exceptions as they did with requests.
+    """
 
     def __init__(self, user_name: str, password: str) -> None:
         warnings.warn(DEPRECATION_MESSAGE, DeprecationWarning, stacklevel=2)
-        self.user_name = user_name
-        self.password = password
+        super().__init__(user_name, password, retry=None)
 
     @property
     def basic_auth(self) -> HTTPBasicAuth:
         return HTTPBasicAuth(self.user_name, self.password)
 
-    @property
-    def headers(self) -> Dict[str, str]:
-        return {
-            "user-agent": self.USER_AGENT,
-            "accept": "application/json",
-            "content-type": "application/json",
-        }
-
-    @property
-    def url(self) -> str:
-        return f"{self.SCHEME}{self.HOST}/{self.API_VERSION}"
-
-    def _request(
+    def _request(  # type: ignore[override]
         self,
         method: str,
         endpoint: str,
@@ -59,7 +55,7 @@ class BaseClient:
         params: Optional[dict] = None,
         headers: Optional[dict] = None,
         timeout: Optional[Union[float, int]] = None,
-    ) -> Response:
+    ) -> httpx.Response:
         """
         Make a request to xsellco's API.
 
@@ -75,45 +71,45 @@ class BaseClient:
         :type headers: dict, optional
         :param timeout: Request timeout. Defaults to None.
         :type timeout: float or int, optional
-        :return: Response object from the requests library.
-        :rtype: Response
+        :return: Response object from the httpx library, with the same interface as the requests one.
+        :rtype: httpx.Response
         """
         data = data or {}
-        params = params or {}
-
-        all_headers = {**self.headers, **(headers or {})}
+        request_args: Dict = {}
+        if data and method in ("POST", "PUT", "PATCH"):
+            request_args = {"content": data} if isinstance(data, bytes) else {"data": data}
 
         try:
-            resp = request(
-                method,
-                url=f"{self.url}/{endpoint}",
-                params=params,
-                data=data if data and method in ("POST", "PUT", "PATCH") else None,
-                headers=all_headers,
-                auth=self.basic_auth,
-                timeout=timeout,
+            # requests followed redirects, httpx doesn't by default
+            response = self._send(
+                method, endpoint, params=params, headers=headers, timeout=timeout, follow_redirects=True, **request_args
             )
-            return self._process_response(resp)
-        except RequestException as req_ex:
+        except httpx.RequestError as req_ex:
             # Handle any HTTP request-related exceptions
             logger.exception(f"Request Exception: {req_ex}")
-            raise
+            raise self._get_requests_exception(req_ex) from req_ex
+        return self._process_response(response)
 
     @staticmethod
-    def _process_response(response: Response) -> Response:
+    def _get_requests_exception(exception: httpx.RequestError) -> requests.RequestException:
+        for httpx_exception, requests_exception in REQUESTS_EXCEPTIONS:
+            if isinstance(exception, httpx_exception):
+                return requests_exception(str(exception))
+        return requests.RequestException(str(exception))
+
+    @staticmethod
+    def _process_response(response: httpx.Response) -> httpx.Response:
         """
         Process the response from the API.
 
-        :param response: Response object from the requests library.
-        :type response: Response
-        :return response: Response object from the requests library if no errors occurred.
-        :rtype: response: Response
+        :param response: Response object from the httpx library.
+        :type response: httpx.Response
+        :return response: Response object from the httpx library if no errors occurred.
+        :rtype: response: httpx.Response
         """
 
         # Check for HTTP error status codes
-        try:
-            response.raise_for_status()
-        except HTTPError:
+        if response.is_error:
             # Handle specific status codes
             if response.status_code == HTTPStatus.UNAUTHORIZED:
                 msg = f"{HTTPStatus.UNAUTHORIZED.description} for: {response.url}. Check your username and password."
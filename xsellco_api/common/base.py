@@ -1,9 +1,18 @@
+from __future__ import annotations
+
+import json
+import logging
 from http import HTTPStatus
-from typing import Dict
+from typing import TYPE_CHECKING, Any, Dict, Hashable, List, Optional, Sequence, Tuple
 
 import httpx
 from httpx import HTTPStatusError
 
+from xsellco_api.common.cache import CacheEntry, ResponseCache
+from xsellco_api.common.compression import CompressionStats, get_available_encodings
+from xsellco_api.common.hooks import TIMER_EXTENSION, Hook, RequestTimer
+from xsellco_api.common.ratelimit import RateLimiter
+from xsellco_api.common.retry import DEFAULT_RETRY_POLICY, RetryPolicy
 from xsellco_api.exceptions import (
     XsellcoAPIError,
     XsellcoAuthError,
@@ -13,6 +22,11 @@ from xsellco_api.exceptions import (
 )
 from xsellco_api.info import __package_name__, __version__
 
+if TYPE_CHECKING:
+    from xsellco_api.common.session import BaseSession
+
+logger = logging.getLogger(__name__)
+
 DEPRECATION_MESSAGE = """The xsellco_api.api module is deprecated and will be removed in a future version.
 Please update your code to use the new async or sync modules.
 ex: from xsellco_api.sync import Repricers, Channels, Users
@@ -27,26 +41,127 @@ class BaseClient:
     API_VERSION = "v1"
     USER_AGENT = f"python-{__package_name__}-{__version__}"
 
-    def __init__(self, user_name: str, password: str) -> None:
+    def __init__(
+        self,
+        user_name: str,
+        password: str,
+        session: Optional[BaseSession] = None,
+        retry: Optional[RetryPolicy] = DEFAULT_RETRY_POLICY,
+        rate_limiter: Optional[RateLimiter] = None,
+        cache: Optional[ResponseCache] = None,
+        compression: Optional[str] = None,
+        hooks: Optional[Sequence[Hook]] = None,
+    ) -> None:
+        """
+        :param user_name: API user name.
+        :param password: API password.
+        :param session: Session whose connection pools are used instead of a client of its own.
+        :param retry: Retry policy of failed requests, None disables retries.
+        :param rate_limiter: Rate limiter every request (and retry) waits on, can be shared between clients.
+        :param cache: Response cache of single record lookups, e.g. get_channel and get_user.
+        :param compression: Content encoding of uploaded reports: "gzip", or "zstd" and "br" when the zstandard or
+            brotli package is installed. It also makes the client accept every available encoding in responses.
+        :param hooks: Callables that get a RequestEvent for every request, e.g. a MetricsRecorder.
+        """
+        available = get_available_encodings()
+        if compression is not None and compression not in available:
+            raise ValueError(f"Unsupported compression: {compression!r}. Available: {', '.join(available)}.")
         self.user_name = user_name
         self.password = password
+        self._session = session
+        self.retry = retry
+        self.rate_limiter = rate_limiter
+        self.cache = cache
+        self.compression = compression
+        self._accept_encoding = ", ".join(available)
+        self.compression_stats = CompressionStats()
+        self.hooks: List[Hook] = list(hooks or [])
         self._client = None
 
+    @property
+    def auth(self) -> Tuple[str, str]:
+        return self.user_name, self.password
+
     @property
     def headers(self) -> Dict[str, str]:
-        return {
+        headers = {
             "user-agent": self.USER_AGENT,
             "accept": "application/json",
             "content-type": "application/json",
         }
+        if self.compression is not None:
+            headers["accept-encoding"] = self._accept_encoding
+        return headers
 
     @property
     def url(self) -> str:
         return f"{self.SCHEME}{self.HOST}/{self.API_VERSION}"
 
+    def _get_cache_key(self, endpoint: str) -> Hashable:
+        return self.user_name, self.url, endpoint
+
+    def _cache_response(
+        self, key: Hashable, endpoint: str, entry: Optional[CacheEntry], response: httpx.Response
+    ) -> Any:
+        """
+        Stores or revalidates the cache entry of a response, returns the response's JSON.
+        """
+        if self.cache is None:
+            return response.json()
+        if response.status_code == HTTPStatus.NOT_MODIFIED and entry is not None:
+            entry = self.cache.revalidate(key, entry, endpoint, response)
+        else:
+            entry = self.cache.set(key, endpoint, response)
+        # The JSON is parsed on every lookup, so callers can't change the cached copy
+        return json.loads(entry.content)
+
+    def _get_retry_delay(
+        self, request: httpx.Request, attempt: int, waited: float, response: Optional[httpx.Response] = None
+    ) -> Optional[float]:
+        """
+        Returns the seconds to wait before retrying the request, or None when it shouldn't be retried.
+        """
+        if self.retry is None:
+            return None
+        delay = self.retry.get_delay(request.method, attempt, waited, response)
+        if delay is not None:
+            reason = f"HTTP {response.status_code}" if response is not None else "a network error"
+            logger.warning(f"Retrying {request.method} {request.url} after {reason} in {delay:.2f}s")
+        return delay
+
+    def _start_timer(self, request: httpx.Request, endpoint: str, is_async: bool = False) -> Optional[RequestTimer]:
+        """
+        Starts timing a request when there are hooks to report it to.
+        """
+        if not self.hooks:
+            return None
+        timer = RequestTimer(endpoint)
+        request.extensions["trace"] = timer.atrace if is_async else timer.trace
+        request.extensions[TIMER_EXTENSION] = timer
+        return timer
+
+    def _emit_event(
+        self,
+        request: httpx.Request,
+        response: Optional[httpx.Response] = None,
+        exception: Optional[BaseException] = None,
+    ) -> None:
+        timer = request.extensions.get(TIMER_EXTENSION)
+        if timer is None:
+            return
+        event = timer.get_event(request, response, exception)
+        for hook in self.hooks:
+            try:
+                hook(event)
+            except Exception:
+                logger.exception(f"Request hook {hook!r} failed")
+
     @staticmethod
     def _process_response(response: httpx.Response) -> httpx.Response:
         try:
+            if response.status_code == HTTPStatus.NOT_MODIFIED:
+                # Answer to a conditional request, the caller serves its cached copy
+                return response
             response.raise_for_status()
             return response
         except HTTPStatusError as http_err:
@@ -0,0 +1,106 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    List,
+    NamedTuple,
+    Tuple,
+)
+
+from xsellco_api.exceptions import XsellcoAPIError
+
+MAX_WORKERS = 8
+
+
+class BulkResult(NamedTuple):
+    """
+    Outcome of a bulk lookup: the records found and the errors of the ones that failed, both keyed by id.
+    """
+
+    results: Dict[Any, Any]
+    errors: Dict[Any, XsellcoAPIError]
+
+
+class BatchUploadResult(NamedTuple):
+    """
+    Merged outcome of a batched upload: the responses of the batches that were uploaded and the failures of the ones
+    that weren't, each with the range of row numbers of its batch, in row order.
+    """
+
+    responses: List[Any]
+    failures: List[Tuple[range, XsellcoAPIError]]
+
+    @property
+    def failed_ranges(self) -> List[range]:
+        """
+        The row numbers of the batches to resend.
+        """
+        return [row_range for row_range, _ in self.failures]
+
+
+def map_requests(
+    fn: Callable[[Any], Any],
+    args: Iterable[Any],
+    max_workers: int = MAX_WORKERS,
+    return_exceptions: bool = False,
+) -> List[Any]:
+    """
+    Calls ``fn`` with each of ``args`` over a thread pool, returning the results in order. Meant for sync client
+    calls, e.g. ``map_requests(channels.get_channel, ids)``: a SyncClient can be shared by threads, so they all use
+    its connection pool.
+
+    :param return_exceptions: Return API errors, e.g. XsellcoNotFoundError, in place of the results of the calls
+        that failed instead of raising the first one. Other exceptions are always raised.
+    """
+
+    def _call(arg: Any) -> Any:
+        try:
+            return fn(arg)
+        except XsellcoAPIError as err:
+            if return_exceptions:
+                return err
+            raise
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(_call, args))
+
+
+def fetch_many(fetch: Callable[[Any], Any], ids: Iterable[Hashable], max_workers: int = MAX_WORKERS) -> BulkResult:
+    """
+    Fetches a record per unique id over a thread pool. API errors, e.g. XsellcoNotFoundError, are collected per id
+    instead of failing the whole batch.
+    """
+    unique_ids = list(dict.fromkeys(ids))
+    results: Dict[Any, Any] = {}
+    errors: Dict[Any, XsellcoAPIError] = {}
+    for _id, result in zip(unique_ids, map_requests(fetch, unique_ids, max_workers, return_exceptions=True)):
+        if isinstance(result, XsellcoAPIError):
+            errors[_id] = result
+        else:
+            results[_id] = result
+    return BulkResult(results, errors)
+
+
+async def afetch_many(
+    fetch: Callable[[Any], Awaitable[Any]], ids: Iterable[Hashable], concurrency: int = MAX_WORKERS
+) -> BulkResult:
+    unique_ids = list(dict.fromkeys(ids))
+    results: Dict[Any, Any] = {}
+    errors: Dict[Any, XsellcoAPIError] = {}
+    import asyncio
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _fetch(_id: Any) -> None:
+        async with semaphore:
+            try:
+                results[_id] = await fetch(_id)
+            except XsellcoAPIError as err:
+                errors[_id] = err
+
+    await asyncio.gather(*(_fetch(_id) for _id in unique_ids))
+    return BulkResult({_id: results[_id] for _id in unique_ids if _id in results}, errors)
@@ -0,0 +1,124 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Hashable, Optional
+
+import httpx
+
+
+class CacheEntry:
+    __slots__ = ("content", "expires_at", "etag", "last_modified")
+
+    def __init__(self, content: bytes, expires_at: float, etag: Optional[str], last_modified: Optional[str]) -> None:
+        self.content = content
+        self.expires_at = expires_at
+        self.etag = etag
+        self.last_modified = last_modified
+
+    @property
+    def is_fresh(self) -> bool:
+        return time.monotonic() < self.expires_at
+
+    @property
+    def conditional_headers(self) -> Dict[str, str]:
+        headers = {}
+        if self.etag:
+            headers["if-none-match"] = self.etag
+        if self.last_modified:
+            headers["if-modified-since"] = self.last_modified
+        return headers
+
+
+class ResponseCache:
+    """
+    Size-bounded LRU cache of response bodies with a TTL per endpoint.
+
+    Expired entries are kept until evicted, so when the server sent an ``ETag`` or ``Last-Modified`` header they are
+    revalidated with a conditional request instead of being downloaded again. The cache is thread-safe and can be
+    shared by several clients, entries are keyed by account.
+
+    ex:
+        cache = ResponseCache(maxsize=10_000, ttl=60, ttl_per_endpoint={"channels": 600})
+        channels = Channels(user_name, password, cache=cache)
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 60.0, ttl_per_endpoint: Optional[Dict[str, float]] = None):
+        """
+        :param maxsize: Maximum number of cached responses.
+        :param ttl: Seconds a response is served from the cache without asking the server.
+        :param ttl_per_endpoint: TTLs overriding ``ttl`` by endpoint, e.g. ``{"channels": 600}``.
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.ttl_per_endpoint = ttl_per_endpoint or {}
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+        self.evictions = 0
+        self._entries: "OrderedDict[Hashable, CacheEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "revalidations": self.revalidations,
+            "evictions": self.evictions,
+            "size": len(self._entries),
+        }
+
+    def get(self, key: Hashable) -> Optional[CacheEntry]:
+        """
+        Returns the entry of ``key``, fresh or not, counting a hit only for a fresh one.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            if entry is not None and entry.is_fresh:
+                self.hits += 1
+            else:
+                self.misses += 1
+            return entry
+
+    def set(self, key: Hashable, endpoint: str, response: httpx.Response) -> CacheEntry:
+        entry = CacheEntry(
+            response.content,
+            time.monotonic() + self.get_ttl(endpoint),
+            response.headers.get("etag"),
+            response.headers.get("last-modified"),
+        )
+        self._store(key, entry)
+        return entry
+
+    def revalidate(self, key: Hashable, entry: CacheEntry, endpoint: str, response: httpx.Response) -> CacheEntry:
+        """
+        Renews an entry after the server answered a conditional request with 304 Not Modified.
+        """
+        entry.expires_at = time.monotonic() + self.get_ttl(endpoint)
+        entry.etag = response.headers.get("etag", entry.etag)
+        entry.last_modified = response.headers.get("last-modified", entry.last_modified)
+        self._store(key, entry)
+        with self._lock:
+            self.revalidations += 1
+        return entry
+
+    def get_ttl(self, endpoint: str) -> float:
+        # TTLs are set by resource, e.g. "channels" for "channels/123"
+        return self.ttl_per_endpoint.get(endpoint.split("/", 1)[0], self.ttl)
+
+    def _store(self, key: Hashable, entry: CacheEntry) -> None:
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
@@ -0,0 +1,107 @@
+"""
+Columnar output of repricer reports through the optional pyarrow, pandas and numpy packages.
+"""
+
+import csv
+from typing import Any, Dict, List, Optional, Union
+
+from xsellco_api.common.report import ReportDecoder, RepricerReport
+
+COLUMNAR_FORMATS = ("arrow", "pandas", "numpy")
+
+# Key columns are kept as text even when their values look like numbers, e.g. numeric SKUs
+TEXT_COLUMNS = ("sku", "marketplace", "merchant_id", "fba")
+
+INSTALL_HINTS = {
+    "pyarrow": "pip install xsellco_api[arrow]",
+    "pandas": "pip install xsellco_api[pandas]",
+    "numpy": "pip install xsellco_api[numpy]",
+}
+
+
+def read_columnar_report(body: bytes, format: str) -> Any:
+    """
+    Parses a report's CSV body into a pyarrow Table, a pandas DataFrame or a dictionary of numpy arrays.
+
+    The body is parsed by pyarrow's multithreaded CSV reader when it's installed. Otherwise it goes through the stdlib
+    ``csv`` module and numeric columns are converted in Python, which is slower but needs only pandas or numpy.
+    Columns other than the key ones are typed as numbers when all their values are numeric.
+    """
+    if format not in COLUMNAR_FORMATS:
+        raise ValueError(f"Unsupported columnar format: {format!r}. Use one of: {', '.join(COLUMNAR_FORMATS)}.")
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        if format == "arrow":
+            raise ImportError(f"format='arrow' requires pyarrow: {INSTALL_HINTS['pyarrow']}") from None
+        return _from_typed_columns(get_typed_columns(_decode(body)), format)
+
+    table = _read_arrow_table(body)
+    if format == "arrow":
+        return table
+    if format == "pandas":
+        _require("pandas")
+        return table.to_pandas()
+    return {name: column.to_numpy(zero_copy_only=False) for name, column in zip(table.column_names, table.columns)}
+
+
+def get_typed_columns(report: RepricerReport) -> Dict[str, List]:
+    """
+    Returns the report's columns, numeric ones converted to int or float. Missing values of a float column are None.
+    """
+    return {name: report[name] if name in TEXT_COLUMNS else _to_numbers(report[name]) for name in report.fieldnames}
+
+
+def _to_numbers(values: List[Optional[str]]) -> List:
+    if not any(values):
+        return values
+    if all(values):
+        try:
+            return [int(value) for value in values]  # type: ignore[arg-type]
+        except ValueError:
+            pass
+    try:
+        return [float(value) if value else None for value in values]
+    except ValueError:
+        return values
+
+
+def _decode(body: bytes) -> RepricerReport:
+    decoder = ReportDecoder()
+    decoder.decode(body.decode("UTF-8"))
+    return decoder.flush()
+
+
+def _read_arrow_table(body: bytes) -> Any:
+    import pyarrow as pa
+    from pyarrow import csv as pa_csv
+
+    # Only the key columns present in the header can be given explicit types
+    header = next(csv.reader([body.split(b"\n", 1)[0].decode("UTF-8")]), [])
+    column_types = {name: pa.string() for name in TEXT_COLUMNS if name in header}
+    return pa_csv.read_csv(pa.py_buffer(body), convert_options=pa_csv.ConvertOptions(column_types=column_types))
+
+
+def _from_typed_columns(columns: Dict[str, List], format: str) -> Union[Any, Dict[str, Any]]:
+    if format == "pandas":
+        pd = _require("pandas")
+        return pd.DataFrame(columns)
+
+    np = _require("numpy")
+    arrays = {}
+    for name, values in columns.items():
+        if values and all(isinstance(value, int) for value in values):
+            arrays[name] = np.array(values, dtype=np.int64)
+        elif values and all(value is None or isinstance(value, (int, float)) for value in values):
+            # Missing values become NaN
+            arrays[name] = np.array(values, dtype=np.float64)
+        else:
+            arrays[name] = np.array(values, dtype=object)
+    return arrays
+
+
+def _require(package: str) -> Any:
+    try:
+        return __import__(package)
+    except ImportError:
+        raise ImportError(f"This report format requires {package}: {INSTALL_HINTS[package]}") from None
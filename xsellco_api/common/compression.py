@@ -0,0 +1,219 @@
+import codecs
+import functools
+import threading
+import time
+import zlib
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Dict,
+    Iterable,
+    Iterator,
+    Optional,
+    Tuple,
+    Union,
+)
+
+import httpx
+
+# In order of preference
+CONTENT_ENCODINGS = ("zstd", "br", "gzip")
+INSTALL_HINTS = {"zstd": "zstandard", "br": "brotli"}
+DEFAULT_LEVELS = {"zstd": 3, "br": 5, "gzip": 6}
+
+
+@functools.lru_cache(maxsize=None)
+def get_available_encodings() -> Tuple[str, ...]:
+    """
+    Returns the content encodings that can be used in both directions: gzip, plus zstd and br when the zstandard and
+    brotli packages are installed. httpx decodes those responses with the same packages. Failed imports aren't
+    cached by Python, so the result is computed once.
+    """
+    available = []
+    for encoding in CONTENT_ENCODINGS:
+        try:
+            if encoding == "zstd":
+                import zstandard  # noqa: F401
+            elif encoding == "br":
+                import brotli  # noqa: F401
+        except ImportError:
+            continue
+        available.append(encoding)
+    return tuple(available)
+
+
+class _BrotliCompressor:
+    def __init__(self, level: int) -> None:
+        import brotli
+
+        self._compressor = brotli.Compressor(quality=level)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.process(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.finish()
+
+
+def get_compressor(encoding: str, level: Optional[int] = None) -> Any:
+    """
+    Returns an incremental compressor with ``compress(data)`` and ``flush()`` methods for a content encoding.
+    """
+    if encoding not in CONTENT_ENCODINGS:
+        raise ValueError(f"Unsupported content encoding: {encoding!r}. Use one of: {', '.join(CONTENT_ENCODINGS)}.")
+    level = DEFAULT_LEVELS[encoding] if level is None else level
+    if encoding == "gzip":
+        return zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    try:
+        if encoding == "zstd":
+            import zstandard
+
+            return zstandard.ZstdCompressor(level=level).compressobj()
+        return _BrotliCompressor(level)
+    except ImportError as ex:
+        raise ImportError(
+            f"The {encoding!r} content encoding needs the {INSTALL_HINTS[encoding]} package, "
+            f"install it with: pip install {INSTALL_HINTS[encoding]}"
+        ) from ex
+
+
+class CompressionStats:
+    """
+    Thread-safe counters of the bytes sent and received with and without content encoding, and of the time spent
+    compressing request bodies.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.uploaded_bytes = 0
+        self.compressed_bytes = 0
+        self.compression_time = 0.0
+        self.downloaded_bytes = 0
+        self.decoded_bytes = 0
+
+    def record_upload(self, uploaded: int, compressed: int, seconds: float) -> None:
+        with self._lock:
+            self.uploaded_bytes += uploaded
+            self.compressed_bytes += compressed
+            self.compression_time += seconds
+
+    def record_download(self, downloaded: int, decoded: int) -> None:
+        with self._lock:
+            self.downloaded_bytes += downloaded
+            self.decoded_bytes += decoded
+
+    @property
+    def upload_ratio(self) -> Optional[float]:
+        return self.uploaded_bytes / self.compressed_bytes if self.compressed_bytes else None
+
+    @property
+    def download_ratio(self) -> Optional[float]:
+        return self.decoded_bytes / self.downloaded_bytes if self.downloaded_bytes else None
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "uploaded_bytes": self.uploaded_bytes,
+                "compressed_bytes": self.compressed_bytes,
+                "compression_time": self.compression_time,
+                "upload_ratio": self.upload_ratio,
+                "downloaded_bytes": self.downloaded_bytes,
+                "decoded_bytes": self.decoded_bytes,
+                "download_ratio": self.download_ratio,
+            }
+
+
+class _StreamCompressor:
+    def __init__(self, encoding: str, stats: CompressionStats) -> None:
+        self._compressor = get_compressor(encoding)
+        self._stats = stats
+        self._uploaded = 0
+        self._compressed = 0
+        self._seconds = 0.0
+
+    def compress(self, chunk: bytes) -> bytes:
+        start = time.perf_counter()
+        compressed = self._compressor.compress(chunk)
+        self._seconds += time.perf_counter() - start
+        self._uploaded += len(chunk)
+        self._compressed += len(compressed)
+        return compressed
+
+    def flush(self) -> bytes:
+        start = time.perf_counter()
+        compressed = self._compressor.flush()
+        self._seconds += time.perf_counter() - start
+        self._compressed += len(compressed)
+        self._stats.record_upload(self._uploaded, self._compressed, self._seconds)
+        return compressed
+
+
+def compress_body(
+    content: Union[bytes, Iterable[bytes]], encoding: str, stats: CompressionStats
+) -> Union[bytes, Iterator[bytes]]:
+    """
+    Compresses a request body. Bytes are compressed at once, so the request can still be retried, byte iterators
+    are compressed chunk by chunk while they are streamed.
+    """
+    compressor = _StreamCompressor(encoding, stats)
+    if isinstance(content, bytes):
+        return compressor.compress(content) + compressor.flush()
+    return _compress_chunks(content, compressor)
+
+
+def _compress_chunks(chunks: Iterable[bytes], compressor: _StreamCompressor) -> Iterator[bytes]:
+    for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+
+def acompress_body(
+    content: Union[bytes, AsyncIterable[bytes]], encoding: str, stats: CompressionStats
+) -> Union[bytes, AsyncIterator[bytes]]:
+    compressor = _StreamCompressor(encoding, stats)
+    if isinstance(content, bytes):
+        return compressor.compress(content) + compressor.flush()
+    return _acompress_chunks(content, compressor)
+
+
+async def _acompress_chunks(chunks: AsyncIterable[bytes], compressor: _StreamCompressor) -> AsyncIterator[bytes]:
+    async for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+
+def iter_response_text(response: httpx.Response, stats: CompressionStats) -> Iterator[str]:
+    """
+    Same as ``response.iter_text()``, recording the bytes received on the wire and after content decoding.
+    """
+    decoder = codecs.getincrementaldecoder(response.encoding or "utf-8")(errors="replace")
+    decoded = 0
+    for chunk in response.iter_bytes():
+        decoded += len(chunk)
+        text = decoder.decode(chunk)
+        if text:
+            yield text
+    text = decoder.decode(b"", True)
+    if text:
+        yield text
+    stats.record_download(response.num_bytes_downloaded, decoded)
+
+
+async def aiter_response_text(response: httpx.Response, stats: CompressionStats) -> AsyncIterator[str]:
+    decoder = codecs.getincrementaldecoder(response.encoding or "utf-8")(errors="replace")
+    decoded = 0
+    async for chunk in response.aiter_bytes():
+        decoded += len(chunk)
+        text = decoder.decode(chunk)
+        if text:
+            yield text
+    text = decoder.decode(b"", True)
+    if text:
+        yield text
+    stats.record_download(response.num_bytes_downloaded, decoded)
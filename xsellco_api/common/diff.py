@@ -0,0 +1,77 @@
+from typing import (
+    Any,
+    Dict,
+    Hashable,
+    Iterable,
+    List,
+    Mapping,
+    NamedTuple,
+    Sequence,
+    Tuple,
+)
+
+REPORT_KEY = ("sku", "marketplace", "merchant_id", "fba")
+
+
+class ReportDiff(NamedTuple):
+    """
+    Rows added to, changed in and removed from a repricer report, compared to an older version of it.
+    """
+
+    added: List[Mapping]
+    changed: List[Mapping]
+    removed: List[Mapping]
+
+    @property
+    def delta(self) -> List[Mapping]:
+        """
+        Rows to upload to bring the old report up to date: the added and the changed ones.
+        """
+        return self.added + self.changed
+
+    @property
+    def is_empty(self) -> bool:
+        return not (self.added or self.changed or self.removed)
+
+
+def get_row_key(row: Mapping, key: Sequence[str] = REPORT_KEY) -> Tuple:
+    return tuple(row.get(column) for column in key)
+
+
+def get_row_digest(row: Mapping) -> int:
+    """
+    Hash of a row's values, independent of the order of its keys.
+    """
+    return hash(tuple(sorted((str(column), _hashable(value)) for column, value in row.items())))
+
+
+def diff_reports(old: Iterable[Mapping], new: Iterable[Mapping], key: Sequence[str] = REPORT_KEY) -> ReportDiff:
+    """
+    Compares two versions of a report in linear time.
+
+    The old rows are indexed by their key columns with a hash of their values, each new row is then looked up by key
+    and is changed when the hashes differ. Equal hashes are confirmed by comparing the values, so a hash collision
+    can't hide a change. When a key is repeated in the old report, its last row wins.
+
+    :param old: Rows of the previous report, e.g. as downloaded with get_report.
+    :param new: Rows of the updated report.
+    :param key: Columns identifying a row. Defaults to the repricer file's ``REQUIRED_HEADERS``.
+    """
+    index: Dict[Hashable, Tuple[int, Mapping]] = {get_row_key(row, key): (get_row_digest(row), row) for row in old}
+    added: List[Mapping] = []
+    changed: List[Mapping] = []
+    seen = set()
+    for row in new:
+        row_key = get_row_key(row, key)
+        seen.add(row_key)
+        previous = index.get(row_key)
+        if previous is None:
+            added.append(row)
+        elif previous[0] != get_row_digest(row) or previous[1] != row:
+            changed.append(row)
+    return ReportDiff(added, changed, [row for row_key, (_, row) in index.items() if row_key not in seen])
+
+
+def _hashable(value: Any) -> Hashable:
+    # Extra values of a csv.DictReader row come as a list
+    return tuple(value) if isinstance(value, list) else value
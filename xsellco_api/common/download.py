@@ -0,0 +1,93 @@
+"""
+Writing downloaded reports to files as they are received, without decoding them.
+"""
+
+import hashlib
+import os
+from pathlib import Path
+from typing import IO, Any, NamedTuple, Optional, Union
+
+from xsellco_api.common.compression import get_available_encodings, get_compressor
+
+
+class ReportDownload(NamedTuple):
+    # Bytes of the report as received and of the file, which differ when it's compressed
+    size: int
+    written: int
+    # Hex digest of the report as received, whatever the file's compression
+    sha256: str
+
+
+class ReportFileWriter:
+    """
+    Writes the chunks of a report body to a file, optionally compressing them, and hashes them on the way.
+
+    A file opened from a path is closed by the writer and removed if the download fails, a file object is left
+    open for the caller.
+
+    ex:
+        with ReportFileWriter("report.csv.gz", compression="gzip") as writer:
+            for chunk in response.iter_bytes():
+                writer.write(chunk)
+            download = writer.close()
+    """
+
+    def __init__(self, path_or_fileobj: Union[str, os.PathLike, IO[bytes]], compression: Optional[str] = None) -> None:
+        """
+        :param path_or_fileobj: Path of the file to create, or a binary file object to write to.
+        :param compression: Encoding of the file: "gzip", or "zstd" and "br" when the zstandard or brotli package is
+            installed. The file holds the report as received when it's None.
+        """
+        if compression is not None and compression not in get_available_encodings():
+            raise ValueError(
+                f"Unsupported compression: {compression!r}. Available: {', '.join(get_available_encodings())}."
+            )
+        self._compressor: Any = get_compressor(compression) if compression is not None else None
+        self._hash = hashlib.sha256()
+        self._path: Optional[Path] = None
+        if isinstance(path_or_fileobj, (str, os.PathLike)):
+            self._path = Path(path_or_fileobj)
+            self._file: IO[bytes] = open(self._path, "wb")
+        else:
+            self._file = path_or_fileobj
+        self._result: Optional[ReportDownload] = None
+        self.size = 0
+        self.written = 0
+
+    def __enter__(self) -> "ReportFileWriter":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        if self._result is None:
+            self._abort()
+
+    def write(self, chunk: bytes) -> None:
+        self._hash.update(chunk)
+        self.size += len(chunk)
+        if self._compressor is not None:
+            chunk = self._compressor.compress(chunk)
+        self._write(chunk)
+
+    def close(self) -> ReportDownload:
+        """
+        Flushes the compressor and closes a file opened from a path, returns the size and checksum of the report.
+        """
+        if self._result is None:
+            if self._compressor is not None:
+                self._write(self._compressor.flush())
+            self._file.flush()
+            if self._path is not None:
+                self._file.close()
+            self._result = ReportDownload(self.size, self.written, self._hash.hexdigest())
+        return self._result
+
+    def _write(self, data: bytes) -> None:
+        if data:
+            self._file.write(data)
+            self.written += len(data)
+
+    def _abort(self) -> None:
+        # A partial report mustn't be mistaken for a complete one
+        if self._path is not None:
+            self._file.close()
+            self._path.unlink(missing_ok=True)
@@ -0,0 +1,89 @@
+import time
+from typing import Any, Callable, Dict, NamedTuple, Optional
+
+import httpx
+
+TIMER_EXTENSION = "xsellco_api.timer"
+
+
+class RequestEvent(NamedTuple):
+    """
+    What happened to a request, passed to the client's hooks once it's done: after the response was received, or
+    closed for a streamed one, or after it failed.
+    Times are in seconds. ``connect_time`` and ``ttfb`` (time to the response headers) are None when the transport
+    doesn't report them, and ``connect_time`` also when a pooled connection was reused.
+    """
+
+    method: str
+    endpoint: str
+    host: str
+    status: Optional[int]
+    connect_time: Optional[float]
+    ttfb: Optional[float]
+    total_time: float
+    request_bytes: Optional[int]
+    response_bytes: Optional[int]
+    retries: int
+    exception: Optional[str]
+
+
+Hook = Callable[[RequestEvent], Any]
+
+
+class RequestTimer:
+    """
+    Times a request (and its retries) through httpx's trace extension.
+    """
+
+    def __init__(self, endpoint: str) -> None:
+        self.endpoint = endpoint
+        self.started = time.perf_counter()
+        self.retries = 0
+        self._attempt_started = self.started
+        self._connect_started: Optional[float] = None
+        self.connect_time: Optional[float] = None
+        self.ttfb: Optional[float] = None
+
+    def retry(self) -> None:
+        self.retries += 1
+        self._attempt_started = time.perf_counter()
+        self.connect_time = self.ttfb = None
+
+    def trace(self, event_name: str, info: Dict[str, Any]) -> None:
+        now = time.perf_counter()
+        if event_name == "connection.connect_tcp.started":
+            self._connect_started = now
+        elif event_name in ("connection.connect_tcp.complete", "connection.start_tls.complete"):
+            if self._connect_started is not None:
+                self.connect_time = now - self._connect_started
+        elif event_name.endswith(".receive_response_headers.complete"):
+            self.ttfb = now - self._attempt_started
+
+    async def atrace(self, event_name: str, info: Dict[str, Any]) -> None:
+        self.trace(event_name, info)
+
+    def get_event(
+        self,
+        request: httpx.Request,
+        response: Optional[httpx.Response] = None,
+        exception: Optional[BaseException] = None,
+    ) -> RequestEvent:
+        content_length = request.headers.get("content-length")
+        if content_length is not None:
+            request_bytes: Optional[int] = int(content_length)
+        else:
+            # A body without a length is streamed with chunked encoding, its size isn't known
+            request_bytes = 0 if isinstance(request.stream, httpx.ByteStream) else None
+        return RequestEvent(
+            method=request.method,
+            endpoint=self.endpoint,
+            host=request.url.host,
+            status=response.status_code if response is not None else None,
+            connect_time=self.connect_time,
+            ttfb=self.ttfb,
+            total_time=time.perf_counter() - self.started,
+            request_bytes=request_bytes,
+            response_bytes=response.num_bytes_downloaded if response is not None else None,
+            retries=self.retries,
+            exception=type(exception).__name__ if exception is not None else None,
+        )
@@ -0,0 +1,194 @@
+import bisect
+import threading
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+from xsellco_api.common.hooks import RequestEvent
+from xsellco_api.info import __package_name__, __version__
+
+# Seconds, the last bucket holds everything above 30
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+class Histogram:
+    """
+    Fixed-bucket histogram of observed values, cheap enough to update on every request.
+    """
+
+    def __init__(self, buckets: Sequence[float] = LATENCY_BUCKETS) -> None:
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+        if value > self.max:
+            self.max = value
+
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        Estimates a quantile as the upper bound of the bucket it falls in, the maximum for the last bucket.
+        """
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for bound, count in zip(self.buckets, self.counts):
+            seen += count
+            if seen >= rank:
+                return min(bound, self.max)
+        return self.max
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "mean": self.sum / self.count if self.count else None,
+            "p50": self.quantile(0.5),
+            "p90": self.quantile(0.9),
+            "p99": self.quantile(0.99),
+            "max": self.max if self.count else None,
+        }
+
+
+class RequestMetrics:
+    def __init__(self, buckets: Sequence[float]) -> None:
+        self.total_time = Histogram(buckets)
+        self.connect_time = Histogram(buckets)
+        self.ttfb = Histogram(buckets)
+        self.request_bytes = 0
+        self.response_bytes = 0
+        self.retries = 0
+        self.statuses: Dict[int, int] = {}
+        self.exceptions: Dict[str, int] = {}
+
+    def record(self, event: RequestEvent) -> None:
+        self.total_time.observe(event.total_time)
+        if event.connect_time is not None:
+            self.connect_time.observe(event.connect_time)
+        if event.ttfb is not None:
+            self.ttfb.observe(event.ttfb)
+        self.request_bytes += event.request_bytes or 0
+        self.response_bytes += event.response_bytes or 0
+        self.retries += event.retries
+        if event.status is not None:
+            self.statuses[event.status] = self.statuses.get(event.status, 0) + 1
+        if event.exception is not None:
+            self.exceptions[event.exception] = self.exceptions.get(event.exception, 0) + 1
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "total_time": self.total_time.stats,
+            "connect_time": self.connect_time.stats,
+            "ttfb": self.ttfb.stats,
+            "request_bytes": self.request_bytes,
+            "response_bytes": self.response_bytes,
+            "retries": self.retries,
+            "statuses": dict(self.statuses),
+            "exceptions": dict(self.exceptions),
+        }
+
+
+class MetricsRecorder:
+    """
+    Request hook that aggregates RequestEvents in memory, per method and resource. The resource is the first
+    segment of the endpoint, so "channels/1" and "channels/2" are counted together.
+
+    ex:
+        metrics = MetricsRecorder()
+        channels = Channels("user", "password", hooks=[metrics])
+        channels.get_channel(1)
+        metrics.stats  # {("GET", "channels"): {"total_time": {"count": 1, "p50": ...}, ...}}
+    """
+
+    def __init__(self, buckets: Sequence[float] = LATENCY_BUCKETS) -> None:
+        self.buckets = tuple(buckets)
+        self._lock = threading.Lock()
+        self._metrics: Dict[Tuple[str, str], RequestMetrics] = {}
+
+    def __call__(self, event: RequestEvent) -> None:
+        key = (event.method, event.endpoint.strip("/").split("/", 1)[0])
+        with self._lock:
+            metrics = self._metrics.get(key)
+            if metrics is None:
+                metrics = self._metrics[key] = RequestMetrics(self.buckets)
+            metrics.record(event)
+
+    def get(self, method: str, resource: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            metrics = self._metrics.get((method, resource))
+            return metrics.stats if metrics is not None else None
+
+    @property
+    def stats(self) -> Dict[Tuple[str, str], Dict[str, Any]]:
+        with self._lock:
+            return {key: metrics.stats for key, metrics in self._metrics.items()}
+
+    def clear(self) -> None:
+        with self._lock:
+            self._metrics.clear()
+
+
+class OpenTelemetryHook:
+    """
+    Request hook that records RequestEvents as OpenTelemetry metrics, following the HTTP client semantic
+    conventions. Needs the opentelemetry-api package, install it with: pip install xsellco_api[otel]
+
+    :param meter: Meter to create the instruments with, by default one of the global meter provider.
+    """
+
+    def __init__(self, meter: Any = None) -> None:
+        if meter is None:
+            try:
+                from opentelemetry import metrics
+            except ImportError as ex:
+                raise ImportError(
+                    "OpenTelemetryHook needs the opentelemetry-api package, "
+                    "install it with: pip install xsellco_api[otel]"
+                ) from ex
+            meter = metrics.get_meter(__package_name__, __version__)
+        self._duration = meter.create_histogram(
+            "http.client.request.duration", unit="s", description="Duration of HTTP client requests."
+        )
+        self._ttfb = meter.create_histogram(
+            "http.client.response.time_to_first_byte", unit="s", description="Time to the response headers."
+        )
+        self._connect = meter.create_histogram(
+            "http.client.connection.duration", unit="s", description="Time to establish a connection."
+        )
+        self._request_size = meter.create_counter(
+            "http.client.request.body.size", unit="By", description="Size of HTTP client request bodies."
+        )
+        self._response_size = meter.create_counter(
+            "http.client.response.body.size", unit="By", description="Size of HTTP client response bodies."
+        )
+        self._retries = meter.create_counter("http.client.request.retries", description="Retried requests.")
+
+    def __call__(self, event: RequestEvent) -> None:
+        attributes: Dict[str, Any] = {
+            "http.request.method": event.method,
+            "server.address": event.host,
+            "url.template": event.endpoint.strip("/").split("/", 1)[0],
+        }
+        if event.status is not None:
+            attributes["http.response.status_code"] = event.status
+        if event.exception is not None:
+            attributes["error.type"] = event.exception
+        elif event.status is not None and event.status >= 400:
+            attributes["error.type"] = str(event.status)
+
+        self._duration.record(event.total_time, attributes)
+        if event.ttfb is not None:
+            self._ttfb.record(event.ttfb, attributes)
+        if event.connect_time is not None:
+            self._connect.record(event.connect_time, attributes)
+        if event.request_bytes:
+            self._request_size.add(event.request_bytes, attributes)
+        if event.response_bytes:
+            self._response_size.add(event.response_bytes, attributes)
+        if event.retries:
+            self._retries.add(event.retries, attributes)
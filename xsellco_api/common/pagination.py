@@ -0,0 +1,127 @@
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+)
+
+PAGE_LIMIT = 100
+CONCURRENCY = 5
+
+LAST_PAGE_KEYS = ("last_page", "total_pages")
+
+
+def get_page_items(payload: Any) -> List[Dict]:
+    """
+    Returns the records of a page. Pages are either a bare list or an object with the records under ``data``.
+    """
+    if isinstance(payload, list):
+        return payload
+    if isinstance(payload, dict) and isinstance(payload.get("data"), list):
+        return payload["data"]
+    return []
+
+
+def get_last_page(payload: Any) -> Optional[int]:
+    """
+    Returns the number of the last page if the page carries pagination metadata, otherwise None.
+    """
+    if not isinstance(payload, dict):
+        return None
+    for meta in (payload, payload.get("meta"), payload.get("pagination")):
+        if not isinstance(meta, dict):
+            continue
+        if isinstance(meta.get("pagination"), dict):
+            meta = meta["pagination"]
+        for key in LAST_PAGE_KEYS:
+            if isinstance(meta.get(key), int):
+                return meta[key]
+    return None
+
+
+def is_last_page(payload: Any, page: int, page_limit: int) -> bool:
+    last_page = get_last_page(payload)
+    if last_page is not None:
+        return page >= last_page
+    # Without metadata a short page is the last one
+    return len(get_page_items(payload)) < page_limit
+
+
+def iter_pages(
+    fetch_page: Callable[[int], Any], page_limit: int = PAGE_LIMIT, max_pages: Optional[int] = None, start_page: int = 1
+) -> Iterator[Dict]:
+    """
+    Yields the records of consecutive pages, starting from the first one. A page is fetched only when the records
+    of the previous one are used up, so breaking out of the loop stops any further requests.
+
+    :param fetch_page: Called with the page number, returns the page payload.
+    :param page_limit: Number of records per page.
+    :param max_pages: Stop after this page. Defaults to all pages.
+    :param start_page: The first page to fetch.
+    """
+    page = start_page
+    while max_pages is None or page <= max_pages:
+        payload = fetch_page(page)
+        yield from get_page_items(payload)
+        if is_last_page(payload, page, page_limit):
+            break
+        page += 1
+
+
+async def aiter_pages(
+    fetch_page: Callable[[int], Awaitable[Any]],
+    page_limit: int = PAGE_LIMIT,
+    max_pages: Optional[int] = None,
+    start_page: int = 1,
+) -> AsyncIterator[Dict]:
+    page = start_page
+    while max_pages is None or page <= max_pages:
+        payload = await fetch_page(page)
+        for item in get_page_items(payload):
+            yield item
+        if is_last_page(payload, page, page_limit):
+            break
+        page += 1
+
+
+async def gather_pages(
+    fetch_page: Callable[[int], Awaitable[Any]],
+    page_limit: int = PAGE_LIMIT,
+    max_pages: Optional[int] = None,
+    concurrency: int = CONCURRENCY,
+) -> List[Dict]:
+    """
+    Fetches the first page to learn the page count, then the remaining pages concurrently with at most
+    ``concurrency`` requests in flight. Records are returned in page order.
+    When the API doesn't report the page count, the remaining pages are fetched one after another.
+    """
+    if concurrency < 1:
+        raise ValueError("'concurrency' must be at least 1.")
+
+    first_page = await fetch_page(1)
+    records = list(get_page_items(first_page))
+    if is_last_page(first_page, 1, page_limit) or max_pages == 1:
+        return records
+
+    last_page = get_last_page(first_page)
+    if last_page is None:
+        records.extend([record async for record in aiter_pages(fetch_page, page_limit, max_pages, start_page=2)])
+        return records
+
+    if max_pages is not None:
+        last_page = min(last_page, max_pages)
+    import asyncio
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _fetch_page(page: int) -> List[Dict]:
+        async with semaphore:
+            return get_page_items(await fetch_page(page))
+
+    for page_records in await asyncio.gather(*(_fetch_page(page) for page in range(2, last_page + 1))):
+        records.extend(page_records)
+    return records
@@ -0,0 +1,102 @@
+import threading
+import time
+from typing import Dict, Optional, Tuple, Union
+
+
+class TokenBucket:
+    """
+    Token bucket refilled at ``rate`` tokens per second, holding at most ``capacity`` tokens.
+
+    Tokens are reserved under a lock and the caller then waits outside of it, so one bucket can be shared by threads
+    and asyncio tasks alike. Reservations are served in order, a burst beyond the capacity is spread out evenly.
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None) -> None:
+        """
+        :param rate: Tokens added per second, i.e. the sustained requests per second.
+        :param capacity: Maximum burst size. Defaults to one second worth of tokens, at least 1.
+        """
+        if rate <= 0:
+            raise ValueError("'rate' must be positive.")
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self, tokens: float = 1.0) -> float:
+        """
+        Takes ``tokens`` from the bucket and returns the seconds to wait until they are available.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= tokens
+            return max(0.0, -self._tokens / self.rate)
+
+    def acquire(self, tokens: float = 1.0) -> None:
+        delay = self.reserve(tokens)
+        if delay:
+            time.sleep(delay)
+
+    async def aacquire(self, tokens: float = 1.0) -> None:
+        delay = self.reserve(tokens)
+        if delay:
+            import asyncio
+
+            await asyncio.sleep(delay)
+
+
+class RateLimiter:
+    """
+    Client-side request rate limits per host, shared by every client it's passed to.
+
+    ex:
+        limiter = RateLimiter(rate=10, per_host={"api.repricer.com": (1, 5)})
+        repricers = Repricers(user_name, password, rate_limiter=limiter)
+        channels = Channels(user_name, password, rate_limiter=limiter)
+    """
+
+    def __init__(
+        self,
+        rate: Optional[float] = None,
+        capacity: Optional[float] = None,
+        per_host: Optional[Dict[str, Union[TokenBucket, float, Tuple[float, float]]]] = None,
+    ) -> None:
+        """
+        :param rate: Requests per second of hosts without a limit of their own. Defaults to no limit.
+        :param capacity: Burst size of hosts without a limit of their own.
+        :param per_host: Limits per host, given as a bucket, a rate or a (rate, capacity) pair.
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+        for host, limit in (per_host or {}).items():
+            if isinstance(limit, TokenBucket):
+                self._buckets[host] = limit
+            elif isinstance(limit, tuple):
+                self._buckets[host] = TokenBucket(*limit)
+            else:
+                self._buckets[host] = TokenBucket(limit)
+
+    def get_bucket(self, host: str) -> Optional[TokenBucket]:
+        bucket = self._buckets.get(host)
+        if bucket is None and self.rate is not None:
+            with self._lock:
+                bucket = self._buckets.setdefault(host, TokenBucket(self.rate, self.capacity))
+        return bucket
+
+    def acquire(self, host: str) -> None:
+        """
+        Blocks until a request to ``host`` is allowed.
+        """
+        bucket = self.get_bucket(host)
+        if bucket is not None:
+            bucket.acquire()
+
+    async def aacquire(self, host: str) -> None:
+        bucket = self.get_bucket(host)
+        if bucket is not None:
+            await bucket.aacquire()
@@ -0,0 +1,185 @@
+import csv
+from collections.abc import Mapping
+from io import StringIO
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Union,
+    overload,
+)
+
+from xsellco_api.common.utils import CSVStreamDecoder
+
+REPORT_FORMATS = ("dicts", "report", "arrow", "pandas", "numpy")
+
+
+def check_report_format(format: str) -> None:
+    if format not in REPORT_FORMATS:
+        raise ValueError(f"Unsupported report format: {format!r}. Use one of: {', '.join(REPORT_FORMATS)}.")
+
+
+class ReportRow(Mapping):
+    """
+    Read-only view of a single row of a RepricerReport. Values are looked up in the report's columns on access.
+    """
+
+    __slots__ = ("_report", "_index")
+
+    def __init__(self, report: "RepricerReport", index: int) -> None:
+        self._report = report
+        self._index = index
+
+    def __getitem__(self, column: str) -> Optional[str]:
+        return self._report._columns[column][self._index]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._report._columns)
+
+    def __len__(self) -> int:
+        return len(self._report._columns)
+
+    def __repr__(self) -> str:
+        return f"ReportRow({self.to_dict()!r})"
+
+    def to_dict(self) -> Dict[str, Optional[str]]:
+        return {name: column[self._index] for name, column in self._report._columns.items()}
+
+
+class RepricerReport:
+    """
+    Column-oriented repricer report.
+
+    Values are kept in one list per column instead of one dictionary per row, which saves the per-row dictionary
+    and repeated keys. Indexing returns a ReportRow view by position, a sliced report by slice, or a whole column
+    by name.
+
+    ex:
+        report = repricers.get_report(format="report")
+        prices = report["price_min"]
+        for row in report[:10]:
+            print(row["sku"], row["price_min"])
+    """
+
+    def __init__(self, fieldnames: Iterable[str] = (), columns: Optional[Dict[str, List[Optional[str]]]] = None):
+        """
+        :param fieldnames: Column names, used when ``columns`` isn't given.
+        :param columns: Values by column name, all of the same length.
+        """
+        self._columns: Dict[str, List[Optional[str]]] = (
+            columns if columns is not None else {name: [] for name in fieldnames}
+        )
+        lengths = {len(column) for column in self._columns.values()}
+        if len(lengths) > 1:
+            raise ValueError("All columns must have the same length.")
+        self._length = lengths.pop() if lengths else 0
+
+    @classmethod
+    def from_dicts(cls, rows: Iterable[Mapping]) -> "RepricerReport":
+        """
+        Builds a report from row dictionaries, columns are taken from the keys of the first row.
+        """
+        report = None
+        for row in rows:
+            if report is None:
+                report = cls(row.keys())
+            report.append(row)
+        return report if report is not None else cls()
+
+    @property
+    def fieldnames(self) -> List[str]:
+        return list(self._columns)
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __iter__(self) -> Iterator[ReportRow]:
+        return (ReportRow(self, index) for index in range(self._length))
+
+    @overload
+    def __getitem__(self, key: int) -> ReportRow: ...
+
+    @overload
+    def __getitem__(self, key: slice) -> "RepricerReport": ...
+
+    @overload
+    def __getitem__(self, key: str) -> List[Optional[str]]: ...
+
+    def __getitem__(self, key: Union[int, slice, str]) -> Any:
+        if isinstance(key, str):
+            return self._columns[key]
+        if isinstance(key, slice):
+            return RepricerReport(columns={name: column[key] for name, column in self._columns.items()})
+        index = key + self._length if key < 0 else key
+        if not 0 <= index < self._length:
+            raise IndexError("report index out of range")
+        return ReportRow(self, index)
+
+    def __repr__(self) -> str:
+        return f"RepricerReport(rows={self._length}, fieldnames={self.fieldnames!r})"
+
+    def column(self, name: str) -> List[Optional[str]]:
+        return self._columns[name]
+
+    def append(self, row: Mapping) -> None:
+        """
+        Adds a row, keys that aren't columns of the report are ignored and missing ones are set to None.
+        """
+        for name, column in self._columns.items():
+            column.append(row.get(name))
+        self._length += 1
+
+    def append_values(self, values: Sequence[Optional[str]]) -> None:
+        """
+        Adds a row given as values in column order, missing values are set to None and extra ones are ignored.
+        """
+        size = len(values)
+        for index, column in enumerate(self._columns.values()):
+            column.append(values[index] if index < size else None)
+        self._length += 1
+
+    def iter_dicts(self) -> Iterator[Dict[str, Optional[str]]]:
+        names = self.fieldnames
+        return (dict(zip(names, values)) for values in zip(*self._columns.values()))
+
+    def to_dicts(self) -> List[Dict[str, Optional[str]]]:
+        return list(self.iter_dicts())
+
+    def to_csv_bytes(self) -> bytes:
+        """
+        Encodes the report as UTF-8 CSV, the same as ``generate_csv_bytes_from_data(report.to_dicts())``.
+        """
+        with StringIO(newline="") as csvfile:
+            writer = csv.writer(csvfile, lineterminator="\n")
+            writer.writerow(self._columns)
+            writer.writerows(zip(*self._columns.values()))
+            return csvfile.getvalue().encode("UTF-8")
+
+
+class ReportDecoder:
+    """
+    Incrementally decodes CSV text into a RepricerReport, without building a dictionary per row.
+    """
+
+    def __init__(self) -> None:
+        self._decoder = CSVStreamDecoder(as_dicts=False)
+        self._report: Optional[RepricerReport] = None
+
+    def decode(self, chunk: str) -> None:
+        self._append(self._decoder.decode(chunk))
+
+    def flush(self) -> RepricerReport:
+        self._append(self._decoder.flush())
+        return self._report if self._report is not None else RepricerReport(self._decoder.fieldnames or ())
+
+    def _append(self, rows: List[List[str]]) -> None:
+        if not rows:
+            return
+        if self._report is None:
+            self._report = RepricerReport(self._decoder.fieldnames or ())
+        for values in rows:
+            self._report.append_values(values)
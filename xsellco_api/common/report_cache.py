@@ -0,0 +1,194 @@
+"""
+On-disk cache of downloaded repricer reports, revalidated with conditional requests.
+"""
+
+import gzip
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import zlib
+from http import HTTPStatus
+from pathlib import Path
+from typing import Any, Dict, NamedTuple, Optional, Union
+
+import httpx
+
+from xsellco_api.common.columnar import COLUMNAR_FORMATS, read_columnar_report
+from xsellco_api.common.report import ReportDecoder, check_report_format
+from xsellco_api.common.utils import CSVStreamDecoder
+
+logger = logging.getLogger(__name__)
+
+# Cache files start with this line, then a JSON header line and the gzip-compressed body
+MAGIC = b"xsellco-report-cache 1\n"
+SUFFIX = ".report"
+CORRUPTION_ERRORS = (ValueError, KeyError, TypeError, OSError, EOFError, zlib.error)
+
+
+class CachedReport(NamedTuple):
+    etag: Optional[str]
+    last_modified: Optional[str]
+    body: bytes
+    sha256: str
+
+    @property
+    def conditional_headers(self) -> Dict[str, str]:
+        headers = {}
+        if self.etag:
+            headers["if-none-match"] = self.etag
+        if self.last_modified:
+            headers["if-modified-since"] = self.last_modified
+        return headers
+
+
+class ReportCache:
+    """
+    Directory of report downloads, one gzip-compressed file per account and host.
+
+    Reports are stored with their ``ETag`` and ``Last-Modified`` headers, so the next download is a conditional
+    request and an unchanged report is read from disk instead. A checksum of the body is verified on every read,
+    corrupted or truncated files are discarded. Files are replaced atomically, so a cache directory can be shared
+    by threads and processes.
+
+    Every call of ``get_report`` parses the report into new objects, which can be changed freely. ``last_status``
+    tells whether the last download of an account was 200 or 304 Not Modified, e.g. to skip processing an unchanged
+    report.
+
+    ex:
+        cache = ReportCache("~/.cache/xsellco")
+        rows = repricers.get_report(cache=cache)
+        if cache.last_status[repricers.snapshot_account] == HTTPStatus.NOT_MODIFIED:
+            ...
+    """
+
+    def __init__(self, directory: Union[str, os.PathLike], compresslevel: int = 6) -> None:
+        """
+        :param directory: Directory of the cache files, created if it doesn't exist.
+        :param compresslevel: gzip compression level of the cached bodies.
+        """
+        self.directory = Path(directory).expanduser()
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.compresslevel = compresslevel
+        self.hits = 0
+        self.misses = 0
+        self.corrupted = 0
+        self.last_status: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses, "corrupted": self.corrupted}
+
+    def get_path(self, key: str) -> Path:
+        # Keys contain user names, which aren't safe file names
+        return self.directory / f"{hashlib.sha256(key.encode('UTF-8')).hexdigest()}{SUFFIX}"
+
+    def get(self, key: str) -> Optional[CachedReport]:
+        """
+        Returns the cached report of ``key``, or None when there's none or its file is corrupted.
+        """
+        path = self.get_path(key)
+        try:
+            data = path.read_bytes()
+        except FileNotFoundError:
+            return None
+        try:
+            return self._load(data)
+        except CORRUPTION_ERRORS as err:
+            logger.warning(f"Discarding corrupted report cache file {path}: {err!r}")
+            self.discard(key)
+            with self._lock:
+                self.corrupted += 1
+            return None
+
+    def set(self, key: str, response: httpx.Response) -> Optional[CachedReport]:
+        """
+        Stores a downloaded report. Reports without an ``ETag`` or ``Last-Modified`` header can't be revalidated, so
+        they aren't stored and None is returned.
+        """
+        body = response.content
+        report = CachedReport(
+            response.headers.get("etag"), response.headers.get("last-modified"), body, hashlib.sha256(body).hexdigest()
+        )
+        with self._lock:
+            self.misses += 1
+            self.last_status[key] = response.status_code
+        if not report.conditional_headers:
+            logger.debug("Not caching a report without an ETag or Last-Modified header.")
+            self.discard(key)
+            return None
+        self._store(key, report)
+        return report
+
+    def revalidate(self, key: str, report: CachedReport, response: httpx.Response) -> CachedReport:
+        """
+        Returns the cached report after the server answered a conditional request with 304 Not Modified.
+        """
+        with self._lock:
+            self.hits += 1
+            self.last_status[key] = HTTPStatus.NOT_MODIFIED
+        revalidated = report._replace(
+            etag=response.headers.get("etag", report.etag),
+            last_modified=response.headers.get("last-modified", report.last_modified),
+        )
+        if revalidated.conditional_headers != report.conditional_headers:
+            self._store(key, revalidated)
+        return revalidated
+
+    def discard(self, key: str) -> None:
+        self.get_path(key).unlink(missing_ok=True)
+
+    def clear(self) -> None:
+        for path in self.directory.glob(f"*{SUFFIX}"):
+            path.unlink(missing_ok=True)
+        with self._lock:
+            self.last_status.clear()
+
+    def _store(self, key: str, report: CachedReport) -> None:
+        header = {
+            "etag": report.etag,
+            "last_modified": report.last_modified,
+            "size": len(report.body),
+            "sha256": report.sha256,
+        }
+        data = MAGIC + json.dumps(header).encode("UTF-8") + b"\n" + gzip.compress(report.body, self.compresslevel)
+        # Readers never see a partially written file
+        fd, temp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as file:
+                file.write(data)
+            os.replace(temp_path, self.get_path(key))
+        except BaseException:
+            Path(temp_path).unlink(missing_ok=True)
+            raise
+
+    @staticmethod
+    def _load(data: bytes) -> CachedReport:
+        if not data.startswith(MAGIC):
+            raise ValueError("Not a report cache file")
+        _, header_line, compressed = data.split(b"\n", 2)
+        header = json.loads(header_line)
+        body = gzip.decompress(compressed)
+        sha256 = hashlib.sha256(body).hexdigest()
+        if len(body) != header["size"] or sha256 != header["sha256"]:
+            raise ValueError("Checksum mismatch")
+        return CachedReport(header["etag"], header["last_modified"], body, sha256)
+
+
+def read_report(body: bytes, format: str = "dicts") -> Any:
+    """
+    Parses a report's CSV body into any of the formats of ``get_report``.
+    """
+    check_report_format(format)
+    if format in COLUMNAR_FORMATS:
+        return read_columnar_report(body, format)
+    text = body.decode("UTF-8")
+    if format == "report":
+        report_decoder = ReportDecoder()
+        report_decoder.decode(text)
+        return report_decoder.flush()
+    decoder = CSVStreamDecoder()
+    return decoder.decode(text) + decoder.flush()
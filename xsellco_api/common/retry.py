@@ -0,0 +1,103 @@
+import random
+import time
+from email.utils import parsedate_to_datetime
+from http import HTTPStatus
+from typing import Iterable, Optional
+
+import httpx
+
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+RETRY_STATUSES = frozenset(
+    {
+        HTTPStatus.TOO_MANY_REQUESTS,
+        HTTPStatus.INTERNAL_SERVER_ERROR,
+        HTTPStatus.BAD_GATEWAY,
+        HTTPStatus.SERVICE_UNAVAILABLE,
+        HTTPStatus.GATEWAY_TIMEOUT,
+    }
+)
+
+
+class RetryPolicy:
+    """
+    Decides whether a failed request is retried and how long to wait before that.
+
+    Requests failing with a network error or one of ``statuses`` are retried up to ``max_retries`` times, waiting
+    the time given by the ``Retry-After`` header or else an exponential backoff with full jitter.
+    The total time spent waiting on a single call is capped by ``budget``.
+    """
+
+    def __init__(
+        self,
+        max_retries: int = 3,
+        backoff_factor: float = 0.5,
+        max_backoff: float = 30.0,
+        budget: float = 60.0,
+        jitter: bool = True,
+        respect_retry_after: bool = True,
+        methods: Iterable[str] = IDEMPOTENT_METHODS,
+        statuses: Iterable[int] = RETRY_STATUSES,
+    ) -> None:
+        """
+        :param max_retries: Maximum number of retries of a single call.
+        :param backoff_factor: The n-th retry waits up to ``backoff_factor * 2 ** n`` seconds.
+        :param max_backoff: Upper bound of the backoff, in seconds.
+        :param budget: Maximum total seconds spent waiting on retries of a single call.
+        :param jitter: Pick the backoff randomly between 0 and its upper bound.
+        :param respect_retry_after: Wait as long as the ``Retry-After`` header says, if present.
+        :param methods: HTTP methods that are retried. Defaults to idempotent ones.
+        :param statuses: HTTP statuses that are retried.
+        """
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.budget = budget
+        self.jitter = jitter
+        self.respect_retry_after = respect_retry_after
+        self.methods = frozenset(method.upper() for method in methods)
+        self.statuses = frozenset(statuses)
+
+    def get_delay(
+        self, method: str, attempt: int, waited: float = 0.0, response: Optional[httpx.Response] = None
+    ) -> Optional[float]:
+        """
+        Returns the seconds to wait before retrying, or None when the request shouldn't be retried.
+
+        :param method: HTTP method of the request.
+        :param attempt: Number of retries made so far.
+        :param waited: Seconds already spent waiting on retries.
+        :param response: The response, None when the request failed with a network error.
+        """
+        if attempt >= self.max_retries or method.upper() not in self.methods:
+            return None
+        if response is not None and response.status_code not in self.statuses:
+            return None
+
+        delay = self.get_retry_after(response) if self.respect_retry_after and response is not None else None
+        if delay is None:
+            delay = min(self.max_backoff, self.backoff_factor * 2**attempt)
+            if self.jitter:
+                delay = random.uniform(0, delay)
+        if waited + delay > self.budget:
+            return None
+        return delay
+
+    @staticmethod
+    def get_retry_after(response: httpx.Response) -> Optional[float]:
+        """
+        Parses the ``Retry-After`` header, given either in seconds or as an HTTP date.
+        """
+        value = response.headers.get("retry-after")
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+        except (TypeError, ValueError):
+            return None
+
+
+DEFAULT_RETRY_POLICY = RetryPolicy()
@@ -0,0 +1,60 @@
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Generic, Iterable, Optional, TypeVar
+
+import httpx
+
+from xsellco_api.common.base import BaseClient
+
+ClientT = TypeVar("ClientT", httpx.Client, httpx.AsyncClient)
+
+
+class BaseSession(ABC, Generic[ClientT]):
+    """
+    Shares pooled connections between resource classes, e.g. Repricers, Channels and Users.
+
+    One httpx client (and so one connection pool) is kept per host. Credentials are sent with every request,
+    so resources of different accounts can use the same session.
+    """
+
+    HOSTS = ("api.repricer.com", BaseClient.HOST)
+
+    def __init__(
+        self,
+        limits: Optional[httpx.Limits] = None,
+        keepalive_expiry: Optional[float] = None,
+        http2: bool = False,
+        hosts: Optional[Iterable[str]] = None,
+        warmup: bool = True,
+    ) -> None:
+        """
+        :param limits: Connection pool limits of each host. Defaults to httpx's defaults.
+        :param keepalive_expiry: Seconds an idle connection is kept alive, overrides the one of ``limits``.
+        :param http2: Use HTTP/2 when the server supports it, requires ``httpx[http2]``.
+        :param hosts: Hosts connected to on warmup. Defaults to the Repricer and eDesk API hosts.
+        :param warmup: Open a connection to each of ``hosts`` when entering the session's context.
+        """
+        limits = limits or httpx.Limits(max_connections=100, max_keepalive_connections=20)
+        if keepalive_expiry is not None:
+            limits = httpx.Limits(
+                max_connections=limits.max_connections,
+                max_keepalive_connections=limits.max_keepalive_connections,
+                keepalive_expiry=keepalive_expiry,
+            )
+        self.limits = limits
+        self.http2 = http2
+        self.hosts = tuple(hosts or self.HOSTS)
+        self.warmup_on_enter = warmup
+        self._clients: Dict[str, ClientT] = {}
+
+    @abstractmethod
+    def get_client(self, base_url: str) -> ClientT:
+        """
+        Returns the client of a base URL, created on first use.
+        """
+
+    @staticmethod
+    def base_url(host: str) -> str:
+        return f"{BaseClient.SCHEME}{host}/{BaseClient.API_VERSION}"
+
+    def _client_kwargs(self, base_url: str) -> Dict[str, Any]:
+        return {"base_url": base_url, "limits": self.limits, "http2": self.http2}
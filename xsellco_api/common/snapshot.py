@@ -0,0 +1,299 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from typing import (
+    Any,
+    AsyncIterable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from xsellco_api.common.diff import REPORT_KEY
+
+BATCH_SIZE = 10_000
+# Incomplete snapshots not written to for this long were left behind by a writer that died, e.g. a killed process
+PENDING_TIMEOUT = 3600.0
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS snapshots (
+    id INTEGER PRIMARY KEY,
+    account TEXT NOT NULL,
+    fetched_at REAL NOT NULL,
+    fieldnames TEXT NOT NULL DEFAULT '[]',
+    row_count INTEGER NOT NULL DEFAULT 0,
+    complete INTEGER NOT NULL DEFAULT 0,
+    updated_at REAL NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS snapshots_account ON snapshots (account, complete, fetched_at);
+CREATE TABLE IF NOT EXISTS rows (
+    snapshot_id INTEGER NOT NULL,
+    sku TEXT,
+    marketplace TEXT,
+    merchant_id TEXT,
+    fba TEXT,
+    data TEXT NOT NULL,
+    PRIMARY KEY (snapshot_id, sku, marketplace, merchant_id, fba)
+) WITHOUT ROWID;
+"""
+
+
+class Snapshot(NamedTuple):
+    id: int
+    account: str
+    fetched_at: float
+    fieldnames: List[str]
+    row_count: int
+
+    @property
+    def age(self) -> float:
+        return time.time() - self.fetched_at
+
+
+class SnapshotWriter:
+    """
+    Adds the rows of a new snapshot in batches, see ReportSnapshotStore.writer.
+    """
+
+    def __init__(
+        self,
+        store: "ReportSnapshotStore",
+        snapshot_id: int,
+        account: str,
+        fetched_at: float,
+        batch_size: int = BATCH_SIZE,
+    ) -> None:
+        self._store = store
+        self.snapshot_id = snapshot_id
+        self._batch_size = batch_size
+        self._batch: List[Tuple] = []
+        self.account = account
+        self.fetched_at = fetched_at
+        self.fieldnames: Optional[List[str]] = None
+        self.row_count = 0
+        self.snapshot: Optional[Snapshot] = None
+
+    def add(self, row: Mapping) -> None:
+        if self.fieldnames is None:
+            self.fieldnames = list(row.keys())
+        values = [row.get(name) for name in self.fieldnames]
+        # Key columns are part of the primary key, missing values are stored as empty strings
+        key = ("" if value is None else value for value in map(row.get, REPORT_KEY))
+        self._batch.append((self.snapshot_id, *key, json.dumps(values)))
+        self.row_count += 1
+        if len(self._batch) >= self._batch_size:
+            self.flush()
+
+    def add_many(self, rows: Iterable[Mapping]) -> None:
+        for row in rows:
+            self.add(row)
+
+    def flush(self) -> None:
+        if self._batch:
+            # A short transaction per batch, other writers only wait for a batch to be inserted
+            with self._store._transaction() as connection:
+                connection.executemany("INSERT OR REPLACE INTO rows VALUES (?, ?, ?, ?, ?, ?)", self._batch)
+                connection.execute("UPDATE snapshots SET updated_at = ? WHERE id = ?", (time.time(), self.snapshot_id))
+            self._batch.clear()
+
+
+class ReportSnapshotStore:
+    """
+    On-disk SQLite store of repricer report snapshots, indexed by (sku, marketplace, merchant_id, fba).
+
+    Rows can be looked up or scanned without loading a report into memory. The database runs in WAL mode, so any
+    number of processes can read the latest complete snapshot while a new one is being written. Each snapshot
+    records its fetch time, so a download can be skipped while the latest one is recent enough.
+
+    ex:
+        store = ReportSnapshotStore("reports.sqlite3")
+        repricers.snapshot_report(store, max_age=600)
+        row = store.get("SKU-1", "amazon", "A1B2C3", "0", account=repricers.snapshot_account)
+
+    Missing key values are stored as empty strings, so such rows are looked up with ``""``.
+    """
+
+    def __init__(self, path: Union[str, "os.PathLike[str]"], keep: int = 2, timeout: float = 30.0) -> None:
+        """
+        :param path: Path of the SQLite database, created if missing.
+        :param keep: Number of complete snapshots kept per account, older ones are deleted.
+        :param timeout: Seconds to wait for a lock held by another connection.
+        """
+        self.path = os.fspath(path)
+        self.keep = keep
+        self.timeout = timeout
+        self._local = threading.local()
+        self._connection.executescript(SCHEMA)
+
+    @property
+    def _connection(self) -> sqlite3.Connection:
+        # SQLite connections can't be shared between threads, each thread gets its own
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+        return connection
+
+    def close(self) -> None:
+        connection = getattr(self._local, "connection", None)
+        if connection is not None:
+            connection.close()
+            self._local.connection = None
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        connection = self._connection
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            yield connection
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        connection.execute("COMMIT")
+
+    @contextmanager
+    def writer(self, account: str, fetched_at: Optional[float] = None) -> Iterator[SnapshotWriter]:
+        """
+        Writes a new snapshot. Rows are inserted in a short transaction per batch, so other writers aren't blocked
+        while a report is downloaded. The snapshot becomes the latest one, ``writer.snapshot``, only once the block
+        exits without an error, readers keep seeing the previous snapshot until then.
+        """
+        writer = self._begin(account, fetched_at)
+        try:
+            yield writer
+        except BaseException:
+            self._abort(writer)
+            raise
+        self._commit(writer)
+
+    def write(self, rows: Iterable[Mapping], account: str, fetched_at: Optional[float] = None) -> Snapshot:
+        with self.writer(account, fetched_at) as writer:
+            writer.add_many(rows)
+        return writer.snapshot  # type: ignore[return-value]
+
+    async def awrite(self, rows: AsyncIterable[Mapping], account: str, fetched_at: Optional[float] = None) -> Snapshot:
+        """
+        Same as ``write`` for an async iterable of rows. The database is written from a worker thread, a batch at a
+        time, so the event loop isn't blocked.
+        """
+        import asyncio
+
+        writer = await asyncio.to_thread(self._begin, account, fetched_at)
+        try:
+            batch: List[Mapping] = []
+            async for row in rows:
+                batch.append(row)
+                if len(batch) >= BATCH_SIZE:
+                    await asyncio.to_thread(writer.add_many, batch)
+                    batch = []
+            await asyncio.to_thread(writer.add_many, batch)
+            return await asyncio.to_thread(self._commit, writer)
+        except BaseException:
+            await asyncio.to_thread(self._abort, writer)
+            raise
+
+    def _begin(self, account: str, fetched_at: Optional[float]) -> SnapshotWriter:
+        now = time.time()
+        fetched_at = now if fetched_at is None else fetched_at
+        with self._transaction() as connection:
+            cursor = connection.execute(
+                "INSERT INTO snapshots (account, fetched_at, updated_at) VALUES (?, ?, ?)", (account, fetched_at, now)
+            )
+        return SnapshotWriter(self, cursor.lastrowid, account, fetched_at)  # type: ignore[arg-type]
+
+    def _commit(self, writer: SnapshotWriter) -> Snapshot:
+        writer.flush()
+        fieldnames = writer.fieldnames or []
+        with self._transaction() as connection:
+            connection.execute(
+                "UPDATE snapshots SET fieldnames = ?, row_count = ?, complete = 1 WHERE id = ?",
+                (json.dumps(fieldnames), writer.row_count, writer.snapshot_id),
+            )
+            self._prune(connection, writer.account)
+        writer.snapshot = Snapshot(writer.snapshot_id, writer.account, writer.fetched_at, fieldnames, writer.row_count)
+        return writer.snapshot
+
+    def _abort(self, writer: SnapshotWriter) -> None:
+        with self._transaction() as connection:
+            connection.execute("DELETE FROM rows WHERE snapshot_id = ?", (writer.snapshot_id,))
+            connection.execute("DELETE FROM snapshots WHERE id = ?", (writer.snapshot_id,))
+
+    def latest(self, account: str) -> Optional[Snapshot]:
+        row = self._connection.execute(
+            "SELECT id, account, fetched_at, fieldnames, row_count FROM snapshots "
+            "WHERE account = ? AND complete = 1 ORDER BY fetched_at DESC, id DESC LIMIT 1",
+            (account,),
+        ).fetchone()
+        if row is None:
+            return None
+        return Snapshot(row[0], row[1], row[2], json.loads(row[3]), row[4])
+
+    def is_fresh(self, account: str, max_age: float) -> bool:
+        snapshot = self.latest(account)
+        return snapshot is not None and snapshot.age < max_age
+
+    def get(self, sku: str, marketplace: str, merchant_id: str, fba: str, account: str) -> Optional[Dict[str, Any]]:
+        """
+        Returns the row of the given key from the latest snapshot, or None.
+        """
+        snapshot = self.latest(account)
+        if snapshot is None:
+            return None
+        row = self._connection.execute(
+            "SELECT data FROM rows WHERE snapshot_id = ? AND sku = ? AND marketplace = ? AND merchant_id = ? "
+            "AND fba = ?",
+            (snapshot.id, sku, marketplace, merchant_id, fba),
+        ).fetchone()
+        return dict(zip(snapshot.fieldnames, json.loads(row[0]))) if row else None
+
+    def scan(
+        self,
+        account: str,
+        start: Optional[Sequence[str]] = None,
+        stop: Optional[Sequence[str]] = None,
+        batch_size: int = BATCH_SIZE,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Yields the rows of the latest snapshot in key order, from key ``start`` (inclusive) to ``stop`` (exclusive).
+        Keys can be partial, e.g. ``start=("SKU-1",), stop=("SKU-2",)`` scans the SKUs from SKU-1 up to SKU-2.
+        """
+        snapshot = self.latest(account)
+        if snapshot is None:
+            return
+        query = "SELECT data FROM rows WHERE snapshot_id = ?"
+        params: List[Any] = [snapshot.id]
+        if start:
+            columns = ", ".join(REPORT_KEY[: len(start)])
+            query += f" AND ({columns}) >= ({', '.join('?' * len(start))})"
+            params.extend(start)
+        if stop:
+            columns = ", ".join(REPORT_KEY[: len(stop)])
+            query += f" AND ({columns}) < ({', '.join('?' * len(stop))})"
+            params.extend(stop)
+        cursor = self._connection.execute(query + f" ORDER BY {', '.join(REPORT_KEY)}", params)
+        while batch := cursor.fetchmany(batch_size):
+            for (data,) in batch:
+                yield dict(zip(snapshot.fieldnames, json.loads(data)))
+
+    def _prune(self, connection: sqlite3.Connection, account: str) -> None:
+        stale = connection.execute(
+            "SELECT id FROM snapshots WHERE account = ? AND (complete = 1 AND id NOT IN ("
+            "SELECT id FROM snapshots WHERE account = ? AND complete = 1 ORDER BY fetched_at DESC, id DESC LIMIT ?"
+            ") OR complete = 0 AND updated_at < ?)",
+            (account, account, self.keep, time.time() - PENDING_TIMEOUT),
+        ).fetchall()
+        for (snapshot_id,) in stale:
+            connection.execute("DELETE FROM rows WHERE snapshot_id = ?", (snapshot_id,))
+            connection.execute("DELETE FROM snapshots WHERE id = ?", (snapshot_id,))
@@ -0,0 +1,180 @@
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+from xsellco_api.common.diff import REPORT_KEY
+from xsellco_api.common.utils import aiter_rows
+from xsellco_api.exceptions import XsellcoValidationError
+
+PRICE_COLUMNS = ("price_min", "price_max")
+FBA_VALUES = frozenset(("0", "1", "true", "false", "yes", "no", True, False))
+MISSING = (None, "")
+MAX_ERRORS = 1000
+
+RowT = TypeVar("RowT", bound=Mapping)
+
+
+class RowError(NamedTuple):
+    """
+    A validation error. Rows are numbered from 1, not counting the header.
+    """
+
+    row: int
+    column: Optional[str]
+    message: str
+
+    def __str__(self) -> str:
+        column = f", column {self.column!r}" if self.column else ""
+        return f"Row {self.row}{column}: {self.message}"
+
+
+class ReportValidator:
+    """
+    Validates report rows in a single streaming pass: required columns and values, ``fba`` booleans, numeric price
+    columns within ``min_price`` and ``max_price``, ``price_min`` not above ``price_max``, and duplicate
+    (sku, marketplace, merchant_id, fba) keys. Empty values of the other columns are allowed.
+
+    Errors are collected in ``errors`` until ``max_errors`` is reached. A validator keeps the keys it has seen, so it
+    is reset (or a new one is used) for every dataset.
+
+    ex:
+        validator = ReportValidator()
+        for error in validator.validate(rows):
+            print(error)
+    """
+
+    def __init__(
+        self,
+        required_columns: Sequence[str] = REPORT_KEY,
+        price_columns: Sequence[str] = PRICE_COLUMNS,
+        min_price: Optional[float] = 0.0,
+        max_price: Optional[float] = None,
+        key: Sequence[str] = REPORT_KEY,
+        max_errors: int = MAX_ERRORS,
+    ) -> None:
+        self.required_columns = tuple(required_columns)
+        self.price_columns = tuple(price_columns)
+        self.min_price = min_price
+        self.max_price = max_price
+        self.key = tuple(key)
+        self.max_errors = max_errors
+        self._low = float("-inf") if min_price is None else min_price
+        self._high = float("inf") if max_price is None else max_price
+        self.reset()
+
+    def reset(self) -> None:
+        self.errors: List[RowError] = []
+        self.row_count = 0
+        self._keys: Set[Tuple] = set()
+
+    @property
+    def is_full(self) -> bool:
+        return len(self.errors) >= self.max_errors
+
+    def check(self, row: Mapping) -> bool:
+        """
+        Validates the next row, returns whether it's valid.
+        """
+        self.row_count += 1
+        number = self.row_count
+        errors = self.errors
+        error_count = len(errors)
+        get = row.get
+
+        for column in self.required_columns:
+            if get(column) in MISSING:
+                errors.append(RowError(number, column, "missing required value"))
+
+        fba = get("fba")
+        if fba not in FBA_VALUES and fba not in MISSING and str(fba).lower() not in FBA_VALUES:
+            errors.append(RowError(number, "fba", f"not a boolean: {fba!r}"))
+
+        price_min = price_max = None
+        for column in self.price_columns:
+            value = get(column)
+            if value is None or value == "":
+                continue
+            try:
+                price = float(value)
+            except (TypeError, ValueError):
+                errors.append(RowError(number, column, f"not a number: {value!r}"))
+                continue
+            if not self._low <= price <= self._high:
+                errors.append(RowError(number, column, self._get_range_error(value, price)))
+            elif column == "price_min":
+                price_min = price
+            elif column == "price_max":
+                price_max = price
+        if price_min is not None and price_max is not None and price_min > price_max:
+            errors.append(RowError(number, "price_min", "price_min is above price_max"))
+
+        row_key = tuple(map(get, self.key))
+        keys = self._keys
+        if row_key in keys:
+            errors.append(RowError(number, None, f"duplicate key {row_key!r}"))
+        else:
+            keys.add(row_key)
+
+        if len(errors) == error_count:
+            return True
+        while len(errors) > self.max_errors:
+            errors.pop()
+        return False
+
+    def _get_range_error(self, value: Any, price: float) -> str:
+        if price != price:
+            return "not a number: nan"
+        if price < self._low:
+            return f"{value!r} is below {self.min_price}"
+        return f"{value!r} is above {self.max_price}"
+
+    def validate(self, rows: Iterable[Mapping]) -> List[RowError]:
+        """
+        Validates all the rows, stopping early once ``max_errors`` is reached, and returns the errors.
+        """
+        for row in rows:
+            self.check(row)
+            if self.is_full:
+                break
+        return self.errors
+
+    def raise_for_errors(self) -> None:
+        if self.errors:
+            more = f" (showing the first {self.max_errors})" if self.is_full else ""
+            raise XsellcoValidationError(
+                f"{len(self.errors)} validation errors in {self.row_count} rows{more}, first: {self.errors[0]}",
+                list(self.errors),
+            )
+
+    def iter_rows(self, rows: Iterable[RowT]) -> Iterator[RowT]:
+        """
+        Yields the rows while validating them, e.g. while they're streamed to the server. XsellcoValidationError is
+        raised once ``max_errors`` is reached or, if there were errors, after the last row.
+        """
+        for row in rows:
+            self.check(row)
+            if self.is_full:
+                self.raise_for_errors()
+            yield row
+        self.raise_for_errors()
+
+    async def aiter_rows(self, rows: Union[Iterable[RowT], AsyncIterable[RowT]]) -> AsyncIterator[RowT]:
+        async for row in aiter_rows(rows):
+            self.check(row)
+            if self.is_full:
+                self.raise_for_errors()
+            yield row
+        self.raise_for_errors()
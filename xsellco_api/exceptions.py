@@ -1,3 +1,9 @@
+from typing import TYPE_CHECKING, List, Optional
+
+if TYPE_CHECKING:
+    from xsellco_api.common.validation import RowError
+
+
 class XsellcoAPIError(Exception):
     """Base exception for xsellco API errors."""
 
@@ -26,3 +32,11 @@ class XsellcoServerError(XsellcoAPIError):
     """Raised when the Xsellco API returns a 500 Internal Server Error."""
 
     pass
+
+
+class XsellcoValidationError(XsellcoAPIError, ValueError):
+    """Raised when report rows fail validation before they are uploaded."""
+
+    def __init__(self, message: str, errors: Optional[List["RowError"]] = None) -> None:
+        super().__init__(message)
+        self.errors = errors or []
@@ -1,4 +1,20 @@
-from .channels import Channels
-from .client import SyncClient
-from .repricers import Repricers
-from .users import Users
+from typing import TYPE_CHECKING
+
+from xsellco_api.common.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .channels import Channels
+    from .client import SyncClient
+    from .repricers import Repricers
+    from .session import Session
+    from .users import Users
+
+_EXPORTS = {
+    "Channels": ".channels",
+    "Repricers": ".repricers",
+    "Session": ".session",
+    "SyncClient": ".client",
+    "Users": ".users",
+}
+__all__ = list(_EXPORTS)
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
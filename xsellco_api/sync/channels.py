@@ -1,7 +1,9 @@
 from __future__ import annotations
 
-from typing import Any, Dict
+from typing import Any, Dict, Iterable, Iterator
 
+from xsellco_api.common.bulk import MAX_WORKERS, BulkResult, fetch_many
+from xsellco_api.common.pagination import PAGE_LIMIT, iter_pages
 from xsellco_api.sync.client import SyncClient
 
 
@@ -9,7 +11,7 @@ class Channels(SyncClient):
     endpoint = "channels"
 
     def get_channel(self, channel_id: int):
-        return self._request("GET", f"{self.endpoint}/{channel_id}").json()
+        return self._get_json(f"{self.endpoint}/{channel_id}")
 
     def get_channels(
         self, channel_type: str | None = None, channel_country: str | None = None, page: int = 1, page_limit: int = 100
@@ -20,3 +22,26 @@ class Channels(SyncClient):
         if channel_country:
             params.update({"channel_country": channel_country})
         return self._request("GET", endpoint=self.endpoint, params=params).json()
+
+    def iter_channels(
+        self,
+        channel_type: str | None = None,
+        channel_country: str | None = None,
+        page_limit: int = PAGE_LIMIT,
+        max_pages: int | None = None,
+    ) -> Iterator[Dict]:
+        """
+        Iterates over the channels of all pages, a page is requested only when the previous one is used up.
+        """
+        return iter_pages(
+            lambda page: self.get_channels(channel_type, channel_country, page=page, page_limit=page_limit),
+            page_limit=page_limit,
+            max_pages=max_pages,
+        )
+
+    def get_channels_by_ids(self, channel_ids: Iterable[int], max_workers: int = MAX_WORKERS) -> BulkResult:
+        """
+        Fetches the channels of the given (deduplicated) ids over a thread pool.
+        Returns the channels by id and, separately, the API errors of the ids that failed.
+        """
+        return fetch_many(self.get_channel, channel_ids, max_workers=max_workers)
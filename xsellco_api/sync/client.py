@@ -1,12 +1,19 @@
 from __future__ import annotations
 
+import json
 import logging
-from typing import Optional, Union
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Union
 
 import httpx
 
 from xsellco_api.common.base import BaseClient
+from xsellco_api.common.bulk import MAX_WORKERS, map_requests
+from xsellco_api.common.compression import iter_response_text
 from xsellco_api.exceptions import XsellcoAPIError
+from xsellco_api.sync.session import Session
 
 logger = logging.getLogger(__name__)
 
@@ -16,10 +23,25 @@ class SyncClient(BaseClient):
     Base Class for Xsellco's API using httpx for synchronous requests.
     """
 
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        if self._session is not None and not isinstance(self._session, Session):
+            raise TypeError(f"{type(self).__name__} needs a Session, got {type(self._session).__name__}.")
+        # A client can be shared by threads, they must not create an httpx.Client each
+        self._client_lock = threading.Lock()
+
     def _get_client(self):
-        if self._client is None:
-            self._client = httpx.Client(base_url=self.url, headers=self.headers, auth=(self.user_name, self.password))
-        return self._client
+        if self._session is not None:
+            return self._session.get_client(self.url)
+        client = self._client
+        if client is None:
+            with self._client_lock:
+                if self._client is None:
+                    self._client = httpx.Client(
+                        base_url=self.url, headers=self.headers, auth=(self.user_name, self.password)
+                    )
+                client = self._client
+        return client
 
     def __enter__(self):
         # Initialize the httpx.Client instance when entering the context
@@ -27,14 +49,40 @@ class SyncClient(BaseClient):
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        if self._client:
-            self._client.close()
-            self._client = None
+        self.close()
 
     def close(self):
-        if self._client:
-            self._client.close()
-            self._client = None
+        with self._client_lock:
+            if self._client:
+                self._client.close()
+                self._client = None
+
+    def map_requests(
+        self, fn: Callable[[Any], Any], args: Iterable[Any], max_workers: int = MAX_WORKERS, return_exceptions=False
+    ) -> List[Any]:
+        """
+        Calls ``fn``, e.g. one of this client's methods, with each of ``args`` over a thread pool and returns the
+        results in order. All the threads share this client's connection pool.
+        ex: channels.map_requests(channels.get_channel, [1, 2, 3])
+
+        :param return_exceptions: Return API errors in place of the results of the calls that failed instead of
+            raising the first one.
+        """
+        return map_requests(fn, args, max_workers=max_workers, return_exceptions=return_exceptions)
+
+    def _get_json(self, endpoint: str) -> Any:
+        """
+        GET the JSON of an endpoint, served from the response cache if there's one.
+        """
+        if self.cache is None:
+            return self._request("GET", endpoint).json()
+
+        key = self._get_cache_key(endpoint)
+        entry = self.cache.get(key)
+        if entry is not None and entry.is_fresh:
+            return json.loads(entry.content)
+        response = self._request("GET", endpoint, headers=entry.conditional_headers if entry else None)
+        return self._cache_response(key, endpoint, entry, response)
 
     def _request(
         self,
@@ -44,25 +92,113 @@ class SyncClient(BaseClient):
         params: Optional[dict] = None,
         headers: Optional[dict] = None,
         timeout: Optional[Union[float, int]] = None,
+        content=None,
     ) -> httpx.Response:
         try:
-            client = self._get_client()
             data = data or {}
-            params = params or {}
-            # Correctly constructing the URL using the base URL and the endpoint
-            all_headers = {**self.headers, **(headers or {})}
 
-            if isinstance(data, bytes):
+            if content is not None:
+                # Bytes or a (async) byte iterator which httpx streams to the server
+                request_args = {"content": content}
+            elif isinstance(data, bytes):
                 # If data is bytes, use the content parameter
                 request_args = {"content": data}
             else:
                 # For non-bytes data, use the json parameter if applicable
                 request_args = {"data": data} if data and method in ("POST", "PUT", "PATCH") else {}
-            response = client.request(
-                method, f"{endpoint}".rstrip("/"), params=params, headers=all_headers, timeout=timeout, **request_args
-            )
+            response = self._send(method, endpoint, params=params, headers=headers, timeout=timeout, **request_args)
             return self._process_response(response)
         except httpx.RequestError as req_err:
             # Handle request errors (e.g., network issues)
             logger.exception(f"Request Exception: {req_err}")
             raise XsellcoAPIError(f"Request Exception: {req_err}") from req_err
+
+    @contextmanager
+    def _stream(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[dict] = None,
+        headers: Optional[dict] = None,
+        timeout: Optional[Union[float, int]] = None,
+    ) -> Iterator[httpx.Response]:
+        """
+        Make a streaming request to xsellco's API. The response body is not read until it's iterated over.
+        """
+        try:
+            response = self._send(method, endpoint, params=params, headers=headers, timeout=timeout, stream=True)
+            error = None
+            try:
+                if response.is_error:
+                    # Error messages need the body
+                    response.read()
+                yield self._process_response(response)
+            except httpx.HTTPError as err:
+                # Reading the body failed, error statuses are reported as such
+                error = err
+                raise
+            finally:
+                response.close()
+                self._emit_event(response.request, response, error)
+        except httpx.RequestError as req_err:
+            logger.exception(f"Request Exception: {req_err}")
+            raise XsellcoAPIError(f"Request Exception: {req_err}") from req_err
+
+    def _iter_text(self, response: httpx.Response) -> Iterator[str]:
+        """
+        Decodes a streamed response body, recording the bytes received in ``compression_stats``.
+        """
+        return iter_response_text(response, self.compression_stats)
+
+    def _send(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[dict] = None,
+        headers: Optional[dict] = None,
+        timeout: Optional[Union[float, int]] = None,
+        stream: bool = False,
+        follow_redirects: bool = False,
+        **request_args,
+    ) -> httpx.Response:
+        """
+        Send a request, retrying it as the retry policy allows. The response status is left to the caller.
+        """
+        client = self._get_client()
+        request = client.build_request(
+            method,
+            f"{endpoint}".rstrip("/"),
+            params=params or {},
+            headers={**self.headers, **(headers or {})},
+            timeout=timeout,
+            **request_args,
+        )
+        # A streamed body can't be sent twice
+        replayable = isinstance(request.stream, httpx.ByteStream)
+        timer = self._start_timer(request, endpoint)
+        attempt, waited = 0, 0.0
+        try:
+            while True:
+                if self.rate_limiter is not None:
+                    self.rate_limiter.acquire(request.url.host)
+                try:
+                    response = client.send(request, auth=self.auth, stream=stream, follow_redirects=follow_redirects)
+                except httpx.TransportError:
+                    delay = self._get_retry_delay(request, attempt, waited) if replayable else None
+                    if delay is None:
+                        raise
+                else:
+                    delay = self._get_retry_delay(request, attempt, waited, response) if replayable else None
+                    if delay is None:
+                        if timer is not None and not stream:
+                            self._emit_event(request, response)
+                        return response
+                    response.close()
+                time.sleep(delay)
+                attempt += 1
+                waited += delay
+                if timer is not None:
+                    timer.retry()
+        except Exception as err:
+            self._emit_event(request, exception=err)
+            raise
@@ -1,10 +1,46 @@
+from __future__ import annotations
+
 import csv
 import logging
-from typing import Any, Dict, List, Optional
+import os
+from http import HTTPStatus
+from typing import (
+    IO,
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Union,
+)
+
+import httpx
 
-from xsellco_api.common.utils import generate_csv_bytes_from_data, validate_data_headers
+from xsellco_api.common.columnar import read_columnar_report
+from xsellco_api.common.compression import compress_body
+from xsellco_api.common.diff import diff_reports
+from xsellco_api.common.download import ReportDownload, ReportFileWriter
+from xsellco_api.common.report import ReportDecoder, RepricerReport, check_report_format
+from xsellco_api.common.report_cache import read_report
+from xsellco_api.common.utils import (
+    CSVStreamDecoder,
+    generate_csv_bytes_from_data,
+    generate_csv_bytes_parallel,
+    iter_csv_bytes_from_data,
+    iter_file_chunks,
+    peek_first_row,
+    validate_data_headers,
+)
+from xsellco_api.common.validation import ReportValidator
 from xsellco_api.sync.client import SyncClient
 
+if TYPE_CHECKING:
+    from xsellco_api.common.report_cache import ReportCache
+    from xsellco_api.common.snapshot import ReportSnapshotStore, Snapshot
+
 logger = logging.getLogger(__name__)
 
 
@@ -13,19 +49,117 @@ class Repricers(SyncClient):
     endpoint = "repricers"
 
     REQUIRED_HEADERS = ["sku", "marketplace", "merchant_id", "fba"]
+    # Lists of rows longer than this are encoded across a process pool, e.g. 500_000. Off by default, as the pool
+    # needs several CPUs to pay off and an ``if __name__ == "__main__":`` guard on Windows and macOS.
+    parallel_csv_threshold: Optional[int] = None
 
-    def get_report(self) -> List[Dict]:
+    def get_report(
+        self, format: str = "dicts", cache: Optional[ReportCache] = None
+    ) -> Union[List[Dict], RepricerReport, Any]:
         """
         Retrieves a repricer report.
         https://developers.repricer.com/reference/get-a-repricer-file
+
+        :param format: "dicts" for a list of row dictionaries, "report" for a column-oriented RepricerReport,
+            or "arrow", "pandas", "numpy" for a pyarrow Table, a pandas DataFrame or a dictionary of numpy arrays
+            with typed numeric columns. Those need the respective optional package, parsing is done by pyarrow
+            when it's installed and by the stdlib csv module otherwise.
+        :param cache: ReportCache keeping the last download on disk. The report is then requested conditionally and
+            read from the cached copy when it hasn't changed.
         """
+        check_report_format(format)
+        if cache is not None:
+            return read_report(self._get_cached_report_body(cache), format)
+        if format == "dicts":
+            return list(self.iter_report())
+        if format == "report":
+            decoder = ReportDecoder()
+            with self._stream("GET", self.endpoint) as response:
+                for chunk in self._iter_text(response):
+                    decoder.decode(chunk)
+            return decoder.flush()
         response = self._request("GET", self.endpoint)
-        reader = csv.DictReader((line for line in response.text.splitlines()), delimiter=",")
-        return [dict(e) for e in reader]
+        self.compression_stats.record_download(response.num_bytes_downloaded, len(response.content))
+        return read_columnar_report(response.content, format)
+
+    def _get_cached_report_body(self, cache: ReportCache) -> bytes:
+        """
+        Downloads the report body unless the server answers that the cached one is still current.
+        """
+        key = self.snapshot_account
+        cached = cache.get(key)
+        response = self._request("GET", self.endpoint, headers=cached.conditional_headers if cached else None)
+        if response.status_code == HTTPStatus.NOT_MODIFIED and cached is not None:
+            logger.debug("Report not modified, reading the cached copy.")
+            return cache.revalidate(key, cached, response).body
+        self.compression_stats.record_download(response.num_bytes_downloaded, len(response.content))
+        cache.set(key, response)
+        return response.content
+
+    def iter_report(self) -> Iterator[Dict]:
+        """
+        Streams a repricer report, yielding one row at a time without loading the whole file into memory.
+        https://developers.repricer.com/reference/get-a-repricer-file
+        """
+        decoder = CSVStreamDecoder()
+        with self._stream("GET", self.endpoint) as response:
+            for chunk in self._iter_text(response):
+                yield from decoder.decode(chunk)
+        yield from decoder.flush()
+
+    def download_report(
+        self, path_or_fileobj: Union[str, os.PathLike, IO[bytes]], compression: Optional[str] = None
+    ) -> ReportDownload:
+        """
+        Streams a repricer report to a file as it's received, without decoding or parsing it.
+        https://developers.repricer.com/reference/get-a-repricer-file
+
+        :param path_or_fileobj: Path of the file to create, or a binary file object to write to. A file created from
+            a path is removed when the download fails.
+        :param compression: Compress the file with "gzip", or "zstd" and "br" when the zstandard or brotli package is
+            installed.
+        :return: ReportDownload with the size and sha256 of the report, and the number of bytes written.
+        """
+        with ReportFileWriter(path_or_fileobj, compression) as writer:
+            with self._stream("GET", self.endpoint) as response:
+                for chunk in response.iter_bytes():
+                    writer.write(chunk)
+                self.compression_stats.record_download(response.num_bytes_downloaded, writer.size)
+            return writer.close()
+
+    def snapshot_report(self, store: ReportSnapshotStore, max_age: Optional[float] = None) -> Snapshot:
+        """
+        Streams a repricer report into a ReportSnapshotStore and returns the new snapshot.
+        With ``max_age``, the download is skipped while the latest snapshot is younger than that many seconds.
+        """
+        account = self.snapshot_account
+        if max_age is not None:
+            snapshot = store.latest(account)
+            if snapshot is not None and snapshot.age < max_age:
+                logger.debug(f"Reusing report snapshot {snapshot.id} fetched {snapshot.age:.0f}s ago.")
+                return snapshot
+        return store.write(self.iter_report(), account)
 
-    def upload_report(self, data: Optional[List[Dict]] = None, file_path: Optional[str] = None) -> Dict[str, Any]:
+    @property
+    def snapshot_account(self) -> str:
+        return f"{self.user_name}@{self.HOST}"
+
+    def upload_report(
+        self,
+        data: Optional[Union[Iterable[Dict], RepricerReport]] = None,
+        file_path: Optional[str] = None,
+        baseline: Optional[Iterable[Mapping]] = None,
+        validate: Union[bool, ReportValidator] = False,
+    ) -> Dict[str, Any]:
         """
         Uploads a repricer report.
+        ``data`` can be a RepricerReport, a list or any iterable of rows, e.g. a DB cursor. Rows from an iterable
+        that isn't a list are encoded lazily and streamed to the server, so they are never held in memory all at once.
+        With a ``baseline``, e.g. the report as last downloaded, only the rows of ``data`` that were added or changed
+        since are uploaded. Nothing is sent when there are none, and an empty dictionary is returned.
+        With ``validate``, True or a configured ReportValidator, every row is validated and XsellcoValidationError
+        is raised with the errors of all invalid rows. Lists, reports and files are validated before anything is sent,
+        streamed rows while they are encoded, so an invalid row aborts the upload.
         https://developers.repricer.com/reference/upload-a-repricer-file
         """
         if not data and not file_path:
@@ -34,23 +168,82 @@ class Repricers(SyncClient):
         if data and file_path:
             raise ValueError("Both 'data' and 'file_path' were provided. Please provide only one.")
 
-        headers = {"content-type": "text/plain"}
+        if baseline is not None:
+            if file_path or data is None:
+                raise ValueError("'baseline' can only be used with 'data'.")
+            delta = self._get_delta(data, baseline)
+            if not delta:
+                return {}
+            data = delta
 
-        _bytes: bytes = b""
+        headers = {"content-type": "text/plain"}
 
         try:
-            if data:
+            if validate:
+                data = self._validate(data, file_path, validate)
+
+            if isinstance(data, RepricerReport):
+                validate_data_headers([data[0]], self.REQUIRED_HEADERS)
+                response = self._post_report(data.to_csv_bytes(), headers)
+            elif isinstance(data, list):
                 validate_data_headers(data, self.REQUIRED_HEADERS)
-                _bytes = generate_csv_bytes_from_data(data)
-            elif file_path:
+                response = self._post_report(self._encode_rows(data), headers)
+            elif data:
+                first_row, rows = peek_first_row(data)
+                validate_data_headers([first_row], self.REQUIRED_HEADERS)
+                response = self._post_report(iter_csv_bytes_from_data(rows), headers)
+            else:
                 # When we're using file path, we don't validate headers. We assume the file is valid.
-                with open(file_path, "rb") as file:
-                    _bytes = file.read()
-
-            response = self._request("POST", self.endpoint, data=_bytes, headers=headers)
+                # The file is streamed in chunks, a known content-length keeps the upload from being chunk-encoded.
+                with open(file_path, "rb") as file:  # type: ignore[arg-type]
+                    headers["content-length"] = str(os.fstat(file.fileno()).st_size)
+                    response = self._post_report(iter_file_chunks(file), headers)
 
             return response.json()
 
         except (ValueError, FileNotFoundError) as known_ex:
             logger.exception(f"Known exception occurred: {known_ex}", exc_info=False)
             raise
+
+    def _validate(
+        self,
+        data: Optional[Union[Iterable[Dict], RepricerReport]],
+        file_path: Optional[str],
+        validate: Union[bool, ReportValidator],
+    ) -> Optional[Union[Iterable[Dict], RepricerReport]]:
+        """
+        Validates the rows to upload, or wraps an iterable of them to be validated while they are streamed.
+        """
+        validator = validate if isinstance(validate, ReportValidator) else ReportValidator(self.REQUIRED_HEADERS)
+        validator.reset()
+        if isinstance(data, (list, RepricerReport)):
+            validator.validate(data)
+        elif data:
+            return validator.iter_rows(data)
+        else:
+            with open(file_path, newline="", encoding="utf-8") as file:  # type: ignore[arg-type]
+                validator.validate(csv.DictReader(file))
+        validator.raise_for_errors()
+        return data
+
+    def _post_report(self, content: Union[bytes, Iterable[bytes]], headers: Dict[str, str]) -> httpx.Response:
+        if self.compression is not None:
+            # The compressed size isn't known up front
+            headers = {key: value for key, value in headers.items() if key != "content-length"}
+            headers["content-encoding"] = self.compression
+            content = compress_body(content, self.compression, self.compression_stats)
+        return self._request("POST", self.endpoint, content=content, headers=headers)
+
+    def _encode_rows(self, data: List[Dict]) -> bytes:
+        if self.parallel_csv_threshold is not None and len(data) > self.parallel_csv_threshold:
+            return generate_csv_bytes_parallel(data)
+        return generate_csv_bytes_from_data(data)
+
+    @staticmethod
+    def _get_delta(data: Iterable[Mapping], baseline: Iterable[Mapping]) -> List[Dict]:
+        diff = diff_reports(baseline, data)
+        logger.info(
+            f"Uploading {len(diff.added)} added and {len(diff.changed)} changed rows, "
+            f"{len(diff.removed)} rows were removed since the baseline."
+        )
+        return [dict(row) for row in diff.delta]
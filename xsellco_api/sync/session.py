@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import logging
+import threading
+
+import httpx
+
+from xsellco_api.common.session import BaseSession
+
+logger = logging.getLogger(__name__)
+
+
+class Session(BaseSession[httpx.Client]):
+    """
+    Connection pools shared by any number of sync resource classes.
+
+    ex:
+        with Session(keepalive_expiry=30) as session:
+            repricers = Repricers(user_name, password, session=session)
+            channels = Channels(user_name, password, session=session)
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._lock = threading.Lock()
+
+    def get_client(self, base_url: str) -> httpx.Client:
+        client = self._clients.get(base_url)
+        if client is None:
+            with self._lock:
+                client = self._clients.get(base_url)
+                if client is None:
+                    client = self._clients[base_url] = httpx.Client(**self._client_kwargs(base_url))
+        return client
+
+    def warmup(self) -> None:
+        """
+        Opens a connection to each host, so the first API calls don't pay for the TCP and TLS handshakes.
+        """
+        for host in self.hosts:
+            base_url = self.base_url(host)
+            try:
+                self.get_client(base_url).head(base_url)
+            except httpx.HTTPError as err:
+                logger.warning(f"Warmup of {host} failed: {err}")
+
+    def __enter__(self):
+        if self.warmup_on_enter:
+            self.warmup()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self) -> None:
+        with self._lock:
+            clients, self._clients = list(self._clients.values()), {}
+        for client in clients:
+            client.close()
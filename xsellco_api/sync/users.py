@@ -1,3 +1,7 @@
+from typing import Dict, Iterable, Iterator, Optional
+
+from xsellco_api.common.bulk import MAX_WORKERS, BulkResult, fetch_many
+from xsellco_api.common.pagination import PAGE_LIMIT, iter_pages
 from xsellco_api.sync.client import SyncClient
 
 
@@ -5,8 +9,23 @@ class Users(SyncClient):
     endpoint = "users"
 
     def get_user(self, user_id: int):
-        return self._request("GET", f"{self.endpoint}/{user_id}").json()
+        return self._get_json(f"{self.endpoint}/{user_id}")
 
     def get_users(self, page: int = 1, page_limit: int = 100):
         params = {"page_limit": page_limit, "page": page}
         return self._request("GET", endpoint=self.endpoint, params=params).json()
+
+    def iter_users(self, page_limit: int = PAGE_LIMIT, max_pages: Optional[int] = None) -> Iterator[Dict]:
+        """
+        Iterates over the users of all pages, a page is requested only when the previous one is used up.
+        """
+        return iter_pages(
+            lambda page: self.get_users(page=page, page_limit=page_limit), page_limit=page_limit, max_pages=max_pages
+        )
+
+    def get_users_by_ids(self, user_ids: Iterable[int], max_workers: int = MAX_WORKERS) -> BulkResult:
+        """
+        Fetches the users of the given (deduplicated) ids over a thread pool.
+        Returns the users by id and, separately, the API errors of the ids that failed.
+        """
+        return fetch_many(self.get_user, user_ids, max_workers=max_workers)